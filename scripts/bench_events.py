@@ -0,0 +1,185 @@
+"""Measure event allocation footprint and bus throughput per million events.
+
+The ring-buffer ``EventBus`` lives here rather than in the library: the
+backtest engines run batched bar loops (netting and risk budgeting act on
+all of a bar's orders at once) and do not dispatch events one by one.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+import pandas as pd
+
+from stat_arb_vol.backtest.events import Event, FillEvent, MarketEvent, OrderEvent, SignalEvent
+
+Handler = Callable[[Any], None]
+
+
+class EventQueue:
+    """FIFO ring buffer over a fixed list of slots.
+
+    ``put``/``get`` never allocate once the buffer is sized; when full the
+    buffer doubles if ``grow`` is set, otherwise ``OverflowError`` is raised.
+    """
+
+    __slots__ = ("_slots", "_head", "_size", "grow")
+
+    def __init__(self, capacity: int = 1024, grow: bool = True) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self._slots: list[Event | None] = [None] * capacity
+        self._head = 0
+        self._size = 0
+        self.grow = grow
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return len(self._slots)
+
+    def put(self, event: Event) -> None:
+        capacity = len(self._slots)
+        if self._size == capacity:
+            if not self.grow:
+                raise OverflowError("event queue is full")
+            self._resize(2 * capacity)
+            capacity = len(self._slots)
+        self._slots[(self._head + self._size) % capacity] = event
+        self._size += 1
+
+    def get(self) -> Event:
+        if self._size == 0:
+            raise IndexError("get from empty event queue")
+        event = self._slots[self._head]
+        self._slots[self._head] = None
+        self._head = (self._head + 1) % len(self._slots)
+        self._size -= 1
+        return event  # type: ignore[return-value]
+
+    def peek(self) -> Event | None:
+        return self._slots[self._head] if self._size else None
+
+    def clear(self) -> None:
+        self._slots = [None] * len(self._slots)
+        self._head = 0
+        self._size = 0
+
+    def _resize(self, capacity: int) -> None:
+        ordered = [self._slots[(self._head + i) % len(self._slots)] for i in range(self._size)]
+        self._slots = ordered + [None] * (capacity - self._size)
+        self._head = 0
+
+
+class EventBus:
+    """Route queued events to handlers registered per event type.
+
+    Handlers may publish follow-up events (market -> signal -> order -> fill);
+    ``dispatch`` drains the queue until it is empty.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self.queue = EventQueue(capacity)
+        self._handlers: dict[type, list[Handler]] = {}
+        self.dispatched = 0
+
+    def subscribe(self, event_type: type, handler: Handler) -> None:
+        self._handlers.setdefault(event_type, []).append(handler)
+
+    def publish(self, event: Event) -> None:
+        self.queue.put(event)
+
+    def dispatch(self) -> int:
+        queue = self.queue
+        handlers = self._handlers
+        count = 0
+        while len(queue):
+            event = queue.get()
+            for handler in handlers.get(type(event), ()):
+                handler(event)
+            count += 1
+        self.dispatched += count
+        return count
+
+
+@dataclass
+class DictOrderEvent:
+    timestamp: object
+    pair: tuple[str, str]
+    side: int
+    quantity: float
+
+
+def measure_allocations(factory, n: int) -> tuple[int, int]:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    events = [factory(i) for i in range(n)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    blocks = sum(s.count_diff for s in stats)
+    size = sum(s.size_diff for s in stats)
+    del events
+    return blocks, size
+
+
+def measure_bus(n: int) -> tuple[float, int]:
+    ts = pd.Timestamp("2024-01-01")
+    pair = ("BTC", "ETH")
+    bus = EventBus(capacity=64)
+    fills = 0
+
+    def on_market(event: MarketEvent) -> None:
+        bus.publish(SignalEvent(event.timestamp, pair, 1, 2.0))
+
+    def on_signal(event: SignalEvent) -> None:
+        bus.publish(OrderEvent(event.timestamp, pair, event.side, 1.0))
+
+    def on_order(event: OrderEvent) -> None:
+        bus.publish(FillEvent(event.timestamp, pair, event.side, event.quantity, (1.0, 1.0), 0.0))
+
+    def on_fill(event: FillEvent) -> None:
+        nonlocal fills
+        fills += 1
+
+    bus.subscribe(MarketEvent, on_market)
+    bus.subscribe(SignalEvent, on_signal)
+    bus.subscribe(OrderEvent, on_order)
+    bus.subscribe(FillEvent, on_fill)
+
+    start = time.perf_counter()
+    for _ in range(n // 4):
+        bus.publish(MarketEvent(ts))
+        bus.dispatch()
+    elapsed = time.perf_counter() - start
+    return bus.dispatched / elapsed, bus.queue.capacity
+
+
+def main(n: int) -> None:
+    ts = pd.Timestamp("2024-01-01")
+    pair = ("BTC", "ETH")
+    scale = 1_000_000 / n
+
+    for name, factory in (
+        ("dataclass (dict)", lambda i: DictOrderEvent(ts, pair, 1, float(i))),
+        ("dataclass (slots, frozen)", lambda i: OrderEvent(ts, pair, 1, float(i))),
+    ):
+        blocks, size = measure_allocations(factory, n)
+        print(f"{name:28s} blocks/1M={blocks * scale:,.0f}  bytes/event={size / n:.1f}")
+
+    rate, capacity = measure_bus(n)
+    print(f"event bus dispatch: {rate:,.0f} events/s (ring capacity stayed at {capacity})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=1_000_000)
+    args = parser.parse_args()
+    main(args.events)
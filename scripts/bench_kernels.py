@@ -0,0 +1,80 @@
+"""Benchmark bars/second of the backtest and rolling-stat kernels (JIT vs NumPy)."""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from stat_arb_vol.config import BacktestConfig
+from stat_arb_vol.kernels import NUMBA_AVAILABLE, hysteresis_path, python_impl, rolling_mean_std, simulate_pair
+
+
+def _timed(fn, *args, repeat: int = 3) -> tuple[float, object]:
+    best = float("inf")
+    out = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, out
+
+
+def main(bars: int) -> None:
+    rng = np.random.default_rng(0)
+    config = BacktestConfig()
+    latent = rng.normal(0, 0.01, bars).cumsum()
+    price_x = 100 * np.exp(latent + rng.normal(0, 0.002, bars).cumsum() * 0.1)
+    price_y = 80 * np.exp(latent + rng.normal(0, 0.002, bars).cumsum() * 0.1)
+    spread = price_x - price_y
+    z = rng.normal(0, 1.5, bars)
+    slippage = rng.uniform(config.slippage_bps_min, config.slippage_bps_max, bars)
+    sim_args = (
+        price_x,
+        price_y,
+        z,
+        1.0,
+        config.entry_z,
+        config.exit_z,
+        config.stop_z,
+        config.latency_bars,
+        config.initial_capital,
+        config.transaction_cost_bps,
+        config.max_drawdown_limit,
+        0.01,
+        0.25,
+        slippage,
+    )
+
+    cases = {
+        "rolling mean/std": (
+            lambda: rolling_mean_std(spread, config.lookback, use_jit=True),
+            lambda: rolling_mean_std(spread, config.lookback, use_jit=False),
+        ),
+        "hysteresis": (
+            lambda: hysteresis_path(z, config.entry_z, config.exit_z, config.stop_z),
+            lambda: python_impl(hysteresis_path)(z, config.entry_z, config.exit_z, config.stop_z),
+        ),
+        "order state machine": (
+            lambda: simulate_pair(*sim_args),
+            lambda: python_impl(simulate_pair)(*sim_args),
+        ),
+    }
+
+    print(f"numba available: {NUMBA_AVAILABLE}; bars={bars:,}")
+    for name, (jit_fn, numpy_fn) in cases.items():
+        numpy_time, _ = _timed(numpy_fn, repeat=1)
+        line = f"{name:22s} numpy={bars / numpy_time:>14,.0f} bars/s"
+        if NUMBA_AVAILABLE:
+            jit_fn()  # compile outside the timed region
+            jit_time, _ = _timed(jit_fn)
+            line += f"  numba={bars / jit_time:>14,.0f} bars/s  speedup={numpy_time / jit_time:6.1f}x"
+        print(line)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bars", type=int, default=1_000_000)
+    args = parser.parse_args()
+    main(args.bars)
@@ -0,0 +1,86 @@
+"""Compare memory, speed and accuracy of float64 vs float32 storage precision."""
+
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from stat_arb_vol.backtest.engine import EventDrivenBacktester
+from stat_arb_vol.config import BacktestConfig
+from stat_arb_vol.data.align import align_prices
+from stat_arb_vol.models.ou import OUModel
+from stat_arb_vol.precision import use_precision
+from stat_arb_vol.strategy.vectorized import hysteresis_positions
+
+
+def simulate_universe(symbols: int, bars: int, seed: int = 0) -> dict[str, pd.Series]:
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2000-01-01", periods=bars, freq="D")
+    latent = rng.normal(0, 0.01, bars).cumsum()
+    out = {}
+    for i in range(symbols):
+        idio = rng.normal(0, 0.004, bars).cumsum()
+        out[f"S{i:03d}"] = pd.Series(100 * np.exp(0.9 * latent + idio), index=index)
+    return out
+
+
+def pipeline(series: dict[str, pd.Series], pairs: int, config: BacktestConfig) -> dict[str, object]:
+    panel = align_prices(series, max_gap=3)
+    values = panel.values
+    left, right = values[:, :pairs], values[:, pairs : 2 * pairs]
+    spreads = pd.DataFrame(left - right, index=panel.index)
+    z = OUModel.rolling_zscore(spreads, config.lookback)
+    positions = hysteresis_positions(z.to_numpy(), config.entry_z, config.exit_z, config.stop_z)
+    return {"panel": panel, "z": z, "positions": positions}
+
+
+def measure(name: str, series: dict[str, pd.Series], pairs: int, config: BacktestConfig) -> dict[str, object]:
+    with use_precision(name):
+        pipeline(series, pairs, config)  # warm caches outside the measured run
+        tracemalloc.start()
+        start = time.perf_counter()
+        out = pipeline(series, pairs, config)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        out["elapsed"] = elapsed
+        out["peak_mb"] = peak / 2**20
+        out["stored_mb"] = (out["panel"].values.nbytes + out["z"].memory_usage(index=False).sum()) / 2**20
+
+        frame = out["panel"].frame()
+        np.random.seed(11)
+        out["equity"] = EventDrivenBacktester(frame, ("S000", "S001"), config).run().equity_curve
+    return out
+
+
+def main(symbols: int, bars: int) -> None:
+    config = BacktestConfig()
+    series = simulate_universe(symbols, bars)
+    pairs = symbols // 2
+    results = {name: measure(name, series, pairs, config) for name in ("float64", "float32")}
+
+    print(f"universe: {symbols} symbols x {bars:,} bars, {pairs} spreads")
+    for name, out in results.items():
+        print(
+            f"{name}: stored={out['stored_mb']:8.1f} MB  peak={out['peak_mb']:8.1f} MB  time={out['elapsed']:6.3f}s"
+        )
+    wide, narrow = results["float64"], results["float32"]
+    print(f"memory ratio (stored): {narrow['stored_mb'] / wide['stored_mb']:.2f}")
+    print(f"speedup: {wide['elapsed'] / narrow['elapsed']:.2f}x")
+    z_err = np.abs(wide["z"].to_numpy() - narrow["z"].to_numpy().astype(np.float64))
+    print(f"max |z64 - z32|: {z_err.max():.2e}  (median {np.median(z_err):.2e})")
+    print(f"positions differing: {np.mean(wide['positions'] != narrow['positions']):.4%} of bar x spread cells")
+    rel = np.abs(wide["equity"] / narrow["equity"] - 1).max()
+    print(f"single-pair backtest equity max relative difference: {rel:.2e}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--symbols", type=int, default=200)
+    parser.add_argument("--bars", type=int, default=5_000)
+    args = parser.parse_args()
+    main(args.symbols, args.bars)
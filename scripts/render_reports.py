@@ -0,0 +1,64 @@
+"""Render chart + markdown reports for many runs at once (from the run registry or synthetic curves)."""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from stat_arb_vol.analytics.metrics import compute_metrics
+from stat_arb_vol.analytics.report import ReportJob, render_reports
+from stat_arb_vol.analytics.runs import METRIC_COLUMNS, RunStore
+
+
+def store_jobs(path: str, limit: int, order_by: str) -> list[ReportJob]:
+    store = RunStore(path)
+    runs = store.query(order_by=order_by, limit=limit)
+    jobs = []
+    for run in runs.itertuples(index=False):
+        metrics = {name: getattr(run, column) for name, column in METRIC_COLUMNS.items()}
+        curve = store.curve(int(run.run_id))
+        jobs.append(ReportJob.from_series(f"run_{run.run_id}", tuple(run.pair.split("/")), metrics, curve["equity"]))
+    store.close()
+    return jobs
+
+
+def synthetic_jobs(count: int, bars: int = 1_500, seed: int = 0) -> list[ReportJob]:
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2020-01-01", periods=bars, freq="D")
+    jobs = []
+    for k in range(count):
+        equity = pd.Series(100_000 * np.exp(rng.normal(0.0002, 0.01, bars).cumsum()), index=index)
+        metrics = compute_metrics(equity, [], annualization=252)
+        jobs.append(ReportJob.from_series(f"synthetic_{k:04d}", ("X", "Y"), metrics, equity))
+    return jobs
+
+
+def main(source: str, out: str, fmt: str, workers: int | None, limit: int, order_by: str, compare: bool) -> None:
+    jobs = synthetic_jobs(limit) if source == "synthetic" else store_jobs(source, limit, order_by)
+    if not jobs:
+        print(f"no runs found in {source}")
+        return
+    modes = [("png", 1), ("png", workers), ("svg", workers)] if compare else [(fmt, workers)]
+    for mode, n in modes:
+        start = time.perf_counter()
+        summary = render_reports(jobs, out, fmt=mode, workers=n)
+        elapsed = time.perf_counter() - start
+        per_run = elapsed / len(summary) * 1e3
+        print(f"{len(summary)} reports fmt={mode} workers={n or 'auto'}: {elapsed:.2f}s ({per_run:.1f} ms/run)")
+    print(f"index: {out}/index.md")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--source", default=".cache/runs.db", help="RunStore path, or 'synthetic'")
+    parser.add_argument("--out", default="reports/runs")
+    parser.add_argument("--format", choices=("svg", "png"), default="svg")
+    parser.add_argument("--workers", type=int, default=None, help="render processes (default: one per CPU)")
+    parser.add_argument("--limit", type=int, default=200)
+    parser.add_argument("--order-by", default="run_id")
+    parser.add_argument("--compare", action="store_true", help="time serial PNG vs pooled PNG vs pooled SVG")
+    args = parser.parse_args()
+    main(args.source, args.out, args.format, args.workers, args.limit, args.order_by, args.compare)
@@ -0,0 +1,39 @@
+"""Inspect a backtest event log: engine state and events around any bar, without rerunning."""
+
+from __future__ import annotations
+
+import argparse
+
+import pandas as pd
+
+from stat_arb_vol.backtest.eventlog import FILL, KIND_NAMES, EventLog
+
+
+def main(path: str, bar: int | None, at: str | None, context: int, kind: str | None) -> None:
+    log = EventLog(path)
+    print(f"{path}: {log.bars} bars, {len(log)} events, pair={'/'.join(log.meta['pair'])} seed={log.meta.get('seed')}")
+    if kind is not None:
+        code = {name: code for code, name in KIND_NAMES.items()}[kind]
+        print(log.frame(code).to_string(index=False))
+        return
+    if bar is None and at is None:
+        fills = log.frame(FILL)
+        print(f"{len(fills)} fills; final equity {log.equity_curve().iloc[-1]:,.2f}")
+        return
+
+    target = bar if bar is not None else log.bar_of(at)
+    print("state:", log.state_at(target))
+    with pd.option_context("display.width", 200, "display.max_columns", 20):
+        print(log.frame(start=max(target - context, 0), end=target + context + 1).to_string(index=False))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("log", help="event log directory written by run_backtest.py --event-log")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--bar", type=int, help="bar number to inspect")
+    group.add_argument("--at", help="timestamp to inspect (last bar at or before it)")
+    group.add_argument("--kind", choices=sorted(KIND_NAMES.values()), help="list every event of one kind")
+    parser.add_argument("--context", type=int, default=2, help="bars of events shown around the target")
+    args = parser.parse_args()
+    main(args.log, args.bar, args.at, args.context, args.kind)
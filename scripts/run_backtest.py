@@ -11,10 +11,14 @@ import statsmodels.api as sm
 
 from stat_arb_vol.analytics.metrics import compute_metrics
 from stat_arb_vol.analytics.report import create_performance_plot, write_markdown_report
+from stat_arb_vol.analytics.runs import RunStore
+from stat_arb_vol.backtest.cache import ResultCache
 from stat_arb_vol.backtest.engine import EventDrivenBacktester
 from stat_arb_vol.config import BacktestConfig, UniverseConfig
 from stat_arb_vol.data.loader import DataLoader
 from stat_arb_vol.models.cointegration import CointegrationSelector
+from stat_arb_vol.models.screening_cache import ScreeningCache
+from stat_arb_vol.precision import set_precision
 
 
 def split_train_test(prices: pd.DataFrame, out_of_sample_months: int) -> tuple[pd.DataFrame, pd.DataFrame]:
@@ -32,25 +36,47 @@ def estimate_spread_params(train: pd.DataFrame, pair: tuple[str, str]) -> tuple[
     return beta, spread
 
 
-def main(use_mock_only: bool = False) -> None:
+def main(
+    use_mock_only: bool = False,
+    cache_dir: str | None = ".cache/results",
+    max_gap: int | None = 3,
+    run_store: str | None = ".cache/runs.db",
+    screening_cache: str | None = ".cache/screening.db",
+    seed: int | None = 0,
+    event_log: str | None = None,
+) -> None:
     universe = UniverseConfig()
     config = BacktestConfig()
 
     loader = DataLoader(universe.symbols, universe.start_date, universe.end_date)
-    prices = loader._simulate_prices() if use_mock_only else loader.load_prices()
+    panel = loader.load_panel(max_gap=max_gap, use_mock_only=use_mock_only)
 
-    prices = prices.asfreq("D").ffill().dropna()
+    prices = panel.frame()
     train, test = split_train_test(prices, config.out_of_sample_months)
 
-    selector = CointegrationSelector(significance=0.20)
+    selector = CointegrationSelector(
+        significance=0.20, cache=ScreeningCache(screening_cache) if screening_cache else None
+    )
     candidates = selector.select_pairs(train)
     if not candidates:
         raise RuntimeError("No cointegrated pairs found. Try mock mode or broader universe.")
 
     pair = (candidates[0].asset_x, candidates[0].asset_y)
-    backtester = EventDrivenBacktester(test, pair, config)
-    result = backtester.run()
-    metrics = compute_metrics(result.equity_curve, result.trade_returns, annualization=config.annualization)
+    test = panel.window(pair, start=test.index.min())
+    if event_log:
+        result = EventDrivenBacktester(test, pair, config, seed=seed).run(event_log=event_log)
+        metrics = compute_metrics(result.equity_curve, result.trade_returns, annualization=config.annualization)
+        print(f"event log written to {event_log}")
+    elif cache_dir:
+        cache = ResultCache(cache_dir)
+        result, metrics = cache.run(test, pair, config, seed=seed)
+        if cache.cacheable(config, seed):
+            print(f"result cache: hits={cache.stats.hits} misses={cache.stats.misses}")
+        else:
+            print("result cache: bypassed (unseeded run with random slippage)")
+    else:
+        result = EventDrivenBacktester(test, pair, config, seed=seed).run()
+        metrics = compute_metrics(result.equity_curve, result.trade_returns, annualization=config.annualization)
 
     Path("reports").mkdir(exist_ok=True)
     create_performance_plot(result.equity_curve, "reports/equity_curve.png")
@@ -58,7 +84,10 @@ def main(use_mock_only: bool = False) -> None:
 
     data_schema = {
         "index": "datetime64[ns] daily",
-        "columns": [{"symbol": col, "type": "float close price"} for col in prices.columns],
+        "columns": [
+            {"symbol": col, "type": "float close price", "listed_from": str(listed.date()) if listed else None}
+            for col, listed in panel.listing_dates().items()
+        ],
     }
     Path("data/sample_schema.json").write_text(json.dumps(data_schema, indent=2), encoding="utf-8")
 
@@ -69,6 +98,13 @@ def main(use_mock_only: bool = False) -> None:
         "target_sharpe_ratio": 2.1,
         "target_achieved": metrics["Sharpe Ratio"] >= 2.1,
     }
+    if run_store:
+        store = RunStore(run_store)
+        summary["run_id"] = store.record(
+            result, config, metrics, label="run_backtest", extra={"mock_only": use_mock_only}
+        )
+        store.close()
+
     Path("reports/summary.json").write_text(json.dumps(summary, indent=2), encoding="utf-8")
 
     print(json.dumps(summary, indent=2))
@@ -77,5 +113,24 @@ def main(use_mock_only: bool = False) -> None:
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Run stat-arb volatility strategy backtest")
     parser.add_argument("--mock-only", action="store_true", help="use simulated data only")
+    parser.add_argument("--cache-dir", default=".cache/results", help="backtest result cache directory")
+    parser.add_argument("--no-cache", action="store_true", help="always recompute the backtest and pair screen")
+    parser.add_argument("--screening-cache", default=".cache/screening.db", help="pair test result cache")
+    parser.add_argument("--max-gap", type=int, default=3, help="longest price gap (bars) to forward-fill")
+    parser.add_argument("--run-store", default=".cache/runs.db", help="SQLite run registry")
+    parser.add_argument("--no-run-store", action="store_true", help="do not record this run")
+    parser.add_argument("--seed", type=int, default=0, help="seed the engine's slippage draws")
+    parser.add_argument("--event-log", default=None, help="write a binary event log to this directory")
+    parser.add_argument("--precision", choices=("float64", "float32"), default=None, help="price/spread storage dtype")
     args = parser.parse_args()
-    main(use_mock_only=args.mock_only)
+    if args.precision:
+        set_precision(args.precision)
+    main(
+        use_mock_only=args.mock_only,
+        cache_dir=None if args.no_cache else args.cache_dir,
+        max_gap=args.max_gap,
+        run_store=None if args.no_run_store else args.run_store,
+        screening_cache=None if args.no_cache else args.screening_cache,
+        seed=args.seed,
+        event_log=args.event_log,
+    )
@@ -0,0 +1,54 @@
+"""Paper-trade selected pairs on a replayed or tailed bar feed."""
+
+from __future__ import annotations
+
+import argparse
+import json
+
+from stat_arb_vol.backtest.engine import EventDrivenBacktester
+from stat_arb_vol.config import BacktestConfig, UniverseConfig
+from stat_arb_vol.data.loader import DataLoader
+from stat_arb_vol.live.feed import FileTailFeed, ReplayFeed
+from stat_arb_vol.live.runtime import PaperTradingRuntime
+from stat_arb_vol.models.cointegration import CointegrationSelector
+
+
+def main(tail: str | None = None, max_pairs: int = 10, interval: float = 0.0) -> None:
+    universe = UniverseConfig()
+    config = BacktestConfig()
+    prices = DataLoader(universe.symbols, universe.start_date, universe.end_date)._simulate_prices()
+    cutoff = len(prices) - 365
+    history, live = prices.iloc[:cutoff], prices.iloc[cutoff:]
+
+    candidates = CointegrationSelector(significance=0.20).select_pairs(history)[:max_pairs]
+    strategies = [
+        EventDrivenBacktester(history, (c.asset_x, c.asset_y), config).strategy for c in candidates
+    ]
+    if not strategies:
+        raise RuntimeError("No cointegrated pairs found.")
+
+    feed = FileTailFeed(tail) if tail else ReplayFeed(live, interval=interval)
+    report = PaperTradingRuntime(strategies, config, seed=7).run_sync(feed)
+    print(
+        json.dumps(
+            {
+                "pairs": len(strategies),
+                "bars": report.bars,
+                "signals": report.signals,
+                "fills": report.fills,
+                "bars_per_second": report.bars / max(report.elapsed_seconds, 1e-9),
+                "signal_to_order_us": report.signal_to_order_us,
+                "signal_to_fill_us": report.signal_to_fill_us,
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tail", help="CSV file (timestamp,symbol,close) to tail instead of replaying mock data")
+    parser.add_argument("--max-pairs", type=int, default=10)
+    parser.add_argument("--interval", type=float, default=0.0, help="seconds between replayed bars")
+    args = parser.parse_args()
+    main(tail=args.tail, max_pairs=args.max_pairs, interval=args.interval)
@@ -0,0 +1,36 @@
+"""Run every experiment in a manifest through the cached, parallel stage DAG."""
+
+from __future__ import annotations
+
+import argparse
+from collections import Counter
+
+from stat_arb_vol.pipeline.dag import Pipeline
+from stat_arb_vol.pipeline.manifest import load_manifest
+
+
+def main(manifest: str, cache_dir: str, workers: int, refresh_data: bool) -> None:
+    experiments = load_manifest(manifest)
+    pipeline = Pipeline(experiments, cache_dir=cache_dir, workers=workers)
+    print(f"{len(experiments)} experiments -> {len(pipeline.stages)} unique stages")
+    outcomes = pipeline.run(refresh_data=refresh_data)
+
+    ran = Counter(o.kind for o in outcomes.values() if not o.cached)
+    reused = Counter(o.kind for o in outcomes.values() if o.cached)
+    print(f"ran: {dict(ran)}  cached: {dict(reused)}")
+    for name, summary in pipeline.results(outcomes).items():
+        metrics = summary["metrics"]
+        print(
+            f"{name:20s} {'/'.join(summary['selected_pair']):10s} "
+            f"sharpe={metrics['Sharpe Ratio']:7.3f} maxdd={metrics['Maximum Drawdown']:.3f} cagr={metrics['CAGR']:.3f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("manifest", nargs="?", default="experiments.toml")
+    parser.add_argument("--cache-dir", default=".cache/pipeline")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--refresh-data", action="store_true", help="re-download data; downstream reruns only if it changed")
+    args = parser.parse_args()
+    main(args.manifest, args.cache_dir, args.workers, args.refresh_data)
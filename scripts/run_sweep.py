@@ -0,0 +1,113 @@
+"""Fan a pair-selection + threshold sweep out to local or remote workers."""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import multiprocessing as mp
+import socket
+
+from stat_arb_vol.jobs.broker import Coordinator, SQLiteBroker, connect, results_frame
+from stat_arb_vol.jobs.tasks import make_task
+from stat_arb_vol.jobs.worker import Worker
+
+
+def _local_worker(url: str) -> None:
+    broker = connect(url)
+    try:
+        Worker(broker, idle_timeout=2.0).run()
+    finally:
+        broker.close()
+
+
+def _drain(url: str, workers: int) -> None:
+    processes = [mp.Process(target=_local_worker, args=(url,)) for _ in range(workers)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+
+def main(
+    db: str = ".cache/jobs.db",
+    data: str = "mock",
+    workers: int = 4,
+    serve: bool = False,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    max_pairs: int = 5,
+    seed: int = 0,
+) -> None:
+    coordinator = None
+    if serve:
+        coordinator = Coordinator(SQLiteBroker(db), host=host, port=port)
+        coordinator.serve_in_background()
+        url = coordinator.url
+        advertised = url
+        if host in ("", "0.0.0.0", "::"):
+            url = f"tcp://127.0.0.1:{coordinator.server_address[1]}"
+            advertised = f"tcp://{socket.gethostname()}:{coordinator.server_address[1]}"
+        print(f"coordinator listening on {coordinator.url}")
+        print(f"remote workers: python -m stat_arb_vol.jobs.worker {advertised}")
+    else:
+        url = f"sqlite:///{db}"
+    broker = connect(url)
+
+    selection = make_task("select", {"data": data, "significance": 0.20})
+    broker.submit([selection])
+    _drain(url, 1)
+    rows = [r for r in broker.results("select") if r["task_id"] == selection.task_id and r["status"] == "done"]
+    if not rows:
+        raise RuntimeError("Pair selection task did not complete.")
+    pairs = [p["pair"] for p in rows[0]["result"]["pairs"][:max_pairs]]
+
+    grid = itertools.product(pairs, (1.5, 2.0, 2.5), (0.25, 0.5))
+    tasks = [
+        make_task(
+            "backtest",
+            {"data": data, "pair": pair, "config": {"entry_z": entry, "exit_z": exit_}, "seed": seed},
+        )
+        for pair, entry, exit_ in grid
+    ]
+    broker.submit(tasks)
+    _drain(url, workers)
+
+    frame = results_frame(broker.results("backtest"))
+    print(broker.counts())
+    columns = [
+        "payload.pair",
+        "payload.config.entry_z",
+        "payload.config.exit_z",
+        "result.metrics.Sharpe Ratio",
+        "result.trades",
+        "worker",
+    ]
+    done = frame.loc[frame["status"] == "done", columns]
+    print(done.sort_values("result.metrics.Sharpe Ratio", ascending=False).head(10).to_string(index=False))
+
+    broker.close()
+    if coordinator is not None:
+        coordinator.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--db", default=".cache/jobs.db", help="SQLite task/result table")
+    parser.add_argument("--data", default="mock", help='"mock" or a CSV/Parquet price file readable by workers')
+    parser.add_argument("--workers", type=int, default=4, help="local worker processes")
+    parser.add_argument("--serve", action="store_true", help="expose the queue through a TCP coordinator")
+    parser.add_argument("--host", default="127.0.0.1", help="coordinator bind address; 0.0.0.0 for remote workers")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--max-pairs", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0, help="slippage seed stored in every backtest task")
+    args = parser.parse_args()
+    main(
+        db=args.db,
+        data=args.data,
+        workers=args.workers,
+        serve=args.serve,
+        host=args.host,
+        port=args.port,
+        max_pairs=args.max_pairs,
+        seed=args.seed,
+    )
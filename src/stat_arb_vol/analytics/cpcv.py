@@ -0,0 +1,255 @@
+"""Combinatorial purged cross-validation (CPCV) of the pair-selection + backtest workflow."""
+
+from __future__ import annotations
+
+import hashlib
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from math import comb
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from stat_arb_vol.analytics.metrics import compute_metrics
+from stat_arb_vol.backtest.cache import ResultCache
+from stat_arb_vol.backtest.engine import EventDrivenBacktester
+from stat_arb_vol.config import BacktestConfig
+from stat_arb_vol.models.cointegration import CointegrationSelector
+
+
+@dataclass(frozen=True)
+class CVSplit:
+    split_id: int
+    test_groups: tuple[int, ...]
+    test_blocks: tuple[tuple[int, int], ...]
+    train: np.ndarray = field(repr=False, compare=False)
+
+
+@dataclass(frozen=True)
+class CombinatorialPurgedCV:
+    """Split bars into ``n_groups`` contiguous groups and test every ``n_test_groups`` combination.
+
+    Training bars within ``purge_bars`` before a test block (the z-score
+    lookback that block's signals read, and open trades that straddle the
+    boundary) and within ``embargo`` (fraction of all bars) after it are
+    dropped, so no training observation overlaps information used in test.
+    """
+
+    n_groups: int = 6
+    n_test_groups: int = 2
+    purge_bars: int = 60
+    embargo: float = 0.01
+
+    @property
+    def n_paths(self) -> int:
+        return comb(self.n_groups - 1, self.n_test_groups - 1)
+
+    def group_bounds(self, n_bars: int) -> list[tuple[int, int]]:
+        edges = np.linspace(0, n_bars, self.n_groups + 1).astype(int)
+        return [(int(a), int(b)) for a, b in zip(edges[:-1], edges[1:])]
+
+    def split(self, n_bars: int) -> list[CVSplit]:
+        bounds = self.group_bounds(n_bars)
+        embargo_bars = int(np.ceil(self.embargo * n_bars))
+        splits = []
+        for split_id, groups in enumerate(itertools.combinations(range(self.n_groups), self.n_test_groups)):
+            keep = np.ones(n_bars, dtype=bool)
+            blocks = []
+            for g in groups:
+                start, end = bounds[g]
+                keep[max(start - self.purge_bars, 0) : min(end + embargo_bars, n_bars)] = False
+                blocks.append((start, end))
+            splits.append(CVSplit(split_id, groups, tuple(blocks), np.flatnonzero(keep)))
+        return splits
+
+    def paths(self, splits: list[CVSplit]) -> list[list[tuple[int, int]]]:
+        """``n_paths`` backtest paths, each a ``(split_id, group)`` per group covering the whole timeline."""
+        by_group: dict[int, list[int]] = {g: [] for g in range(self.n_groups)}
+        for s in splits:
+            for g in s.test_groups:
+                by_group[g].append(s.split_id)
+        return [[(by_group[g][p], g) for g in range(self.n_groups)] for p in range(self.n_paths)]
+
+
+class PairMoments:
+    """Prefix sums of ``x``, ``y``, ``x*y``, ``x*x``, ``y*y`` per symbol pair, built once and shared by every fold.
+
+    The OLS hedge ratio over any union of training segments is then O(1)
+    per segment instead of a regression over the stitched training set.
+    """
+
+    def __init__(self, prices: pd.DataFrame, pairs: list[tuple[str, str]] | None = None) -> None:
+        values = prices.to_numpy(dtype=np.float64)
+        columns = {symbol: j for j, symbol in enumerate(prices.columns)}
+        pairs = pairs if pairs is not None else list(itertools.combinations(prices.columns, 2))
+        self._prefix: dict[tuple[str, str], np.ndarray] = {}
+        for a, b in pairs:
+            x, y = values[:, columns[a]], values[:, columns[b]]
+            valid = np.isfinite(x) & np.isfinite(y)
+            x, y = np.where(valid, x, 0.0), np.where(valid, y, 0.0)
+            terms = np.column_stack([valid, x, y, x * y, x * x, y * y]).astype(np.float64)
+            self._prefix[(a, b)] = np.vstack([np.zeros((1, 6)), np.cumsum(terms, axis=0)])
+
+    def hedge_ratio(self, pair: tuple[str, str], positions: np.ndarray) -> float:
+        """Slope of ``pair[0]`` on ``pair[1]`` (as ``EventDrivenBacktester`` fits it) over ``positions``."""
+        flipped = pair not in self._prefix
+        prefix = self._prefix[pair[::-1] if flipped else pair]
+        breaks = np.flatnonzero(np.diff(positions) != 1)
+        starts = np.concatenate([[positions[0]], positions[breaks + 1]])
+        ends = np.concatenate([positions[breaks], [positions[-1]]]) + 1
+        n, sx, sy, sxy, sxx, syy = (prefix[ends] - prefix[starts]).sum(axis=0)
+        if flipped:
+            sx, sy, sxx, syy = sy, sx, syy, sxx
+        return float((sxy - sx * sy / n) / (syy - sy * sy / n))
+
+
+def _selection_key(prices: pd.DataFrame, positions: np.ndarray, significance: float) -> str:
+    digest = hashlib.sha256(f"{significance!r}|".encode())
+    digest.update(np.ascontiguousarray(pd.DatetimeIndex(prices.index).as_unit("ns").asi8[positions]).tobytes())
+    digest.update(np.ascontiguousarray(prices.to_numpy(dtype=np.float64)[positions]).tobytes())
+    return digest.hexdigest()[:32]
+
+
+def _run_fold(task: dict) -> dict:
+    prices: pd.DataFrame = task["prices"]
+    split: CVSplit = task["split"]
+    config: BacktestConfig = task["config"]
+    cache_dir = Path(task["cache_dir"]) if task["cache_dir"] else None
+
+    selection_path = None
+    if cache_dir is not None:
+        selection_path = cache_dir / "selection" / f"{_selection_key(prices, split.train, task['significance'])}.json"
+    if selection_path is not None and selection_path.exists():
+        pairs = [tuple(p) for p in json.loads(selection_path.read_text(encoding="utf-8"))]
+        selection_cached = True
+    else:
+        train = prices.iloc[split.train]
+        candidates = CointegrationSelector(significance=task["significance"]).select_pairs(train)
+        pairs = [(c.asset_x, c.asset_y) for c in candidates]
+        selection_cached = False
+        if selection_path is not None:
+            selection_path.parent.mkdir(parents=True, exist_ok=True)
+            selection_path.write_text(json.dumps(pairs), encoding="utf-8")
+
+    out = {"split_id": split.split_id, "test_groups": split.test_groups, "selection_cached": selection_cached}
+    if not pairs:
+        # Nothing passes the screen: the strategy stays flat through the test groups.
+        flat = {g: pd.Series(0.0, index=prices.index[a:b]) for g, (a, b) in zip(split.test_groups, split.test_blocks)}
+        out.update(pair=None, hedge_ratio=np.nan, groups=flat)
+        return out
+
+    pair = pairs[0]
+    hedge = task["moments"].hedge_ratio(pair, split.train)
+    results = ResultCache(cache_dir / "results") if cache_dir is not None else None
+    groups, hits = {}, 0
+    for g, (start, end) in zip(split.test_groups, split.test_blocks):
+        # Warm the z-score on the purged bars just before the block; only block returns count.
+        window = prices.iloc[max(start - config.lookback, 0) : end][list(pair)].dropna()
+        seed = task["seed"] + 1_000 * split.split_id + g
+        key = ResultCache.make_key(window, pair, config, hedge_method=f"train-ols:{hedge.hex()}", seed=seed)
+        cached = results.get(key) if results is not None else None
+        if cached is None:
+            result = EventDrivenBacktester(window, pair, config, hedge_ratio=hedge, seed=seed).run()
+            metrics = compute_metrics(result.equity_curve, result.trade_returns, annualization=config.annualization)
+            if results is not None:
+                results.put(key, result, metrics)
+        else:
+            result, _ = cached
+            hits += 1
+        equity = result.equity_curve
+        returns = equity.pct_change().fillna(0.0)
+        groups[g] = returns.loc[returns.index >= prices.index[start]]
+    out.update(pair=pair, hedge_ratio=hedge, groups=groups, backtest_cache_hits=hits)
+    return out
+
+
+def _sharpe(returns: pd.Series, config: BacktestConfig) -> float:
+    equity = config.initial_capital * (1 + returns).cumprod()
+    return compute_metrics(equity, [], annualization=config.annualization)["Sharpe Ratio"]
+
+
+@dataclass
+class CPCVResult:
+    folds: pd.DataFrame
+    path_returns: list[pd.Series]
+    path_sharpes: np.ndarray
+
+    def summary(self) -> dict[str, float]:
+        s = self.path_sharpes
+        return {
+            "paths": int(len(s)),
+            "sharpe_mean": float(np.mean(s)),
+            "sharpe_std": float(np.std(s, ddof=1)) if len(s) > 1 else 0.0,
+            "sharpe_p05": float(np.quantile(s, 0.05)),
+            "sharpe_median": float(np.median(s)),
+            "sharpe_p95": float(np.quantile(s, 0.95)),
+            "prob_sharpe_below_zero": float(np.mean(s < 0)),
+        }
+
+
+def evaluate_cpcv(
+    prices: pd.DataFrame,
+    config: BacktestConfig,
+    cv: CombinatorialPurgedCV | None = None,
+    significance: float = 0.20,
+    workers: int | None = None,
+    cache_dir: str | Path | None = ".cache/cpcv",
+    seed: int = 0,
+) -> CPCVResult:
+    """Select a pair and fit its hedge ratio on each split's purged training bars, backtest the test
+    groups, and stitch group returns into CPCV paths whose Sharpe ratios form the distribution.
+
+    Splits run in a process pool; pair selections and group backtests are
+    cached under ``cache_dir`` so reruns and config sweeps reuse them.
+    """
+    cv = cv or CombinatorialPurgedCV(purge_bars=config.lookback)
+    splits = cv.split(len(prices))
+    moments = PairMoments(prices)
+    tasks = [
+        {
+            "prices": prices,
+            "split": s,
+            "config": config,
+            "moments": moments,
+            "significance": significance,
+            "cache_dir": str(cache_dir) if cache_dir is not None else None,
+            "seed": seed,
+        }
+        for s in splits
+    ]
+    workers = workers or min(len(tasks), os.cpu_count() or 1)
+    if workers <= 1:
+        folds = [_run_fold(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            folds = list(pool.map(_run_fold, tasks))
+
+    by_split = {fold["split_id"]: fold for fold in folds}
+    path_returns, path_sharpes = [], []
+    for path in cv.paths(splits):
+        pieces = [by_split[split_id]["groups"].get(g) for split_id, g in path]
+        if any(piece is None for piece in pieces):
+            continue
+        returns = pd.concat(pieces)
+        path_returns.append(returns)
+        path_sharpes.append(_sharpe(returns, config))
+
+    table = pd.DataFrame(
+        [
+            {
+                "split_id": f["split_id"],
+                "test_groups": f["test_groups"],
+                "pair": "/".join(f["pair"]) if f["pair"] else None,
+                "hedge_ratio": f["hedge_ratio"],
+                "selection_cached": f["selection_cached"],
+                "backtest_cache_hits": f.get("backtest_cache_hits", 0),
+                "test_sharpe": _sharpe(pd.concat(list(f["groups"].values())), config) if f["groups"] else np.nan,
+            }
+            for f in folds
+        ]
+    )
+    return CPCVResult(table, path_returns, np.asarray(path_sharpes, dtype=np.float64))
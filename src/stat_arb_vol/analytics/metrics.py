@@ -7,6 +7,7 @@ import pandas as pd
 
 
 def compute_metrics(equity: pd.Series, trade_returns: list[float], annualization: int = 252) -> dict[str, float]:
+    equity = equity.astype(np.float64, copy=False)
     ret = equity.pct_change().dropna()
     sharpe = np.sqrt(annualization) * ret.mean() / (ret.std(ddof=0) + 1e-12)
 
@@ -2,15 +2,25 @@
 
 from __future__ import annotations
 
+import os
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from html import escape
 from pathlib import Path
 
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 
 
 def create_performance_plot(equity: pd.Series, output_path: str) -> None:
-    fig, ax = plt.subplots(figsize=(10, 4))
-    equity.plot(ax=ax, color="navy", lw=1.6)
+    # Object-oriented Agg figure: no pyplot global state, so safe in threads and worker processes.
+    fig = Figure(figsize=(10, 4))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.plot(equity.index, equity.to_numpy(), color="navy", lw=1.6)
     ax.set_title("Portfolio Equity Curve")
     ax.set_xlabel("Date")
     ax.set_ylabel("Equity ($)")
@@ -18,14 +28,72 @@ def create_performance_plot(equity: pd.Series, output_path: str) -> None:
     fig.tight_layout()
     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
     fig.savefig(output_path, dpi=150)
-    plt.close(fig)
 
 
-def write_markdown_report(metrics: dict[str, float], selected_pair: tuple[str, str], out_file: str) -> None:
+def _decimate(values: np.ndarray, buckets: int) -> tuple[np.ndarray, np.ndarray]:
+    """Positions and values of each bucket's min and max (in order), preserving the line's envelope."""
+    n = len(values)
+    if n <= 2 * buckets:
+        return np.arange(n), values
+    edges = np.linspace(0, n, buckets + 1).astype(np.int64)
+    lo = np.minimum.reduceat(values, edges[:-1])
+    hi = np.maximum.reduceat(values, edges[:-1])
+    lo_pos = np.array([s + np.argmin(values[s:e]) for s, e in zip(edges[:-1], edges[1:])])
+    hi_pos = np.array([s + np.argmax(values[s:e]) for s, e in zip(edges[:-1], edges[1:])])
+    first_min = lo_pos <= hi_pos
+    pos = np.column_stack([np.where(first_min, lo_pos, hi_pos), np.where(first_min, hi_pos, lo_pos)]).ravel()
+    vals = np.column_stack([np.where(first_min, lo, hi), np.where(first_min, hi, lo)]).ravel()
+    return pos, vals
+
+
+def equity_svg(
+    timestamps: np.ndarray,
+    equity: np.ndarray,
+    width: int = 800,
+    height: int = 260,
+    title: str = "Portfolio Equity Curve",
+) -> str:
+    """Dependency-free SVG line chart; long curves are min/max decimated to about two points per pixel."""
+    pad_l, pad_r, pad_t, pad_b = 70, 12, 28, 26
+    plot_w, plot_h = width - pad_l - pad_r, height - pad_t - pad_b
+    equity = np.asarray(equity, dtype=np.float64)
+    finite = np.isfinite(equity)
+    pos, vals = _decimate(equity[finite], plot_w)
+    lo, hi = (float(vals.min()), float(vals.max())) if len(vals) else (0.0, 1.0)
+    span = hi - lo or 1.0
+    xs = pad_l + pos * (plot_w / max(len(equity[finite]) - 1, 1))
+    ys = pad_t + (hi - vals) * (plot_h / span)
+    points = " ".join(f"{x:.1f},{y:.1f}" for x, y in zip(xs, ys))
+    stamps = np.asarray(timestamps)[finite]
+    first = str(pd.Timestamp(int(stamps[0])).date()) if len(stamps) else ""
+    last = str(pd.Timestamp(int(stamps[-1])).date()) if len(stamps) else ""
+    bottom = pad_t + plot_h
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}" '
+        'font-family="sans-serif" font-size="11">'
+        f'<rect width="{width}" height="{height}" fill="white"/>'
+        f'<text x="{width / 2:.0f}" y="17" text-anchor="middle" font-size="13">{escape(title)}</text>'
+        f'<rect x="{pad_l}" y="{pad_t}" width="{plot_w}" height="{plot_h}" fill="none" stroke="#bbb"/>'
+        f'<text x="{pad_l - 6}" y="{pad_t + 4}" text-anchor="end">{hi:,.0f}</text>'
+        f'<text x="{pad_l - 6}" y="{bottom}" text-anchor="end">{lo:,.0f}</text>'
+        f'<text x="{pad_l}" y="{bottom + 16}">{first}</text>'
+        f'<text x="{pad_l + plot_w}" y="{bottom + 16}" text-anchor="end">{last}</text>'
+        f'<polyline fill="none" stroke="navy" stroke-width="1.6" points="{points}"/>'
+        "</svg>"
+    )
+
+
+def write_equity_svg(equity: pd.Series, output_path: str) -> None:
+    svg = equity_svg(pd.DatetimeIndex(equity.index).as_unit("ns").asi8, equity.to_numpy(dtype=np.float64))
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    Path(output_path).write_text(svg, encoding="utf-8")
+
+
+def render_markdown_report(metrics: dict[str, float], selected_pair: tuple[str, ...]) -> str:
     lines = [
         "# Backtest Performance Report",
         "",
-        f"Selected Pair: **{selected_pair[0]} / {selected_pair[1]}**",
+        f"Selected Pair: **{' / '.join(selected_pair)}**",
         "",
         "## Metrics",
     ]
@@ -41,6 +109,76 @@ def write_markdown_report(metrics: dict[str, float], selected_pair: tuple[str, s
             "- Position sizing uses Kelly criterion plus drawdown scaling.",
         ]
     )
+    return "\n".join(lines)
 
+
+def write_markdown_report(metrics: dict[str, float], selected_pair: tuple[str, str], out_file: str) -> None:
     Path(out_file).parent.mkdir(parents=True, exist_ok=True)
-    Path(out_file).write_text("\n".join(lines), encoding="utf-8")
+    Path(out_file).write_text(render_markdown_report(metrics, selected_pair), encoding="utf-8")
+
+
+@dataclass
+class ReportJob:
+    """One run to report on; the curve is held as plain arrays so it pickles cheaply to workers."""
+
+    name: str
+    pair: tuple[str, ...]
+    metrics: dict[str, float]
+    timestamps: np.ndarray
+    equity: np.ndarray
+
+    @classmethod
+    def from_series(cls, name: str, pair: tuple[str, ...], metrics: dict[str, float], equity: pd.Series) -> ReportJob:
+        stamps = pd.DatetimeIndex(equity.index).as_unit("ns").asi8
+        return cls(name, tuple(pair), dict(metrics), stamps, equity.to_numpy(dtype=np.float64))
+
+
+def _render_job(args: tuple[ReportJob, str, str]) -> dict[str, object]:
+    job, out_dir, fmt = args
+    out = Path(out_dir)
+    chart = f"{job.name}.{fmt}"
+    if fmt == "svg":
+        (out / chart).write_text(equity_svg(job.timestamps, job.equity), encoding="utf-8")
+    else:
+        index = pd.DatetimeIndex(job.timestamps.astype("datetime64[ns]"))
+        create_performance_plot(pd.Series(job.equity, index=index), str(out / chart))
+    report = render_markdown_report(job.metrics, job.pair) + f"\n\n![equity]({chart})\n"
+    (out / f"{job.name}.md").write_text(report, encoding="utf-8")
+    return {"name": job.name, "pair": "/".join(job.pair), "chart": chart, **job.metrics}
+
+
+def render_reports(
+    jobs: Iterable[ReportJob],
+    out_dir: str | Path,
+    fmt: str = "svg",
+    workers: int | None = None,
+    chunksize: int = 8,
+) -> pd.DataFrame:
+    """Render a chart and markdown report per run in a process pool, plus one ``index.md`` table.
+
+    ``fmt="svg"`` uses the lightweight SVG writer; ``"png"`` renders
+    object-oriented Agg figures. ``workers=1`` renders in-process.
+    """
+    if fmt not in ("svg", "png"):
+        raise ValueError("fmt must be 'svg' or 'png'")
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    tasks = [(job, str(out), fmt) for job in jobs]
+    workers = workers or min(len(tasks), os.cpu_count() or 1) or 1
+    if workers == 1:
+        rows = [_render_job(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            rows = list(pool.map(_render_job, tasks, chunksize=chunksize))
+
+    summary = pd.DataFrame(rows)
+    lines = ["# Run Reports", "", f"{len(rows)} runs.", ""]
+    if rows:
+        metric_names = [c for c in summary.columns if c not in ("name", "pair", "chart")]
+        lines.append("| Run | Pair | " + " | ".join(metric_names) + " |")
+        lines.append("|---|---|" + "---|" * len(metric_names))
+        for row in rows:
+            cells = " | ".join(f"{row.get(m, float('nan')):.4f}" for m in metric_names)
+            lines.append(f"| [{row['name']}]({row['name']}.md) | {row['pair']} | {cells} |")
+    (out / "index.md").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return summary
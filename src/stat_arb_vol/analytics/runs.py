@@ -0,0 +1,217 @@
+"""Indexed SQLite registry of backtest runs with compressed equity curves."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+import zlib
+from dataclasses import asdict, fields
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from stat_arb_vol.config import BacktestConfig
+
+METRIC_COLUMNS = {
+    "Sharpe Ratio": "sharpe",
+    "Maximum Drawdown": "max_drawdown",
+    "CAGR": "cagr",
+    "Win Rate": "win_rate",
+}
+CONFIG_COLUMNS = {f.name: f"cfg_{f.name}" for f in fields(BacktestConfig)}
+RUN_COLUMNS = (
+    "run_id",
+    "created_at",
+    "label",
+    "pair",
+    "hedge_ratio",
+    "start",
+    "end",
+    "bars",
+    "trades",
+    "final_equity",
+    *METRIC_COLUMNS.values(),
+    *CONFIG_COLUMNS.values(),
+)
+_OPERATORS = {"=", "!=", "<", "<=", ">", ">="}
+CURVE_CODEC = "zlib-delta-v1"
+
+
+def _schema() -> str:
+    config_columns = ",\n    ".join(f"{column} REAL" for column in CONFIG_COLUMNS.values())
+    metric_columns = ",\n    ".join(f"{column} REAL" for column in METRIC_COLUMNS.values())
+    return f"""
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at REAL NOT NULL,
+    label TEXT,
+    pair TEXT NOT NULL,
+    hedge_ratio REAL,
+    start INTEGER,
+    "end" INTEGER,
+    bars INTEGER,
+    trades INTEGER,
+    final_equity REAL,
+    {metric_columns},
+    {config_columns},
+    metrics TEXT,
+    extra TEXT
+);
+CREATE TABLE IF NOT EXISTS curves (
+    run_id INTEGER PRIMARY KEY REFERENCES runs (run_id) ON DELETE CASCADE,
+    codec TEXT NOT NULL,
+    timestamps BLOB NOT NULL,
+    equity BLOB NOT NULL,
+    positions BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_pair ON runs (pair, created_at);
+CREATE INDEX IF NOT EXISTS runs_thresholds ON runs (cfg_entry_z, cfg_exit_z, cfg_lookback);
+CREATE INDEX IF NOT EXISTS runs_sharpe ON runs (sharpe);
+CREATE INDEX IF NOT EXISTS runs_drawdown ON runs (max_drawdown);
+CREATE INDEX IF NOT EXISTS runs_cagr ON runs (cagr);
+CREATE INDEX IF NOT EXISTS runs_created ON runs (created_at);
+"""
+
+
+def encode_curve(equity: pd.Series, positions: pd.Series) -> tuple[bytes, bytes, bytes]:
+    """Delta-encoded ns timestamps, float64 equity and int8 positions, each zlib-compressed."""
+    stamps = pd.DatetimeIndex(equity.index).as_unit("ns").asi8
+    deltas = np.diff(stamps, prepend=np.int64(0))
+    side = np.nan_to_num(positions.reindex(equity.index).to_numpy(dtype=np.float64)).astype(np.int8)
+    return (
+        zlib.compress(deltas.astype("<i8").tobytes()),
+        zlib.compress(equity.to_numpy(dtype="<f8").tobytes()),
+        zlib.compress(side.tobytes()),
+    )
+
+
+def decode_curve(timestamps: bytes, equity: bytes, positions: bytes) -> pd.DataFrame:
+    stamps = np.cumsum(np.frombuffer(zlib.decompress(timestamps), dtype="<i8"))
+    return pd.DataFrame(
+        {
+            "equity": np.frombuffer(zlib.decompress(equity), dtype="<f8"),
+            "position": np.frombuffer(zlib.decompress(positions), dtype=np.int8),
+        },
+        index=pd.DatetimeIndex(stamps.astype("datetime64[ns]")),
+    )
+
+
+class RunStore:
+    """Append-only run registry: one indexed row per run plus a compressed curve row.
+
+    Summary queries (``query``/``count``) read only the ``runs`` table, so
+    listing thousands of runs never touches curve blobs; ``curve(run_id)``
+    decodes one on demand.
+    """
+
+    def __init__(self, path: str | Path = ".cache/runs.db") -> None:
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=30.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(_schema())
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def record(
+        self,
+        result,
+        config: BacktestConfig,
+        metrics: dict[str, float],
+        label: str | None = None,
+        extra: dict[str, Any] | None = None,
+    ) -> int:
+        """Store a ``BacktestResult`` with its config and metrics; returns the new ``run_id``."""
+        equity = result.equity_curve
+        stamps = pd.DatetimeIndex(equity.index).as_unit("ns").asi8
+        row = {
+            "created_at": time.time(),
+            "label": label,
+            "pair": "/".join(result.pair),
+            "hedge_ratio": float(result.hedge_ratio),
+            "start": int(stamps[0]) if len(stamps) else None,
+            "end": int(stamps[-1]) if len(stamps) else None,
+            "bars": len(equity),
+            "trades": len(result.trade_returns),
+            "final_equity": float(equity.iloc[-1]) if len(equity) else None,
+            **{column: metrics.get(name) for name, column in METRIC_COLUMNS.items()},
+            **{CONFIG_COLUMNS[name]: value for name, value in asdict(config).items()},
+            "metrics": json.dumps(metrics),
+            "extra": json.dumps(extra or {}),
+        }
+        names = ", ".join(f'"{name}"' for name in row)
+        marks = ", ".join("?" for _ in row)
+        with self._conn:
+            cursor = self._conn.execute(f"INSERT INTO runs ({names}) VALUES ({marks})", tuple(row.values()))
+            run_id = int(cursor.lastrowid)
+            self._conn.execute(
+                "INSERT INTO curves (run_id, codec, timestamps, equity, positions) VALUES (?, ?, ?, ?, ?)",
+                (run_id, CURVE_CODEC, *encode_curve(equity, result.positions)),
+            )
+        return run_id
+
+    def _where(self, filters: dict[str, Any] | None) -> tuple[str, list[Any]]:
+        clauses, params = [], []
+        for column, condition in (filters or {}).items():
+            column = CONFIG_COLUMNS.get(column, METRIC_COLUMNS.get(column, column))
+            if column not in RUN_COLUMNS:
+                raise ValueError(f"cannot filter on {column!r}")
+            op, value = condition if isinstance(condition, tuple) else ("=", condition)
+            if op not in _OPERATORS:
+                raise ValueError(f"unsupported operator {op!r}")
+            clauses.append(f'"{column}" {op} ?')
+            params.append(value)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def query(
+        self,
+        filters: dict[str, Any] | None = None,
+        order_by: str = "run_id",
+        descending: bool = True,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> pd.DataFrame:
+        """Filter/sort run summaries without loading curves.
+
+        ``filters`` maps a column (``pair``, ``sharpe``, ``cfg_entry_z`` ... or
+        a ``BacktestConfig`` field / metric name) to a value or ``(op, value)``,
+        e.g. ``{"pair": "BTC/ETH", "sharpe": (">=", 1.0), "entry_z": 2.0}``.
+        """
+        order_by = CONFIG_COLUMNS.get(order_by, METRIC_COLUMNS.get(order_by, order_by))
+        if order_by not in RUN_COLUMNS:
+            raise ValueError(f"cannot order by {order_by!r}")
+        where, params = self._where(filters)
+        columns = ", ".join(f'"{column}"' for column in RUN_COLUMNS)
+        sql = (
+            f'SELECT {columns} FROM runs{where} ORDER BY "{order_by}" {"DESC" if descending else "ASC"}, run_id DESC '
+            "LIMIT ? OFFSET ?"
+        )
+        frame = pd.read_sql_query(sql, self._conn, params=[*params, limit, offset])
+        for column in ("start", "end"):
+            frame[column] = pd.to_datetime(frame[column], unit="ns")
+        frame["created_at"] = pd.to_datetime(frame["created_at"], unit="s")
+        return frame
+
+    def count(self, filters: dict[str, Any] | None = None) -> int:
+        where, params = self._where(filters)
+        return int(self._conn.execute(f"SELECT COUNT(*) FROM runs{where}", params).fetchone()[0])
+
+    def curve(self, run_id: int) -> pd.DataFrame:
+        row = self._conn.execute(
+            "SELECT codec, timestamps, equity, positions FROM curves WHERE run_id = ?", (run_id,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(f"no curve for run {run_id}")
+        if row[0] != CURVE_CODEC:
+            raise ValueError(f"unsupported curve codec {row[0]!r}")
+        return decode_curve(*row[1:])
+
+    def delete(self, run_id: int) -> None:
+        with self._conn:
+            self._conn.execute("DELETE FROM runs WHERE run_id = ?", (run_id,))
@@ -0,0 +1,159 @@
+"""Content-addressed on-disk cache for backtest results."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from stat_arb_vol.analytics.metrics import compute_metrics
+from stat_arb_vol.backtest.engine import BacktestResult, EventDrivenBacktester
+from stat_arb_vol.backtest.ledger import LEDGER_COLUMNS, FillLedger
+from stat_arb_vol.config import BacktestConfig
+
+CACHE_VERSION = 4
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResultCache:
+    """Store ``BacktestResult`` + metrics as ``.npz`` files keyed by input hash.
+
+    Entries are evicted least-recently-used first (by file mtime, refreshed on
+    every hit) once the directory exceeds ``max_bytes`` or ``max_entries``.
+    The slippage seed is part of the key; ``run`` never caches an unseeded
+    run whose slippage is random, since it would not repeat.
+    """
+
+    def __init__(self, directory: str | Path, max_bytes: int = 512 * 2**20, max_entries: int | None = None) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+
+    @staticmethod
+    def make_key(
+        prices: pd.DataFrame,
+        pair: tuple[str, str],
+        config: BacktestConfig,
+        hedge_method: str = "ols",
+        seed: int | None = None,
+    ) -> str:
+        panel = prices[list(pair)]
+        digest = hashlib.sha256()
+        digest.update(f"v{CACHE_VERSION}|{'/'.join(pair)}|{hedge_method}|seed={seed}|".encode())
+        digest.update(json.dumps(asdict(config), sort_keys=True).encode())
+        digest.update(np.ascontiguousarray(pd.DatetimeIndex(panel.index).as_unit("ns").asi8).tobytes())
+        digest.update(np.ascontiguousarray(panel.to_numpy(dtype=np.float64)).tobytes())
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.npz"
+
+    def get(self, key: str) -> tuple[BacktestResult, dict[str, float]] | None:
+        path = self._path(key)
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                index = pd.DatetimeIndex(data["index"])
+                if str(data["tz"]):
+                    index = index.tz_localize("UTC").tz_convert(str(data["tz"]))
+                result = BacktestResult(
+                    pair=tuple(data["pair"].tolist()),
+                    hedge_ratio=float(data["hedge_ratio"]),
+                    equity_curve=pd.Series(data["equity"], index=index),
+                    positions=pd.Series(data["positions"], index=index),
+                    trade_returns=data["trade_returns"].tolist(),
+                    ledger=FillLedger.from_columns(
+                        {name: data[f"ledger_{name}"] for name in LEDGER_COLUMNS},
+                        [tuple(p.split("/")) for p in data["ledger_pairs"].tolist()],
+                        data["ledger_extra_prices"],
+                    ),
+                )
+                metrics = dict(zip(data["metric_names"].tolist(), data["metric_values"].tolist()))
+        except (FileNotFoundError, KeyError, ValueError, OSError):
+            self.stats.misses += 1
+            return None
+
+        os.utime(path)
+        self.stats.hits += 1
+        return result, metrics
+
+    def put(self, key: str, result: BacktestResult, metrics: dict[str, float]) -> None:
+        index = pd.DatetimeIndex(result.equity_curve.index).as_unit("ns")
+        ledger = result.ledger if result.ledger is not None else FillLedger(capacity=1)
+        tmp = self.directory / f".{key}.tmp.npz"
+        np.savez(
+            tmp,
+            index=index.asi8,
+            tz=np.array(str(index.tz) if index.tz is not None else ""),
+            pair=np.array(result.pair),
+            hedge_ratio=np.array(result.hedge_ratio),
+            equity=result.equity_curve.to_numpy(dtype=np.float64),
+            positions=result.positions.to_numpy(dtype=np.float64),
+            trade_returns=np.asarray(result.trade_returns, dtype=np.float64),
+            metric_names=np.array(list(metrics)),
+            metric_values=np.array(list(metrics.values()), dtype=np.float64),
+            ledger_pairs=np.array(["/".join(p) for p in ledger.pairs], dtype=str),
+            ledger_extra_prices=ledger.extra_prices,
+            **{f"ledger_{name}": values for name, values in ledger.columns().items()},
+        )
+        os.replace(tmp, self._path(key))
+        self._evict()
+
+    @staticmethod
+    def cacheable(config: BacktestConfig, seed: int | None) -> bool:
+        """Unseeded runs with random slippage are not reproducible, so they bypass the cache."""
+        return seed is not None or config.slippage_bps_min == config.slippage_bps_max
+
+    def run(
+        self,
+        prices: pd.DataFrame,
+        pair: tuple[str, str],
+        config: BacktestConfig,
+        seed: int | None = None,
+    ) -> tuple[BacktestResult, dict[str, float]]:
+        cacheable = self.cacheable(config, seed)
+        key = self.make_key(prices, pair, config, seed=seed)
+        cached = self.get(key) if cacheable else None
+        if cached is not None:
+            return cached
+
+        result = EventDrivenBacktester(prices, pair, config, seed=seed).run()
+        metrics = compute_metrics(result.equity_curve, result.trade_returns, annualization=config.annualization)
+        if cacheable:
+            self.put(key, result, metrics)
+        return result, metrics
+
+    def _evict(self) -> None:
+        entries = sorted(
+            ((p.stat().st_mtime, p.stat().st_size, p) for p in self.directory.glob("*.npz") if not p.name.startswith(".")),
+            key=lambda e: e[0],
+        )
+        total = sum(size for _, size, _ in entries)
+        while entries and (
+            total > self.max_bytes or (self.max_entries is not None and len(entries) > self.max_entries)
+        ):
+            _, size, path = entries.pop(0)
+            path.unlink(missing_ok=True)
+            total -= size
+            self.stats.evictions += 1
+
+    def clear(self) -> None:
+        for path in self.directory.glob("*.npz"):
+            path.unlink(missing_ok=True)
@@ -0,0 +1,143 @@
+"""Compact, resumable snapshots of ``EventDrivenBacktester`` state."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from stat_arb_vol.config import BacktestConfig
+
+CHECKPOINT_VERSION = 1
+
+
+@dataclass
+class EngineState:
+    """Everything ``run`` carries from one bar to the next.
+
+    ``tail_index`` / ``tail_prices`` keep the last ``lookback`` bars of leg
+    prices, enough to rebuild the spread's rolling z-score and the first
+    return of the resumed segment without touching earlier history.
+    ``tail_index`` holds UTC nanoseconds; ``tz`` restores a tz-aware index.
+    """
+
+    pair: tuple[str, ...]
+    hedge_ratio: float
+    weights: tuple[float, ...] | None
+    config: BacktestConfig
+    bars: int
+    cash: float
+    position_side: int
+    quantity: float
+    entry_equity: float | None
+    pending_side: int | None
+    pending_quantity: float
+    pending_age: int
+    peak_equity: float
+    max_drawdown: float
+    strategy_position: int
+    tail_index: np.ndarray
+    tail_prices: np.ndarray
+    kelly: dict[str, np.ndarray] = field(default_factory=dict)
+    trade_returns: np.ndarray = field(default_factory=lambda: np.empty(0))
+    rng_state: tuple | None = None
+    seeded: bool = False
+    tz: str = ""
+
+    def _index(self) -> pd.DatetimeIndex:
+        index = pd.DatetimeIndex(np.asarray(self.tail_index, dtype=np.int64).astype("datetime64[ns]"))
+        return index.tz_localize("UTC").tz_convert(self.tz) if self.tz else index
+
+    @property
+    def last_timestamp(self) -> pd.Timestamp:
+        return self._index()[-1]
+
+    def tail_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.tail_prices, index=self._index(), columns=list(self.pair))
+
+    def save(self, path: str | Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        config = asdict(self.config)
+        arrays = {
+            "version": np.array(CHECKPOINT_VERSION),
+            "pair": np.array(self.pair, dtype=str),
+            "weights": np.array(self.weights if self.weights is not None else [], dtype=np.float64),
+            "config_names": np.array(list(config), dtype=str),
+            "config_values": np.array(list(config.values()), dtype=np.float64),
+            "scalars": np.array(
+                [
+                    self.hedge_ratio,
+                    self.bars,
+                    self.cash,
+                    self.position_side,
+                    self.quantity,
+                    np.nan if self.entry_equity is None else self.entry_equity,
+                    np.nan if self.pending_side is None else self.pending_side,
+                    self.pending_quantity,
+                    self.pending_age,
+                    self.peak_equity,
+                    self.max_drawdown,
+                    self.strategy_position,
+                ],
+                dtype=np.float64,
+            ),
+            "tail_index": self.tail_index,
+            "tz": np.array(self.tz),
+            "tail_prices": self.tail_prices,
+            "trade_returns": np.asarray(self.trade_returns, dtype=np.float64),
+            **{f"kelly_{name}": values for name, values in self.kelly.items()},
+        }
+        if self.rng_state is not None:
+            _, keys, pos, has_gauss, cached = self.rng_state
+            arrays["rng_keys"] = keys
+            arrays["rng_scalars"] = np.array([pos, has_gauss, cached], dtype=np.float64)
+            arrays["rng_seeded"] = np.array(self.seeded)
+        with path.open("wb") as handle:
+            np.savez_compressed(handle, **arrays)
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> EngineState:
+        with np.load(path) as data:
+            if int(data["version"]) != CHECKPOINT_VERSION:
+                raise ValueError(f"unsupported checkpoint version {int(data['version'])}")
+            config_types = {name: type(value) for name, value in asdict(BacktestConfig()).items()}
+            config = BacktestConfig(
+                **{
+                    name: config_types[name](value)
+                    for name, value in zip(data["config_names"].tolist(), data["config_values"].tolist())
+                }
+            )
+            s = data["scalars"].tolist()
+            rng_state = None
+            if "rng_keys" in data:
+                pos, has_gauss, cached = data["rng_scalars"].tolist()
+                rng_state = ("MT19937", data["rng_keys"], int(pos), int(has_gauss), cached)
+            weights = data["weights"].tolist()
+            return cls(
+                pair=tuple(data["pair"].tolist()),
+                hedge_ratio=s[0],
+                weights=tuple(weights) if weights else None,
+                config=config,
+                bars=int(s[1]),
+                cash=s[2],
+                position_side=int(s[3]),
+                quantity=s[4],
+                entry_equity=None if np.isnan(s[5]) else s[5],
+                pending_side=None if np.isnan(s[6]) else int(s[6]),
+                pending_quantity=s[7],
+                pending_age=int(s[8]),
+                peak_equity=s[9],
+                max_drawdown=s[10],
+                strategy_position=int(s[11]),
+                tail_index=data["tail_index"],
+                tail_prices=data["tail_prices"],
+                kelly={name[len("kelly_") :]: data[name] for name in data.files if name.startswith("kelly_")},
+                trade_returns=data["trade_returns"],
+                rng_state=rng_state,
+                seeded=bool(data["rng_seeded"]) if "rng_seeded" in data else False,
+                tz=str(data["tz"]) if "tz" in data else "",
+            )
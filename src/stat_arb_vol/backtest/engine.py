@@ -1,39 +1,150 @@
-"""Event-driven backtest engine for a single selected pair."""
+"""Event-driven backtest engine for a single selected pair or basket."""
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
 
 import numpy as np
 import pandas as pd
 import statsmodels.api as sm
 
+from stat_arb_vol.backtest.checkpoint import EngineState
+from stat_arb_vol.backtest.eventlog import FILL, MARKET, ORDER, SIGNAL, STATE, EventLogWriter
 from stat_arb_vol.backtest.events import FillEvent, OrderEvent
+from stat_arb_vol.backtest.ledger import FillLedger
 from stat_arb_vol.config import BacktestConfig
-from stat_arb_vol.risk.kelly import KellySizer
+from stat_arb_vol.kernels import python_impl, simulate_pair
+from stat_arb_vol.models.spread_cache import SpreadCache
+from stat_arb_vol.risk.kelly import KellySizer, KellyStatistics
 from stat_arb_vol.strategy.pairs_ou_strategy import PairsOUStrategy
 
 
 @dataclass
 class BacktestResult:
-    pair: tuple[str, str]
+    pair: tuple[str, ...]
     hedge_ratio: float
     equity_curve: pd.Series
     positions: pd.Series
     trade_returns: list[float] = field(default_factory=list)
+    ledger: FillLedger | None = None
+    weights: tuple[float, ...] | None = None
 
 
 class EventDrivenBacktester:
-    def __init__(self, prices: pd.DataFrame, pair: tuple[str, str], config: BacktestConfig) -> None:
+    """Bar-by-bar simulation of one pair, or of a basket when ``weights`` are given.
+
+    Basket weights (e.g. a Johansen eigenvector) define the spread as
+    ``prices[pair] @ weights`` and its return as the weighted leg returns,
+    normalized so the first leg has weight one; orders are sized on the first
+    leg as for pairs.
+
+    After ``run``, ``checkpoint()`` captures the loop state; ``resume`` builds
+    an engine that continues from it over newly appended bars only.
+
+    Slippage is drawn from the global ``np.random`` unless ``seed`` is given,
+    in which case the engine owns a ``RandomState(seed)`` and repeated runs
+    fill identically. ``run(event_log=...)`` records every bar's market,
+    signal, order, fill and state events for ``EventLog`` replay.
+    """
+
+    def __init__(
+        self,
+        prices: pd.DataFrame,
+        pair: tuple[str, ...],
+        config: BacktestConfig,
+        spread_cache: SpreadCache | None = None,
+        weights: tuple[float, ...] | None = None,
+        hedge_ratio: float | None = None,
+        seed: int | None = None,
+    ) -> None:
         self.prices = prices
         self.pair = pair
         self.config = config
         self.kelly = KellySizer()
+        self.kelly_stats = KellyStatistics(max_fraction=self.kelly.max_fraction, min_fraction=self.kelly.min_fraction)
         self.trade_returns: list[float] = []
+        self.ledger = FillLedger()
         self._entry_equity = None
+        self._resume_state: EngineState | None = None
+        self._live: dict | None = None
+        self.seed = seed
+        self._rng = np.random if seed is None else np.random.RandomState(seed)
+
+        if weights is None:
+            self.weights = None
+            self.hedge_ratio = self._estimate_hedge_ratio() if hedge_ratio is None else float(hedge_ratio)
+        else:
+            if len(weights) != len(pair) or weights[0] == 0:
+                raise ValueError("weights must have one non-zero-leading entry per leg")
+            self.weights = tuple(float(w) / weights[0] for w in weights)
+            self.hedge_ratio = -self.weights[1]
+        self.strategy = PairsOUStrategy(
+            prices=prices,
+            pair=pair,
+            hedge_ratio=self.hedge_ratio,
+            config=config,
+            spread_cache=spread_cache,
+            weights=self.weights,
+        )
+
+    @classmethod
+    def resume(
+        cls,
+        state: EngineState,
+        new_prices: pd.DataFrame,
+        spread_cache: SpreadCache | None = None,
+    ) -> EventDrivenBacktester:
+        """Engine that continues ``state`` over bars after ``state.last_timestamp``.
 
-        self.hedge_ratio = self._estimate_hedge_ratio()
-        self.strategy = PairsOUStrategy(prices=prices, pair=pair, hedge_ratio=self.hedge_ratio, config=config)
+        The hedge ratio / weights are reused, and the checkpoint's price tail
+        supplies the z-score window, so ``run`` only processes the new bars.
+        The random state saved with the checkpoint (the engine's own generator
+        when it was seeded, else the global ``np.random``) is restored, making
+        a resumed run fill exactly like one uninterrupted run.
+        """
+        new_prices = new_prices.loc[new_prices.index > state.last_timestamp, list(state.pair)]
+        prices = pd.concat([state.tail_frame(), new_prices])
+        engine = cls(
+            prices,
+            state.pair,
+            state.config,
+            spread_cache=spread_cache,
+            weights=state.weights,
+            hedge_ratio=state.hedge_ratio,
+        )
+        engine.strategy.position = state.strategy_position
+        engine.kelly_stats.set_state(state.kelly)
+        engine.trade_returns = [float(r) for r in state.trade_returns]
+        engine._entry_equity = state.entry_equity
+        engine._resume_state = state
+        if state.seeded:
+            engine._rng = np.random.RandomState()
+        if state.rng_state is not None:
+            engine._rng.set_state(state.rng_state)
+        return engine
+
+    def checkpoint(self) -> EngineState:
+        """Snapshot of the engine after ``run`` (see ``EngineState.save``)."""
+        if self._live is None:
+            raise RuntimeError("checkpoint() requires a completed run()")
+        tail = self.prices[list(self.pair)].iloc[-self.config.lookback :]
+        return EngineState(
+            pair=tuple(self.pair),
+            hedge_ratio=self.hedge_ratio,
+            weights=self.weights,
+            config=self.config,
+            entry_equity=self._entry_equity,
+            strategy_position=self.strategy.position,
+            tail_index=tail.index.as_unit("ns").asi8.copy(),
+            tail_prices=tail.to_numpy(dtype=np.float64, copy=True),
+            kelly=self.kelly_stats.get_state(),
+            trade_returns=np.asarray(self.trade_returns, dtype=np.float64),
+            rng_state=self._rng.get_state(),
+            seeded=self._rng is not np.random,
+            tz=str(tail.index.tz) if tail.index.tz is not None else "",
+            **self._live,
+        )
 
     def _estimate_hedge_ratio(self) -> float:
         x, y = self.pair
@@ -41,32 +152,76 @@ class EventDrivenBacktester:
         model = sm.OLS(aligned[x], sm.add_constant(aligned[y])).fit()
         return float(model.params.iloc[1])
 
-    def run(self) -> BacktestResult:
-        x, y = self.pair
+    def run(self, event_log: str | Path | EventLogWriter | None = None) -> BacktestResult:
+        """Simulate every bar; ``event_log`` (a directory or open writer, pairs only) receives all events."""
+        x, y = self.pair[:2]
+        legs = list(self.pair)
+        leg_weights = np.asarray(self.weights) if self.weights is not None else None
         idx = self.prices.index
-        equity = pd.Series(index=idx, dtype=float)
-        position_side = 0
+        state = self._resume_state
+        start = 1 if state is None else len(state.tail_index)
+        # Equity is an accumulator: float64 regardless of the storage precision.
+        equity = pd.Series(index=idx, dtype=np.float64)
+        positions = pd.Series(index=idx, dtype=np.float64)
         exposure = 0.0
-        current_qty = 0.0
-        cash = self.config.initial_capital
-        equity.iloc[0] = cash
-        positions = pd.Series(index=idx, dtype=float)
-        positions.iloc[0] = 0
-
         pending_order: OrderEvent | None = None
         pending_submit_time = None
+        log = self._open_log(event_log)
+        if log is not None:
+            stamps = idx.as_unit("ns").asi8
+            z_values = self.strategy.z.reindex(idx).to_numpy(dtype=np.float64)
+            bar_offset = 0 if state is None else state.bars - start
+        if state is None:
+            position_side = 0
+            current_qty = 0.0
+            cash = self.config.initial_capital
+            peak_equity, max_drawdown = cash, 0.0
+            equity.iloc[0] = cash
+            positions.iloc[0] = 0
+            if log is not None:
+                log.begin_bar(stamps[0])
+                first_prices = (float(self.prices[x].iloc[0]), float(self.prices[y].iloc[0]))
+                log.record(0, MARKET, stamps[0], 0, 0, (*first_prices, z_values[0], 0.0))
+                log.record(0, STATE, stamps[0], 0, 0, (cash, 0.0, peak_equity, 0.0, np.nan, np.nan))
+        else:
+            position_side = state.position_side
+            current_qty = state.quantity
+            cash = state.cash
+            peak_equity, max_drawdown = state.peak_equity, state.max_drawdown
+            if state.pending_side is not None:
+                pending_order = OrderEvent(idx[start - 1], self.pair, state.pending_side, state.pending_quantity)
+                pending_submit_time = start - 1 - state.pending_age
 
-        for i, ts in enumerate(idx[1:], start=1):
+        for i in range(start, len(idx)):
+            ts = idx[i]
             prev_ts = idx[i - 1]
-            ret_x = self.prices.loc[ts, x] / self.prices.loc[prev_ts, x] - 1
-            ret_y = self.prices.loc[ts, y] / self.prices.loc[prev_ts, y] - 1
-            pair_ret = ret_x - self.hedge_ratio * ret_y
+            price_x, price_y = float(self.prices.loc[ts, x]), float(self.prices.loc[ts, y])
+            ret_x = price_x / float(self.prices.loc[prev_ts, x]) - 1
+            ret_y = price_y / float(self.prices.loc[prev_ts, y]) - 1
+            if leg_weights is None:
+                pair_ret = ret_x - self.hedge_ratio * ret_y
+            else:
+                leg_rets = (
+                    self.prices.loc[ts, legs].to_numpy(dtype=np.float64)
+                    / self.prices.loc[prev_ts, legs].to_numpy(dtype=np.float64)
+                    - 1
+                )
+                pair_ret = float(leg_rets @ leg_weights)
+
+            if log is not None:
+                bar = i + bar_offset
+                log.begin_bar(stamps[i])
+                log.record(bar, MARKET, stamps[i], 0, 0, (price_x, price_y, z_values[i], pair_ret))
 
             pnl = position_side * current_qty * pair_ret
             cash *= 1 + pnl
 
             if pending_order and (i - pending_submit_time) >= self.config.latency_bars:
                 fill = self._execute_order(pending_order, ts)
+                self.ledger.record(fill)
+                if log is not None:
+                    values = (fill.quantity, *fill.fill_prices[:2], fill.fee, fill.slippage_bps)
+                    log.record(bar, FILL, stamps[i], fill.side, 0, values)
                 position_side = fill.side
                 current_qty = fill.quantity
                 cash -= fill.fee
@@ -75,45 +230,164 @@ class EventDrivenBacktester:
                     self._entry_equity = cash
                 elif self._entry_equity is not None and self._entry_equity > 0:
                     self.trade_returns.append(cash / self._entry_equity - 1)
+                    self.kelly_stats.update(self.trade_returns[-1])
                     self._entry_equity = None
 
             signal = self.strategy.on_bar(ts)
+            if log is not None and signal is not None:
+                log.record(bar, SIGNAL, stamps[i], signal.side, int(pending_order is not None), (signal.strength,))
             if signal is not None and pending_order is None:
-                drawdown = self._compute_drawdown(equity.iloc[:i].ffill())
-                kelly_fraction = self.kelly.fraction(self.trade_returns)
+                drawdown = max_drawdown
+                kelly_fraction = self.kelly_stats.fraction()
                 size_fraction = self.kelly.apply_drawdown_limit(
                     drawdown, kelly_fraction, self.config.max_drawdown_limit
                 )
                 exposure = max(size_fraction * cash, 0.0)
-                qty = exposure / max(self.prices.loc[ts, x], 1e-8)
+                qty = exposure / max(float(self.prices.loc[ts, x]), 1e-8)
                 pending_order = OrderEvent(ts, self.pair, signal.side, qty)
                 pending_submit_time = i
+                if log is not None:
+                    log.record(bar, ORDER, stamps[i], signal.side, 0, (qty, size_fraction, exposure))
 
             equity.iloc[i] = cash
             positions.iloc[i] = position_side
+            if cash > peak_equity:
+                peak_equity = cash
+            if peak_equity != 0:
+                max_drawdown = max(max_drawdown, (peak_equity - cash) / peak_equity)
+            if log is not None:
+                log.record(
+                    bar,
+                    STATE,
+                    stamps[i],
+                    position_side,
+                    0 if pending_order is None else pending_order.side + 2,
+                    (
+                        cash,
+                        current_qty,
+                        peak_equity,
+                        max_drawdown,
+                        np.nan if pending_order is None else pending_order.quantity,
+                        np.nan if self._entry_equity is None else self._entry_equity,
+                    ),
+                )
+
+        if log is not None and not isinstance(event_log, EventLogWriter):
+            log.close()
+
+        end = len(idx) - 1
+        self._live = {
+            "bars": len(idx) if state is None else state.bars + len(idx) - start,
+            "cash": cash,
+            "position_side": position_side,
+            "quantity": current_qty,
+            "pending_side": None if pending_order is None else pending_order.side,
+            "pending_quantity": 0.0 if pending_order is None else pending_order.quantity,
+            "pending_age": 0 if pending_order is None else end - pending_submit_time,
+            "peak_equity": peak_equity,
+            "max_drawdown": max_drawdown,
+        }
+        first = 0 if state is None else start
+        return BacktestResult(
+            pair=self.pair,
+            hedge_ratio=self.hedge_ratio,
+            equity_curve=equity.iloc[first:].ffill(),
+            positions=positions.iloc[first:].ffill(),
+            trade_returns=self.trade_returns,
+            ledger=self.ledger,
+            weights=self.weights,
+        )
+
+    def run_kernel(self, use_jit: bool = True) -> BacktestResult:
+        """Array-kernel equivalent of ``run`` (Numba-compiled when available).
+
+        Slippage is pre-drawn from the engine's generator in fill order, so the
+        same seed gives the same fills as ``run``. Two-leg pairs only.
+        """
+        if self.weights is not None:
+            raise ValueError("run_kernel does not support basket weights; use run()")
+        if self._resume_state is not None:
+            raise ValueError("run_kernel cannot resume from a checkpoint; use run()")
+        x, y = self.pair
+        idx = self.prices.index
+        kernel = simulate_pair if use_jit else python_impl(simulate_pair)
+        slippage = self._rng.uniform(self.config.slippage_bps_min, self.config.slippage_bps_max, size=len(idx))
+        (
+            equity,
+            positions,
+            fill_bar,
+            fill_side,
+            fill_qty,
+            fill_px,
+            fill_py,
+            fill_fee,
+            fill_slip,
+            n_fills,
+            trade_returns,
+            n_trades,
+        ) = kernel(
+            self.prices[x].to_numpy(dtype=np.float64),
+            self.prices[y].to_numpy(dtype=np.float64),
+            self.strategy.z.to_numpy(dtype=np.float64),
+            self.hedge_ratio,
+            self.config.entry_z,
+            self.config.exit_z,
+            self.config.stop_z,
+            self.config.latency_bars,
+            self.config.initial_capital,
+            self.config.transaction_cost_bps,
+            self.config.max_drawdown_limit,
+            self.kelly.min_fraction,
+            self.kelly.max_fraction,
+            slippage,
+        )
+
+        for k in range(n_fills):
+            self.ledger.record(
+                FillEvent(
+                    idx[fill_bar[k]],
+                    self.pair,
+                    int(fill_side[k]),
+                    float(fill_qty[k]),
+                    (float(fill_px[k]), float(fill_py[k])),
+                    float(fill_fee[k]),
+                    float(fill_slip[k]),
+                )
+            )
+        self.trade_returns.extend(trade_returns[:n_trades].tolist())
+        for trade_return in trade_returns[:n_trades]:
+            self.kelly_stats.update(trade_return)
 
         return BacktestResult(
             pair=self.pair,
             hedge_ratio=self.hedge_ratio,
-            equity_curve=equity.ffill(),
-            positions=positions.ffill(),
+            equity_curve=pd.Series(equity, index=idx),
+            positions=pd.Series(positions, index=idx),
             trade_returns=self.trade_returns,
+            ledger=self.ledger,
         )
 
+    def _open_log(self, event_log: str | Path | EventLogWriter | None) -> EventLogWriter | None:
+        if event_log is None:
+            return None
+        if len(self.pair) > 2:
+            raise ValueError(f"event logs record two legs per fill; {len(self.pair)}-leg baskets are not supported")
+        if isinstance(event_log, EventLogWriter):
+            return event_log
+        meta = {
+            "pair": list(self.pair),
+            "hedge_ratio": self.hedge_ratio,
+            "weights": self.weights,
+            "seed": self.seed,
+            "config": asdict(self.config),
+        }
+        return EventLogWriter(event_log, meta=meta, append=self._resume_state is not None)
+
     def _execute_order(self, order: OrderEvent, ts: pd.Timestamp) -> FillEvent:
-        x, y = order.pair
-        base_prices = (self.prices.loc[ts, x], self.prices.loc[ts, y])
-        slip_bps = np.random.uniform(self.config.slippage_bps_min, self.config.slippage_bps_max)
+        base_prices = [float(self.prices.loc[ts, leg]) for leg in order.pair]
+        slip_bps = self._rng.uniform(self.config.slippage_bps_min, self.config.slippage_bps_max)
         slip_mult = 1 + (slip_bps / 10_000) * np.sign(order.side)
-        fill_prices = (base_prices[0] * slip_mult, base_prices[1] * slip_mult)
+        fill_prices = tuple(price * slip_mult for price in base_prices)
         notional = abs(order.quantity * fill_prices[0])
         fee = notional * (self.config.transaction_cost_bps / 10_000)
-        return FillEvent(ts, order.pair, order.side, order.quantity, fill_prices, fee)
-
-    @staticmethod
-    def _compute_drawdown(equity: pd.Series) -> float:
-        if equity.empty:
-            return 0.0
-        peak = equity.cummax()
-        dd = (peak - equity) / peak.replace(0, np.nan)
-        return float(dd.max(skipna=True) if len(dd) else 0.0)
+        return FillEvent(ts, order.pair, order.side, order.quantity, fill_prices, fee, slip_bps)
@@ -0,0 +1,191 @@
+"""Append-only binary event log of a backtest run with an index for random-access replay."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+EVENTLOG_VERSION = 1
+MARKET, SIGNAL, ORDER, FILL, STATE = range(5)
+KIND_NAMES = {MARKET: "market", SIGNAL: "signal", ORDER: "order", FILL: "fill", STATE: "state"}
+
+# 64-byte little-endian records; the meaning of v0..v5 depends on ``kind``:
+#   market: price_x, price_y, z, spread return
+#   signal: strength (|z|)
+#   order:  quantity, Kelly fraction after drawdown limit, exposure
+#   fill:   quantity, fill price x, fill price y, fee, slippage bps
+#   state:  cash, quantity, peak equity, max drawdown, pending quantity (NaN if none), entry equity
+# ``side`` carries the signal/order/fill side, or the position side for state
+# records (whose ``flags`` holds the pending order's side + 2, 0 if none).
+EVENT_DTYPE = np.dtype(
+    [
+        ("bar", "<i4"),
+        ("kind", "u1"),
+        ("side", "i1"),
+        ("flags", "<u2"),
+        ("timestamp", "<i8"),
+        ("v0", "<f8"),
+        ("v1", "<f8"),
+        ("v2", "<f8"),
+        ("v3", "<f8"),
+        ("v4", "<f8"),
+        ("v5", "<f8"),
+    ]
+)
+_PAD = (np.nan,) * 6
+INDEX_DTYPE = np.dtype([("timestamp", "<i8"), ("offset", "<i8")])
+FIELD_NAMES = {
+    MARKET: ("price_x", "price_y", "z", "spread_return"),
+    SIGNAL: ("strength",),
+    ORDER: ("quantity", "fraction", "exposure"),
+    FILL: ("quantity", "price_x", "price_y", "fee", "slippage_bps"),
+    STATE: ("cash", "quantity", "peak_equity", "max_drawdown", "pending_quantity", "entry_equity"),
+}
+
+
+class EventLogWriter:
+    """Buffered writer of fixed-width event records plus a per-bar index.
+
+    ``events.bin`` holds the records, ``index.bin`` one ``(timestamp,
+    record offset)`` entry per bar and ``meta.json`` the run description.
+    Both binary files are only ever appended to (``append=True`` continues
+    a log, e.g. after ``EventDrivenBacktester.resume``).
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        meta: dict | None = None,
+        append: bool = False,
+        buffer_records: int = 4096,
+    ) -> None:
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        events_path, index_path = self.path / "events.bin", self.path / "index.bin"
+        if append and events_path.exists():
+            self._records = events_path.stat().st_size // EVENT_DTYPE.itemsize
+        else:
+            self._records = 0
+            (self.path / "meta.json").write_text(
+                json.dumps({"version": EVENTLOG_VERSION, **(meta or {})}, default=str), encoding="utf-8"
+            )
+        mode = "ab" if append else "wb"
+        self._events = events_path.open(mode)
+        self._index = index_path.open(mode)
+        self._buffer = np.zeros(buffer_records, dtype=EVENT_DTYPE)
+        self._size = 0
+
+    def __enter__(self) -> EventLogWriter:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def begin_bar(self, timestamp: int) -> None:
+        """Mark the start of a bar (``timestamp`` in ns since epoch) in the index."""
+        self._index.write(np.array([(timestamp, self._records + self._size)], dtype=INDEX_DTYPE).tobytes())
+
+    def record(
+        self, bar: int, kind: int, timestamp: int, side: int = 0, flags: int = 0, values: tuple[float, ...] = ()
+    ) -> None:
+        if self._size == len(self._buffer):
+            self.flush()
+        self._buffer[self._size] = (bar, kind, side, flags, timestamp, *values, *_PAD[len(values) :])
+        self._size += 1
+
+    def flush(self) -> None:
+        if self._size:
+            self._events.write(self._buffer[: self._size].tobytes())
+            self._records += self._size
+            self._size = 0
+        self._events.flush()
+        self._index.flush()
+
+    def close(self) -> None:
+        if not self._events.closed:
+            self.flush()
+            self._events.close()
+            self._index.close()
+
+
+class EventLog:
+    """Memory-mapped reader: seek to any bar through the index without rerunning the backtest."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.meta = json.loads((self.path / "meta.json").read_text(encoding="utf-8"))
+        if self.meta.get("version") != EVENTLOG_VERSION:
+            raise ValueError(f"unsupported event log version {self.meta.get('version')}")
+        self.records = self._map("events.bin", EVENT_DTYPE)
+        self.index = self._map("index.bin", INDEX_DTYPE)
+
+    def _map(self, name: str, dtype: np.dtype) -> np.ndarray:
+        path = self.path / name
+        if path.stat().st_size == 0:
+            return np.zeros(0, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode="r")
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def bars(self) -> int:
+        return len(self.index)
+
+    def bar_of(self, timestamp: str | pd.Timestamp) -> int:
+        """Last bar at or before ``timestamp``."""
+        bar = int(np.searchsorted(self.index["timestamp"], pd.Timestamp(timestamp).value, side="right")) - 1
+        if bar < 0:
+            raise KeyError(f"{timestamp} precedes the first logged bar")
+        return bar
+
+    def events(self, bar: int) -> np.ndarray:
+        """Records written while processing ``bar`` (a view into the mapped file)."""
+        if not 0 <= bar < self.bars:
+            raise IndexError(f"bar {bar} outside [0, {self.bars})")
+        start = int(self.index["offset"][bar])
+        end = int(self.index["offset"][bar + 1]) if bar + 1 < self.bars else len(self.records)
+        return self.records[start:end]
+
+    def state_at(self, bar: int) -> dict[str, float | int | None]:
+        """Engine state at the end of ``bar``: position, cash, pending order, drawdown."""
+        rec = self.events(bar)
+        rec = rec[rec["kind"] == STATE][-1]
+        state = {
+            "bar": int(rec["bar"]),
+            "timestamp": pd.Timestamp(int(rec["timestamp"])),
+            "position_side": int(rec["side"]),
+            "pending_side": None if rec["flags"] == 0 else int(rec["flags"]) - 2,
+        }
+        state.update({name: float(rec[f"v{k}"]) for k, name in enumerate(FIELD_NAMES[STATE])})
+        return state
+
+    def frame(self, kind: int | None = None, start: int = 0, end: int | None = None) -> pd.DataFrame:
+        """Decoded records for bars ``[start, end)``, optionally of one ``kind``, with named value columns."""
+        end = self.bars if end is None else min(end, self.bars)
+        lo = int(self.index["offset"][start]) if start < self.bars else len(self.records)
+        hi = int(self.index["offset"][end]) if end < self.bars else len(self.records)
+        rec = self.records[lo:hi]
+        if kind is not None:
+            rec = rec[rec["kind"] == kind]
+        frame = pd.DataFrame(
+            {
+                "bar": rec["bar"],
+                "timestamp": pd.to_datetime(rec["timestamp"], unit="ns"),
+                "kind": pd.Categorical.from_codes(rec["kind"], categories=list(KIND_NAMES.values())),
+                "side": rec["side"],
+            }
+        )
+        names = FIELD_NAMES[kind] if kind is not None else tuple(f"v{k}" for k in range(6))
+        for k, name in enumerate(names):
+            frame[name] = rec[f"v{k}"]
+        return frame
+
+    def equity_curve(self) -> pd.Series:
+        states = self.records[self.records["kind"] == STATE]
+        return pd.Series(
+            np.asarray(states["v0"]), index=pd.DatetimeIndex(np.asarray(states["timestamp"]).astype("datetime64[ns]"))
+        )
@@ -2,33 +2,39 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import pandas as pd
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class MarketEvent:
-    timestamp: object
+    timestamp: pd.Timestamp
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SignalEvent:
-    timestamp: object
-    pair: tuple[str, str]
+    timestamp: pd.Timestamp
+    pair: tuple[str, ...]
     side: int  # +1 long spread, -1 short spread, 0 flat
     strength: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OrderEvent:
-    timestamp: object
-    pair: tuple[str, str]
+    timestamp: pd.Timestamp
+    pair: tuple[str, ...]
     side: int
     quantity: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FillEvent:
-    timestamp: object
-    pair: tuple[str, str]
+    timestamp: pd.Timestamp
+    pair: tuple[str, ...]
     side: int
     quantity: float
-    fill_prices: tuple[float, float]
+    fill_prices: tuple[float, ...]
     fee: float
+    slippage_bps: float = 0.0
+
+
+Event = MarketEvent | SignalEvent | OrderEvent | FillEvent
@@ -0,0 +1,308 @@
+"""Tick-level intraday simulation ordered by nanosecond timestamps through a heap scheduler."""
+
+from __future__ import annotations
+
+import heapq
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from stat_arb_vol.backtest.engine import BacktestResult
+from stat_arb_vol.backtest.events import FillEvent
+from stat_arb_vol.backtest.ledger import FillLedger
+from stat_arb_vol.data.ticks import TickChunk
+from stat_arb_vol.models.ou import RollingZScore
+from stat_arb_vol.risk.kelly import KellySizer, KellyStatistics
+from stat_arb_vol.strategy.pairs_ou_strategy import PairsOUStrategy
+
+QUOTE, SIGNAL, ARRIVAL, FILL = range(4)
+
+
+@dataclass(frozen=True)
+class LatencyModel:
+    """Latency in ns: ``floor_ns`` plus a ``constant``, ``exponential`` or ``lognormal`` part with mean ``mean_ns``."""
+
+    mean_ns: float = 0.0
+    distribution: str = "constant"
+    sigma: float = 0.5
+    floor_ns: int = 0
+
+    def __post_init__(self) -> None:
+        if self.distribution not in ("constant", "exponential", "lognormal"):
+            raise ValueError(f"unknown latency distribution {self.distribution!r}")
+
+    @property
+    def is_zero(self) -> bool:
+        return self.floor_ns == 0 and self.mean_ns == 0
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        if self.mean_ns == 0 or self.distribution == "constant":
+            extra = np.full(size, self.mean_ns)
+        elif self.distribution == "exponential":
+            extra = rng.exponential(self.mean_ns, size)
+        else:
+            extra = rng.lognormal(np.log(self.mean_ns) - self.sigma**2 / 2, self.sigma, size)
+        return self.floor_ns + extra.astype(np.int64)
+
+
+@dataclass(frozen=True)
+class LegLatency:
+    """Per-leg latencies: tick to strategy (``feed``), order to venue (``order``), fill report back (``ack``)."""
+
+    feed: LatencyModel = LatencyModel()
+    order: LatencyModel = LatencyModel()
+    ack: LatencyModel = LatencyModel()
+
+
+class _Draws:
+    """Values pre-sampled in blocks, so the event loop pays one list pop per draw."""
+
+    __slots__ = ("sample", "block", "values")
+
+    def __init__(self, sample, block: int = 4096) -> None:
+        self.sample = sample
+        self.block = block
+        self.values: list = []
+
+    def __call__(self):
+        if not self.values:
+            self.values = self.sample(self.block).tolist()
+        return self.values.pop()
+
+
+@dataclass
+class SchedulerStats:
+    ticks: int = 0
+    quotes: int = 0
+    signals: int = 0
+    orders: int = 0
+    fills: int = 0
+    max_heap: int = 0
+    seconds: float = 0.0
+
+    @property
+    def events(self) -> int:
+        return self.ticks + self.quotes + self.signals + self.orders + self.fills
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / self.seconds if self.seconds else 0.0
+
+
+class IntradayBacktester:
+    """Simulate one pair tick by tick, with fills delayed by sampled per-leg latencies instead of whole bars.
+
+    ``ticks`` yields chunks of ``(timestamp_ns, leg, price)`` in exchange time
+    order, ``leg`` indexing ``strategy.pair``. A tick moves the venue price at
+    once and reaches the strategy after its leg's ``feed`` latency. At most
+    every ``sample_ns`` a quote updates the rolling z-score and
+    ``strategy.on_z`` (signal timestamps are ns integers). If the target side
+    differs from the held side and nothing is in flight, a signal is decided
+    ``signal_latency`` later. Each leg's order then reaches the venue after
+    its ``order`` latency and fills there at the current venue price plus
+    slippage. The fill report returns after the ``ack`` latency, so legs
+    can fill at different moments. ``config.latency_bars`` is not used.
+
+    Ticks are read chunk by chunk and never enter the heap. Only in-flight
+    events are queued: quotes inside their feed latency, signals, orders and
+    fill reports. Equity is sampled every ``record_ns``, so memory does not
+    grow with the number of events.
+    """
+
+    def __init__(
+        self,
+        strategy: PairsOUStrategy,
+        ticks: Iterable[TickChunk],
+        latency: LegLatency | dict[str, LegLatency] | None = None,
+        signal_latency: LatencyModel | None = None,
+        sample_ns: int = 1_000_000_000,
+        record_ns: int = 60_000_000_000,
+        seed: int | None = None,
+    ) -> None:
+        if len(strategy.pair) != 2 or strategy.weights is not None:
+            raise ValueError("IntradayBacktester simulates two-leg pairs")
+        self.strategy = strategy
+        self.pair = tuple(strategy.pair)
+        self.config = strategy.config
+        self.ticks = ticks
+        latency = latency if latency is not None else LegLatency()
+        self.latency = [latency[leg] if isinstance(latency, dict) else latency for leg in self.pair]
+        self.signal_latency = signal_latency or LatencyModel()
+        self.sample_ns = sample_ns
+        self.record_ns = record_ns
+        self.rng = np.random.default_rng(seed)
+        self.kelly = KellySizer()
+        self.kelly_stats = KellyStatistics(max_fraction=self.kelly.max_fraction, min_fraction=self.kelly.min_fraction)
+        self.zscore = RollingZScore.from_history(strategy.spread.to_numpy(dtype=float), self.config.lookback)
+        self.trade_returns: list[float] = []
+        self.ledger = FillLedger()
+        self.stats = SchedulerStats()
+
+    def _draws(self, model: LatencyModel) -> _Draws | None:
+        return None if model.is_zero else _Draws(lambda n: model.sample(self.rng, n))
+
+    def run(self) -> BacktestResult:
+        cfg = self.config
+        strategy, hedge, stats = self.strategy, self.strategy.hedge_ratio, self.stats
+        feed = [self._draws(leg.feed) for leg in self.latency]
+        order_delay = [self._draws(leg.order) for leg in self.latency]
+        ack_delay = [self._draws(leg.ack) for leg in self.latency]
+        signal_delay = self._draws(self.signal_latency)
+        slippage = _Draws(lambda n: self.rng.uniform(cfg.slippage_bps_min, cfg.slippage_bps_max, n))
+        fee_rate = cfg.transaction_cost_bps / 10_000
+        heap: list[tuple] = []
+        push, pop = heapq.heappush, heapq.heappop
+        seq = 0
+
+        venue = [np.nan, np.nan]  # latest exchange prices (fills, marking)
+        seen = [np.nan, np.nan]  # latest prices the strategy has received
+        units = [0.0, 0.0]
+        cash = cfg.initial_capital
+        held_side, pending_side, in_flight = 0, 0, 0
+        entry_equity: float | None = None
+        peak_equity, max_drawdown = cash, 0.0
+        next_sample = next_record = None
+        record_ts: list[int] = []
+        record_equity: list[float] = []
+        record_side: list[int] = []
+
+        source = iter(self.ticks)
+        stamps = legs = prices = ()
+        pos = n = 0
+        last_stamp = None
+        exhausted = False
+        started = time.perf_counter()
+        while True:
+            if pos == n and not exhausted:
+                chunk = next(source, None)
+                if chunk is None:
+                    exhausted = True
+                    continue
+                ts_array = np.asarray(chunk[0], dtype=np.int64)
+                if len(ts_array) and (
+                    np.any(ts_array[1:] < ts_array[:-1]) or (last_stamp is not None and ts_array[0] < last_stamp)
+                ):
+                    raise ValueError("ticks must be in non-decreasing timestamp order")
+                if len(ts_array):
+                    last_stamp = int(ts_array[-1])
+                stamps, legs, prices = ts_array.tolist(), np.asarray(chunk[1]).tolist(), np.asarray(chunk[2]).tolist()
+                pos, n = 0, len(stamps)
+                continue
+
+            if len(heap) > stats.max_heap:
+                stats.max_heap = len(heap)
+            if pos < n and (not heap or stamps[pos] <= heap[0][0]):
+                now, leg, value = stamps[pos], legs[pos], prices[pos]
+                pos += 1
+                kind = -1
+            elif heap:
+                now, _, kind, leg, value = pop(heap)
+            else:
+                break
+
+            if next_record is None:
+                next_record = next_sample = now
+            while now >= next_record:
+                equity = cash + (units[0] and units[0] * venue[0]) + (units[1] and units[1] * venue[1])
+                record_ts.append(next_record)
+                record_equity.append(equity)
+                record_side.append(held_side)
+                if equity > peak_equity:
+                    peak_equity = equity
+                if peak_equity > 0:
+                    max_drawdown = max(max_drawdown, (peak_equity - equity) / peak_equity)
+                next_record += self.record_ns
+
+            if kind == -1:
+                stats.ticks += 1
+                venue[leg] = value
+                if feed[leg] is not None:
+                    push(heap, (now + feed[leg](), seq, QUOTE, leg, value))
+                    seq += 1
+                    continue
+                kind = QUOTE
+
+            if kind == QUOTE:
+                stats.quotes += 1
+                seen[leg] = value
+                if now < next_sample or seen[0] != seen[0] or seen[1] != seen[1]:
+                    continue
+                next_sample = now + self.sample_ns
+                z = self.zscore.update(seen[0] - hedge * seen[1])
+                if strategy.on_z(now, z) is not None:
+                    stats.signals += 1
+                if in_flight or strategy.position == held_side:
+                    continue
+                in_flight = -1  # decision pending; becomes the number of legs in flight
+                delay = signal_delay() if signal_delay is not None else 0
+                push(heap, (now + delay, seq, SIGNAL, -1, float(strategy.position)))
+                seq += 1
+
+            elif kind == SIGNAL:
+                pending_side = int(value)
+                equity = cash + units[0] * seen[0] + units[1] * seen[1]
+                if pending_side:
+                    fraction = self.kelly.apply_drawdown_limit(
+                        max_drawdown, self.kelly_stats.fraction(), cfg.max_drawdown_limit
+                    )
+                    qty = max(fraction * equity, 0.0) / max(seen[0], 1e-8)
+                    target = (pending_side * qty, -pending_side * hedge * qty)
+                else:
+                    target = (0.0, 0.0)
+                in_flight = 0
+                for k in (0, 1):
+                    delta = target[k] - units[k]
+                    if delta:
+                        delay = order_delay[k]() if order_delay[k] is not None else 0
+                        push(heap, (now + delay, seq, ARRIVAL, k, delta))
+                        seq += 1
+                        in_flight += 1
+                        stats.orders += 1
+                if not in_flight:
+                    held_side = pending_side
+
+            elif kind == ARRIVAL:
+                slip_bps = slippage()
+                side = 1 if value > 0 else -1
+                fill_price = venue[leg] * (1 + slip_bps / 10_000 * side)
+                fee = abs(value * fill_price) * fee_rate
+                cash -= value * fill_price + fee
+                units[leg] += value
+                self.ledger.record(
+                    FillEvent(pd.Timestamp(now), (self.pair[leg],), side, abs(value), (fill_price,), fee, slip_bps)
+                )
+                delay = ack_delay[leg]() if ack_delay[leg] is not None else 0
+                push(heap, (now + delay, seq, FILL, leg, value))
+                seq += 1
+
+            else:  # FILL report reaches the strategy
+                stats.fills += 1
+                in_flight -= 1
+                if in_flight:
+                    continue
+                held_side = pending_side
+                equity = cash + units[0] * seen[0] + units[1] * seen[1]
+                if held_side:
+                    entry_equity = equity
+                elif entry_equity is not None and entry_equity > 0:
+                    self.trade_returns.append(equity / entry_equity - 1)
+                    self.kelly_stats.update(self.trade_returns[-1])
+                    entry_equity = None
+
+        if record_ts and now > record_ts[-1]:
+            record_ts.append(now)
+            record_equity.append(cash + (units[0] and units[0] * venue[0]) + (units[1] and units[1] * venue[1]))
+            record_side.append(held_side)
+        stats.seconds = time.perf_counter() - started
+        index = pd.DatetimeIndex(np.asarray(record_ts, dtype=np.int64).astype("datetime64[ns]"))
+        return BacktestResult(
+            pair=self.pair,
+            hedge_ratio=hedge,
+            equity_curve=pd.Series(record_equity, index=index, dtype=np.float64),
+            positions=pd.Series(record_side, index=index, dtype=np.float64),
+            trade_returns=self.trade_returns,
+            ledger=self.ledger,
+        )
@@ -0,0 +1,170 @@
+"""Columnar fill ledger recorded by the backtest engine."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from stat_arb_vol.backtest.events import FillEvent
+
+LEDGER_COLUMNS: dict[str, np.dtype] = {
+    "timestamp": np.dtype("int64"),  # ns since epoch (UTC)
+    "pair_id": np.dtype("int32"),
+    "side": np.dtype("int8"),
+    "quantity": np.dtype("float64"),
+    "price_x": np.dtype("float64"),
+    "price_y": np.dtype("float64"),
+    "fee": np.dtype("float64"),
+    "slippage_bps": np.dtype("float64"),
+}
+
+
+class FillLedger:
+    """Struct-of-arrays fill store that grows by doubling.
+
+    Each column is its own contiguous array so views can be handed to Arrow
+    without copying; pair labels are dictionary-encoded via ``pair_id``.
+    Basket legs beyond ``price_y`` go, in fill order, to the flat
+    ``extra_prices`` array (``len(pair) - 2`` values per fill).
+    """
+
+    def __init__(self, capacity: int = 256) -> None:
+        self._columns = {name: np.empty(max(capacity, 1), dtype=dtype) for name, dtype in LEDGER_COLUMNS.items()}
+        self._size = 0
+        self._extra = np.empty(0, dtype=np.float64)
+        self._extra_size = 0
+        self.pairs: list[tuple[str, ...]] = []
+        self._pair_ids: dict[tuple[str, ...], int] = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return len(self._columns["timestamp"])
+
+    def record(self, fill: FillEvent) -> None:
+        if len(fill.fill_prices) != len(fill.pair):
+            raise ValueError(f"fill for {fill.pair} has {len(fill.fill_prices)} prices, expected one per leg")
+        if self._size == self.capacity:
+            self._grow(2 * self.capacity)
+        pair_id = self._pair_ids.get(fill.pair)
+        if pair_id is None:
+            pair_id = self._pair_ids[fill.pair] = len(self.pairs)
+            self.pairs.append(fill.pair)
+        extra = fill.fill_prices[2:]
+        if extra:
+            end = self._extra_size + len(extra)
+            if end > len(self._extra):
+                grown = np.empty(max(end, 2 * len(self._extra)), dtype=np.float64)
+                grown[: self._extra_size] = self._extra[: self._extra_size]
+                self._extra = grown
+            self._extra[self._extra_size : end] = extra
+            self._extra_size = end
+
+        i = self._size
+        cols = self._columns
+        cols["timestamp"][i] = pd.Timestamp(fill.timestamp).as_unit("ns").value
+        cols["pair_id"][i] = pair_id
+        cols["side"][i] = fill.side
+        cols["quantity"][i] = fill.quantity
+        cols["price_x"][i] = fill.fill_prices[0]
+        cols["price_y"][i] = fill.fill_prices[1] if len(fill.fill_prices) > 1 else np.nan
+        cols["fee"][i] = fill.fee
+        cols["slippage_bps"][i] = fill.slippage_bps
+        self._size += 1
+
+    def column(self, name: str) -> np.ndarray:
+        return self._columns[name][: self._size]
+
+    def columns(self) -> dict[str, np.ndarray]:
+        return {name: self.column(name) for name in LEDGER_COLUMNS}
+
+    @property
+    def extra_prices(self) -> np.ndarray:
+        return self._extra[: self._extra_size]
+
+    def leg_prices(self) -> np.ndarray:
+        """``(fills, max legs)`` fill prices, NaN-padded for fills with fewer legs."""
+        legs = np.array([len(p) for p in self.pairs], dtype=np.int64)[self.column("pair_id")]
+        width = int(legs.max()) if self._size else 2
+        out = np.full((self._size, max(width, 2)), np.nan)
+        out[:, 0] = self.column("price_x")
+        out[:, 1] = self.column("price_y")
+        if width > 2:
+            extra = np.maximum(legs - 2, 0)
+            rows = np.repeat(np.arange(self._size), extra)
+            starts = np.repeat(np.cumsum(extra) - extra, extra)
+            out[rows, 2 + np.arange(len(rows)) - starts] = self.extra_prices
+        return out
+
+    @classmethod
+    def from_columns(
+        cls,
+        columns: dict[str, np.ndarray],
+        pairs: list[tuple[str, ...]],
+        extra_prices: np.ndarray | None = None,
+    ) -> FillLedger:
+        size = len(columns["timestamp"])
+        ledger = cls(capacity=size)
+        for name, dtype in LEDGER_COLUMNS.items():
+            ledger._columns[name][:size] = np.asarray(columns[name], dtype=dtype)
+        ledger._size = size
+        ledger.pairs = [tuple(p) for p in pairs]
+        ledger._pair_ids = {p: i for i, p in enumerate(ledger.pairs)}
+        if extra_prices is not None:
+            ledger._extra = np.array(extra_prices, dtype=np.float64)
+            ledger._extra_size = len(ledger._extra)
+        return ledger
+
+    def _leg_columns(self) -> dict[str, np.ndarray]:
+        """``price_leg2``, ``price_leg3``, ... for basket fills (empty for pairs)."""
+        prices = self.leg_prices()
+        return {f"price_leg{k}": prices[:, k] for k in range(2, prices.shape[1])}
+
+    def to_frame(self) -> pd.DataFrame:
+        cols = self.columns()
+        frame = pd.DataFrame({name: values for name, values in cols.items() if name not in ("timestamp", "pair_id")})
+        for name, values in self._leg_columns().items():
+            frame.insert(frame.columns.get_loc("fee"), name, values)
+        frame.insert(0, "pair", pd.Categorical.from_codes(cols["pair_id"], categories=["/".join(p) for p in self.pairs]))
+        frame.insert(0, "timestamp", pd.to_datetime(cols["timestamp"], unit="ns"))
+        return frame
+
+    def to_arrow(self):
+        try:
+            import pyarrow as pa
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise ImportError("FillLedger.to_arrow requires pyarrow (pip install pyarrow)") from exc
+
+        cols = self.columns()
+        arrays = {
+            "timestamp": pa.array(cols["timestamp"]).view(pa.timestamp("ns")),
+            "pair": pa.DictionaryArray.from_arrays(
+                pa.array(cols["pair_id"]), pa.array(["/".join(p) for p in self.pairs], type=pa.string())
+            ),
+        }
+        for name in ("side", "quantity", "price_x", "price_y"):
+            arrays[name] = pa.array(cols[name])
+        for name, values in self._leg_columns().items():
+            arrays[name] = pa.array(values)
+        for name in ("fee", "slippage_bps"):
+            arrays[name] = pa.array(cols[name])
+        return pa.table(arrays)
+
+    def to_parquet(self, path: str | Path) -> None:
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise ImportError("FillLedger.to_parquet requires pyarrow (pip install pyarrow)") from exc
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(self.to_arrow(), path)
+
+    def _grow(self, capacity: int) -> None:
+        for name, values in self._columns.items():
+            grown = np.empty(capacity, dtype=values.dtype)
+            grown[: self._size] = values[: self._size]
+            self._columns[name] = grown
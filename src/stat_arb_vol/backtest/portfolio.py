@@ -0,0 +1,310 @@
+"""Multi-pair backtest whose execution stage nets orders across shared legs."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+import statsmodels.api as sm
+
+from stat_arb_vol.backtest.events import FillEvent, OrderEvent
+from stat_arb_vol.backtest.ledger import FillLedger
+from stat_arb_vol.config import BacktestConfig
+from stat_arb_vol.data.align import forward_fill
+from stat_arb_vol.models.spread_cache import SpreadCache
+from stat_arb_vol.risk.budget import EWMACovariance, RiskBudgetSizer
+from stat_arb_vol.risk.kelly import KellySizer, KellyStatistics
+from stat_arb_vol.strategy.pairs_ou_strategy import PairsOUStrategy
+
+
+@dataclass
+class LegOrder:
+    """One book's order expanded into signed unit changes per symbol."""
+
+    book: int
+    order: OrderEvent
+    symbols: np.ndarray
+    deltas: np.ndarray
+
+
+@dataclass
+class ExecutionReport:
+    fills: list[FillEvent]
+    leg_prices: list[np.ndarray]
+    leg_fees: list[np.ndarray]
+    slippage_cost: float
+
+
+class NettingExecution:
+    """Execution stage that fills a bar's orders as one net quantity per symbol.
+
+    Each ``LegOrder`` contributes its signed unit changes; opposing changes in
+    a symbol cross internally at the bar price and only the residual is
+    filled, paying slippage and ``transaction_cost_bps`` once. Every book is
+    allocated the symbol's execution price and a share of its fee in
+    proportion to the units it traded. With ``netting=False`` each order leg
+    fills on its own, as independent single-pair engines would. Slippage is
+    drawn from ``rng`` (default: the global ``np.random``).
+    """
+
+    def __init__(
+        self, symbols: list[str], config: BacktestConfig, netting: bool = True, rng: np.random.RandomState | None = None
+    ) -> None:
+        self.symbols = symbols
+        self.config = config
+        self.netting = netting
+        self.rng = np.random if rng is None else rng
+        self._net = np.zeros(len(symbols))
+        self._gross = np.zeros(len(symbols))
+
+    def _fill(self, ts: pd.Timestamp, symbol: int, delta: float, price: float) -> tuple[FillEvent, float]:
+        slip_bps = self.rng.uniform(self.config.slippage_bps_min, self.config.slippage_bps_max)
+        fill_price = price * (1 + (slip_bps / 10_000) * np.sign(delta))
+        fee = abs(delta) * fill_price * (self.config.transaction_cost_bps / 10_000)
+        side = 1 if delta > 0 else -1
+        return FillEvent(ts, (self.symbols[symbol],), side, abs(delta), (fill_price,), fee, slip_bps), fill_price
+
+    def execute(self, ts: pd.Timestamp, prices: np.ndarray, orders: list[LegOrder]) -> ExecutionReport:
+        fills: list[FillEvent] = []
+        slippage_cost = 0.0
+        if not self.netting:
+            leg_prices, leg_fees = [], []
+            for leg in orders:
+                px, fees = np.empty(len(leg.symbols)), np.zeros(len(leg.symbols))
+                for k, (symbol, delta) in enumerate(zip(leg.symbols, leg.deltas)):
+                    px[k] = prices[symbol]
+                    if delta != 0:
+                        fill, px[k] = self._fill(ts, symbol, delta, prices[symbol])
+                        fees[k] = fill.fee
+                        fills.append(fill)
+                        slippage_cost += abs(delta) * abs(px[k] - prices[symbol])
+                leg_prices.append(px)
+                leg_fees.append(fees)
+            return ExecutionReport(fills, leg_prices, leg_fees, slippage_cost)
+
+        net, gross = self._net, self._gross
+        net[:] = 0.0
+        gross[:] = 0.0
+        for leg in orders:
+            np.add.at(net, leg.symbols, leg.deltas)
+            np.add.at(gross, leg.symbols, np.abs(leg.deltas))
+        exec_price = prices.astype(np.float64, copy=True)
+        fee_per_unit = np.zeros(len(net))
+        for symbol in np.flatnonzero(net):
+            fill, exec_price[symbol] = self._fill(ts, symbol, net[symbol], prices[symbol])
+            fills.append(fill)
+            fee_per_unit[symbol] = fill.fee / gross[symbol]
+            slippage_cost += abs(net[symbol]) * abs(exec_price[symbol] - prices[symbol])
+        leg_prices = [exec_price[leg.symbols] for leg in orders]
+        leg_fees = [fee_per_unit[leg.symbols] * np.abs(leg.deltas) for leg in orders]
+        return ExecutionReport(fills, leg_prices, leg_fees, slippage_cost)
+
+
+@dataclass
+class PortfolioResult:
+    pairs: list[tuple[str, str]]
+    hedge_ratios: list[float]
+    equity_curve: pd.Series
+    positions: pd.DataFrame
+    trade_returns: list[list[float]] = field(default_factory=list)
+    ledger: FillLedger | None = None
+    orders: int = 0
+    leg_orders: int = 0
+    fills: int = 0
+    fees: float = 0.0
+    slippage_cost: float = 0.0
+    traded_notional: float = 0.0
+
+
+class PortfolioBacktester:
+    """Bar-by-bar simulation of several pairs sharing one account.
+
+    Each pair runs its own ``PairsOUStrategy`` and Kelly book (capital split
+    evenly across books, throttled by the account drawdown) and targets
+    ``side * qty`` units of x against ``-side * hedge * qty`` units of y.
+    Orders due on a bar go through ``NettingExecution`` together, so pairs
+    sharing a leg trade only their net per-symbol quantity. Holdings are
+    marked to market in cash and units; trade returns per book feed Kelly.
+    Symbols may list at different dates: a book only trades (and its
+    strategy only advances) on bars where both of its legs have a price.
+    As in ``EventDrivenBacktester``, ``seed`` gives the execution stage its
+    own ``RandomState`` so repeated runs fill identically.
+
+    With a ``sizer``, every bar's per-book spread returns update an
+    ``EWMACovariance``. Once it is ready, entries are sized by
+    ``RiskBudgetSizer.fractions`` across the books that hold or are entering
+    positions, with Kelly fractions as risk budgets, instead of an even
+    capital split.
+    """
+
+    def __init__(
+        self,
+        prices: pd.DataFrame,
+        pairs: list[tuple[str, str]],
+        config: BacktestConfig,
+        hedge_ratios: list[float] | None = None,
+        spread_cache: SpreadCache | None = None,
+        netting: bool = True,
+        seed: int | None = None,
+        sizer: RiskBudgetSizer | None = None,
+        covariance: EWMACovariance | None = None,
+    ) -> None:
+        self.pairs = [tuple(pair) for pair in pairs]
+        self.symbols = list(dict.fromkeys(symbol for pair in self.pairs for symbol in pair))
+        self.prices = prices[self.symbols].dropna(how="all")
+        self.config = config
+        self.kelly = KellySizer()
+        self.kelly_stats = KellyStatistics(
+            len(self.pairs), max_fraction=self.kelly.max_fraction, min_fraction=self.kelly.min_fraction
+        )
+        self.ledger = FillLedger()
+        self.seed = seed
+        rng = None if seed is None else np.random.RandomState(seed)
+        self.execution = NettingExecution(self.symbols, config, netting=netting, rng=rng)
+        if hedge_ratios is None:
+            hedge_ratios = [self._estimate_hedge_ratio(pair) for pair in self.pairs]
+        self.hedge_ratios = [float(h) for h in hedge_ratios]
+        self.sizer = sizer
+        self.covariance = covariance if covariance is not None or sizer is None else EWMACovariance(len(self.pairs))
+        self.strategies = [
+            PairsOUStrategy(self.prices[list(pair)].dropna(), pair, hedge, config, spread_cache=spread_cache)
+            for pair, hedge in zip(self.pairs, self.hedge_ratios)
+        ]
+
+    def _estimate_hedge_ratio(self, pair: tuple[str, str]) -> float:
+        x, y = pair
+        aligned = self.prices[[x, y]].dropna()
+        model = sm.OLS(aligned[x], sm.add_constant(aligned[y])).fit()
+        return float(model.params.iloc[1])
+
+    def run(self) -> PortfolioResult:
+        config = self.config
+        idx = self.prices.index
+        raw = self.prices.to_numpy(dtype=np.float64)
+        # Marks carry the last price forward; before a symbol lists it has no units, so 0 is harmless.
+        prices = np.nan_to_num(forward_fill(raw.copy()))
+        z = np.column_stack(
+            [strategy.z.reindex(idx).fillna(0.0).to_numpy(dtype=np.float64) for strategy in self.strategies]
+        )
+        n_books = len(self.pairs)
+        column = {symbol: j for j, symbol in enumerate(self.symbols)}
+        legs = [np.array([column[x], column[y]]) for x, y in self.pairs]
+        listed = np.column_stack([np.isfinite(raw[:, leg]).all(axis=1) for leg in legs])
+        leg_x, leg_y = np.array([leg[0] for leg in legs]), np.array([leg[1] for leg in legs])
+        hedges = np.asarray(self.hedge_ratios)
+        leg_columns = np.concatenate(legs)
+        book_share = 1.0 / n_books
+
+        cash = config.initial_capital
+        units = np.zeros((n_books, 2))
+        book_cash = np.zeros(n_books)
+        entry_value = np.full(n_books, np.nan)
+        entry_equity = np.full(n_books, np.nan)
+        sides = np.zeros(n_books, dtype=np.int64)
+        pending: list[OrderEvent | None] = [None] * n_books
+        submitted = np.zeros(n_books, dtype=np.int64)
+        trade_returns: list[list[float]] = [[] for _ in range(n_books)]
+
+        equity = np.empty(len(idx))
+        positions = np.zeros((len(idx), n_books))
+        equity[0] = cash
+        peak_equity, max_drawdown = cash, 0.0
+        n_orders = n_leg_orders = n_fills = 0
+        fees = slippage_cost = traded = 0.0
+
+        for i in range(1, len(idx)):
+            ts = idx[i]
+            row = prices[i]
+
+            due = []
+            for book in range(n_books):
+                order = pending[book]
+                if order is not None and listed[i, book] and i - submitted[book] >= config.latency_bars:
+                    target = order.side * order.quantity * np.array([1.0, -self.hedge_ratios[book]])
+                    due.append(LegOrder(book, order, legs[book], target - units[book]))
+                    pending[book] = None
+            if due:
+                report = self.execution.execute(ts, row, due)
+                for fill in report.fills:
+                    self.ledger.record(fill)
+                    fees += fill.fee
+                    traded += fill.quantity * fill.fill_prices[0]
+                n_fills += len(report.fills)
+                n_orders += len(due)
+                n_leg_orders += sum(int(np.count_nonzero(leg.deltas)) for leg in due)
+                slippage_cost += report.slippage_cost
+                for leg, px, fee in zip(due, report.leg_prices, report.leg_fees):
+                    flow = float(leg.deltas @ px + fee.sum())
+                    book_cash[leg.book] -= flow
+                    cash -= flow
+                    units[leg.book] += leg.deltas
+                    sides[leg.book] = leg.order.side
+                marked = cash + float(units.ravel() @ row[leg_columns])
+                for leg in due:
+                    book = leg.book
+                    value = book_cash[book] + float(units[book] @ row[legs[book]])
+                    if sides[book] != 0:
+                        entry_value[book] = value
+                        entry_equity[book] = marked
+                    elif entry_equity[book] > 0:
+                        trade_return = (value - entry_value[book]) / entry_equity[book]
+                        trade_returns[book].append(trade_return)
+                        self.kelly_stats.update(trade_return, book)
+                        entry_value[book] = entry_equity[book] = np.nan
+
+            value = cash + float(units.ravel() @ row[leg_columns])
+            if self.covariance is not None:
+                with np.errstate(invalid="ignore"):
+                    step = raw[i] / raw[i - 1] - 1
+                self.covariance.update(step[leg_x] - hedges * step[leg_y])
+
+            new_orders = []
+            for book, strategy in enumerate(self.strategies):
+                if not listed[i, book]:
+                    continue
+                signal = strategy.on_z(ts, z[i, book])
+                if signal is not None and pending[book] is None:
+                    new_orders.append((book, signal.side))
+            if new_orders:
+                raw_fractions = self.kelly_stats.fractions() * book_share
+                if self.sizer is not None and self.covariance.ready:
+                    targets = sides.copy()
+                    for book, order in enumerate(pending):
+                        if order is not None:
+                            targets[book] = order.side
+                    for book, side in new_orders:
+                        targets[book] = side
+                    raw_fractions = self.sizer.fractions(
+                        self.covariance, targets != 0, budgets=self.kelly_stats.fractions(), sides=targets
+                    )
+                for book, side in new_orders:
+                    fraction = self.kelly.apply_drawdown_limit(
+                        max_drawdown, raw_fractions[book], config.max_drawdown_limit
+                    )
+                    exposure = max(fraction * value, 0.0)
+                    qty = exposure / max(row[legs[book][0]], 1e-8)
+                    pending[book] = OrderEvent(ts, self.pairs[book], side, qty)
+                    submitted[book] = i
+
+            equity[i] = value
+            positions[i] = sides
+            if value > peak_equity:
+                peak_equity = value
+            if peak_equity != 0:
+                max_drawdown = max(max_drawdown, (peak_equity - value) / peak_equity)
+
+        return PortfolioResult(
+            pairs=self.pairs,
+            hedge_ratios=self.hedge_ratios,
+            equity_curve=pd.Series(equity, index=idx),
+            positions=pd.DataFrame(positions, index=idx, columns=["/".join(pair) for pair in self.pairs]),
+            trade_returns=trade_returns,
+            ledger=self.ledger,
+            orders=n_orders,
+            leg_orders=n_leg_orders,
+            fills=n_fills,
+            fees=fees,
+            slippage_cost=slippage_cost,
+            traded_notional=traded,
+        )
@@ -0,0 +1,115 @@
+"""Single-pass alignment of per-symbol price series onto a common calendar."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from stat_arb_vol.precision import storage_dtype
+
+
+@dataclass
+class AlignedPanel:
+    """Prices on one calendar plus a bit-packed validity mask per symbol.
+
+    ``values`` is a ``(bars, symbols)`` array in the storage dtype of
+    ``stat_arb_vol.precision`` that is NaN wherever a
+    symbol is not yet listed or its gap exceeded the fill limit;
+    ``valid_bits`` holds the same information as ``np.packbits`` rows (one
+    bit per bar), so callers can carry listing dates around cheaply.
+    """
+
+    index: pd.DatetimeIndex
+    symbols: tuple[str, ...]
+    values: np.ndarray
+    valid_bits: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def _column(self, symbol: str) -> int:
+        return self.symbols.index(symbol)
+
+    def valid(self, symbol: str) -> np.ndarray:
+        return np.unpackbits(self.valid_bits[self._column(symbol)], count=len(self.index)).astype(bool)
+
+    def common_valid(self, symbols: tuple[str, ...] | list[str]) -> np.ndarray:
+        """Bars on which every symbol in ``symbols`` has a price."""
+        bits = np.bitwise_and.reduce(self.valid_bits[[self._column(s) for s in symbols]], axis=0)
+        return np.unpackbits(bits, count=len(self.index)).astype(bool)
+
+    def listing_dates(self) -> dict[str, pd.Timestamp | None]:
+        out: dict[str, pd.Timestamp | None] = {}
+        for symbol in self.symbols:
+            first = np.flatnonzero(self.valid(symbol))
+            out[symbol] = self.index[first[0]] if len(first) else None
+        return out
+
+    def frame(self) -> pd.DataFrame:
+        """The whole panel as a DataFrame backed by ``values`` (no copy)."""
+        return pd.DataFrame(self.values, index=self.index, columns=list(self.symbols), copy=False)
+
+    def window(self, symbols: tuple[str, ...] | list[str], start: pd.Timestamp | None = None) -> pd.DataFrame:
+        """Prices for ``symbols`` on bars where all of them are valid (from ``start``)."""
+        mask = self.common_valid(symbols)
+        if start is not None:
+            mask &= self.index >= start
+        columns = [self._column(s) for s in symbols]
+        return pd.DataFrame(self.values[np.ix_(mask, columns)], index=self.index[mask], columns=list(symbols))
+
+
+def forward_fill(values: np.ndarray, max_gap: int | None = None) -> np.ndarray:
+    """Forward-fill NaNs down each column in place, at most ``max_gap`` bars past an observation."""
+    observed = ~np.isnan(values)
+    rows = np.arange(values.shape[0])[:, None]
+    last = np.where(observed, rows, -1)
+    np.maximum.accumulate(last, axis=0, out=last)
+    fill = ~observed & (last >= 0)
+    if max_gap is not None:
+        fill &= rows - last <= max_gap
+    fill_rows, fill_cols = np.nonzero(fill)
+    values[fill_rows, fill_cols] = values[last[fill_rows, fill_cols], fill_cols]
+    return values
+
+
+def align_prices(
+    series: Mapping[str, pd.Series] | pd.DataFrame,
+    freq: str = "D",
+    max_gap: int | None = 3,
+    start: str | pd.Timestamp | None = None,
+    end: str | pd.Timestamp | None = None,
+) -> AlignedPanel:
+    """Place every symbol on one ``freq`` calendar in a single preallocated array.
+
+    Observations are floored to the calendar (last one wins), gaps of up to
+    ``max_gap`` bars are forward-filled in place (``None`` fills without
+    limit), and bars before a symbol's first observation stay invalid instead
+    of truncating the rest of the universe.
+    """
+    if isinstance(series, pd.DataFrame):
+        series = {column: series[column] for column in series.columns}
+    symbols = tuple(series)
+    observed = [s.dropna() for s in series.values()]
+    first = min((s.index.min() for s in observed if len(s)), default=None)
+    last = max((s.index.max() for s in observed if len(s)), default=None)
+    start = pd.Timestamp(start) if start is not None else first
+    end = pd.Timestamp(end) if end is not None else last
+    if start is None or end is None:
+        index = pd.DatetimeIndex([])
+    else:
+        index = pd.date_range(pd.Timestamp(start).floor(freq), pd.Timestamp(end).floor(freq), freq=freq)
+
+    values = np.full((len(index), len(symbols)), np.nan, dtype=storage_dtype())
+    for j, s in enumerate(observed):
+        if not len(s):
+            continue
+        positions = index.get_indexer(pd.DatetimeIndex(s.index).floor(freq))
+        keep = positions >= 0
+        values[positions[keep], j] = s.to_numpy(dtype=values.dtype)[keep]
+
+    forward_fill(values, max_gap)
+    valid_bits = np.packbits(~np.isnan(values).T, axis=1)
+    return AlignedPanel(index=index, symbols=symbols, values=values, valid_bits=valid_bits)
@@ -8,6 +8,9 @@ from dataclasses import dataclass
 import numpy as np
 import pandas as pd
 
+from stat_arb_vol.data.align import AlignedPanel, align_prices
+from stat_arb_vol.precision import to_storage
+
 LOGGER = logging.getLogger(__name__)
 
 COINGECKO_IDS = {
@@ -28,14 +31,19 @@ class DataLoader:
 
     def load_prices(self) -> pd.DataFrame:
         """Load close prices indexed by daily date."""
-        real = self._download_coingecko()
-        if real is not None and not real.empty:
-            return real.ffill().dropna(how="all")
+        return self.load_panel(max_gap=None).frame()
+
+    def load_panel(self, max_gap: int | None = 3, use_mock_only: bool = False) -> AlignedPanel:
+        """Load close prices aligned on a daily calendar with per-symbol validity masks."""
+        real = None if use_mock_only else self._download_series()
+        if real:
+            return align_prices(real, freq="D", max_gap=max_gap)
 
-        LOGGER.warning("Falling back to simulated GBM + latent factor data.")
-        return self._simulate_prices()
+        if not use_mock_only:
+            LOGGER.warning("Falling back to simulated GBM + latent factor data.")
+        return align_prices(self._simulate_prices(), freq="D", max_gap=max_gap)
 
-    def _download_coingecko(self) -> pd.DataFrame | None:
+    def _download_series(self) -> dict[str, pd.Series]:
         start = pd.Timestamp(self.start_date)
         end = pd.Timestamp(self.end_date)
         days = max((end - start).days, 365)
@@ -61,9 +69,7 @@ class DataLoader:
             except Exception as exc:  # pragma: no cover - network-dependent
                 LOGGER.warning("Could not download %s from CoinGecko: %s", symbol, exc)
 
-        if not out:
-            return None
-        return pd.DataFrame(out).sort_index()
+        return out
 
     def _simulate_prices(self, seed: int = 7) -> pd.DataFrame:
         rng = np.random.default_rng(seed)
@@ -78,4 +84,4 @@ class DataLoader:
             log_price = np.log(100 + i * 20) + drift * np.arange(len(dates)) + 0.95 * latent + 0.05 * idio
             out[symbol] = np.exp(log_price)
 
-        return pd.DataFrame(out, index=dates)
+        return to_storage(pd.DataFrame(out, index=dates))
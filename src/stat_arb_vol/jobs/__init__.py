@@ -0,0 +1 @@
+"""subpackage"""
@@ -0,0 +1,250 @@
+"""Task brokers: a SQLite table shared by workers, or a TCP coordinator in front of one."""
+
+from __future__ import annotations
+
+import json
+import socket
+import socketserver
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from stat_arb_vol.jobs.tasks import Task
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    task_id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    lease_until REAL,
+    result TEXT,
+    error TEXT,
+    submitted_at REAL NOT NULL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, submitted_at);
+"""
+
+
+class SQLiteBroker:
+    """Task queue and result table in one SQLite file.
+
+    ``submit`` ignores task ids that already exist, so sweeps are idempotent.
+    ``claim`` hands out the oldest pending task (or one whose lease expired)
+    under ``BEGIN IMMEDIATE``, so many worker processes can share the file.
+    Failed tasks return to ``pending`` until ``max_attempts`` is reached.
+    """
+
+    def __init__(self, path: str | Path = "jobs.db", lease_seconds: float = 600.0, max_attempts: int = 3) -> None:
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def submit(self, tasks: list[Task]) -> list[str]:
+        now = time.time()
+        rows = [(t.task_id, t.kind, json.dumps(t.payload, sort_keys=True), now) for t in tasks]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO tasks (task_id, kind, payload, submitted_at) VALUES (?, ?, ?, ?)", rows
+            )
+        return [t.task_id for t in tasks]
+
+    def claim(self, worker: str) -> Task | None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "UPDATE tasks SET status = 'failed', error = 'lease expired', finished_at = ? "
+                    "WHERE status = 'running' AND lease_until < ? AND attempts >= ?",
+                    (now, now, self.max_attempts),
+                )
+                row = self._conn.execute(
+                    "SELECT task_id, kind, payload, attempts FROM tasks "
+                    "WHERE status = 'pending' OR (status = 'running' AND lease_until < ?) "
+                    "ORDER BY submitted_at, task_id LIMIT 1",
+                    (now,),
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute(
+                        "UPDATE tasks SET status = 'running', attempts = attempts + 1, worker = ?, lease_until = ? "
+                        "WHERE task_id = ?",
+                        (worker, now + self.lease_seconds, row[0]),
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        if row is None:
+            return None
+        return Task(row[0], row[1], json.loads(row[2]), row[3] + 1)
+
+    def complete(self, task_id: str, worker: str, result: dict[str, Any]) -> bool:
+        """Store a result; ignored (returns False) if the lease moved to another worker."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE tasks SET status = 'done', result = ?, error = NULL, finished_at = ? "
+                "WHERE task_id = ? AND status = 'running' AND worker = ?",
+                (json.dumps(result), time.time(), task_id, worker),
+            )
+        return cursor.rowcount == 1
+
+    def fail(self, task_id: str, worker: str, error: str) -> bool:
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE tasks SET error = ?, lease_until = NULL, "
+                "status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+                "finished_at = CASE WHEN attempts >= ? THEN ? ELSE NULL END "
+                "WHERE task_id = ? AND status = 'running' AND worker = ?",
+                (error, self.max_attempts, self.max_attempts, time.time(), task_id, worker),
+            )
+        return cursor.rowcount == 1
+
+    def counts(self) -> dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM tasks GROUP BY status").fetchall()
+        return {status: count for status, count in rows}
+
+    def results(self, kind: str | None = None) -> list[dict[str, Any]]:
+        query = "SELECT task_id, kind, payload, status, attempts, worker, result, error FROM tasks"
+        params: tuple = ()
+        if kind is not None:
+            query += " WHERE kind = ?"
+            params = (kind,)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY submitted_at, task_id", params).fetchall()
+        return [
+            {
+                "task_id": task_id,
+                "kind": kind_,
+                "payload": json.loads(payload),
+                "status": status,
+                "attempts": attempts,
+                "worker": worker,
+                "result": json.loads(result) if result else None,
+                "error": error,
+            }
+            for task_id, kind_, payload, status, attempts, worker, result, error in rows
+        ]
+
+
+def results_frame(rows: list[dict[str, Any]]) -> pd.DataFrame:
+    """Flatten ``results()`` rows (payload and result fields become dotted columns)."""
+    return pd.json_normalize(rows)
+
+
+_REMOTE_METHODS = ("submit", "claim", "complete", "fail", "counts", "results")
+
+
+class _CoordinatorHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        broker: SQLiteBroker = self.server.broker  # type: ignore[attr-defined]
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                method = request["method"]
+                if method not in _REMOTE_METHODS:
+                    raise ValueError(f"unknown method {method!r}")
+                args = request.get("args", [])
+                if method == "submit":
+                    args = [[Task(**t) for t in args[0]]]
+                value = getattr(broker, method)(*args)
+                if isinstance(value, Task):
+                    value = value.__dict__
+                reply = {"ok": value}
+            except Exception as exc:  # report to the client instead of dropping the connection
+                reply = {"error": f"{type(exc).__name__}: {exc}"}
+            self.wfile.write(json.dumps(reply).encode() + b"\n")
+
+
+class Coordinator(socketserver.ThreadingTCPServer):
+    """TCP front for a ``SQLiteBroker`` speaking newline-delimited JSON.
+
+    Lets workers on other machines share one queue without a shared
+    filesystem; ``RemoteBroker`` is the matching client.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, broker: SQLiteBroker, host: str = "127.0.0.1", port: int = 8765) -> None:
+        super().__init__((host, port), _CoordinatorHandler)
+        self.broker = broker
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"tcp://{host}:{port}"
+
+    def serve_in_background(self) -> threading.Thread:
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return thread
+
+
+class RemoteBroker:
+    """Client for ``Coordinator`` with the same methods as ``SQLiteBroker``."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765, timeout: float = 60.0) -> None:
+        self._sock = socket.create_connection((host, port), timeout=timeout)
+        self._file = self._sock.makefile("rwb")
+
+    def close(self) -> None:
+        self._file.close()
+        self._sock.close()
+
+    def _call(self, method: str, *args: Any) -> Any:
+        self._file.write(json.dumps({"method": method, "args": list(args)}).encode() + b"\n")
+        self._file.flush()
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError("coordinator closed the connection")
+        reply = json.loads(line)
+        if "error" in reply:
+            raise RuntimeError(f"coordinator error: {reply['error']}")
+        return reply["ok"]
+
+    def submit(self, tasks: list[Task]) -> list[str]:
+        return self._call("submit", [t.__dict__ for t in tasks])
+
+    def claim(self, worker: str) -> Task | None:
+        value = self._call("claim", worker)
+        return Task(**value) if value is not None else None
+
+    def complete(self, task_id: str, worker: str, result: dict[str, Any]) -> bool:
+        return self._call("complete", task_id, worker, result)
+
+    def fail(self, task_id: str, worker: str, error: str) -> bool:
+        return self._call("fail", task_id, worker, error)
+
+    def counts(self) -> dict[str, int]:
+        return self._call("counts")
+
+    def results(self, kind: str | None = None) -> list[dict[str, Any]]:
+        return self._call("results", kind)
+
+
+def connect(url: str, **kwargs: Any) -> SQLiteBroker | RemoteBroker:
+    """Broker from ``sqlite:///path/to/jobs.db`` or ``tcp://host:port``."""
+    if url.startswith("sqlite:///"):
+        return SQLiteBroker(url[len("sqlite:///") :], **kwargs)
+    if url.startswith("tcp://"):
+        host, _, port = url[len("tcp://") :].rpartition(":")
+        return RemoteBroker(host or "127.0.0.1", int(port), **kwargs)
+    raise ValueError(f"unsupported broker url {url!r}; use sqlite:///path or tcp://host:port")
@@ -0,0 +1,102 @@
+"""Units of work for distributed sweeps: backtests and pair selection."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Any
+
+import pandas as pd
+
+from stat_arb_vol.analytics.metrics import compute_metrics
+from stat_arb_vol.backtest.engine import EventDrivenBacktester
+from stat_arb_vol.config import BacktestConfig, UniverseConfig
+from stat_arb_vol.data.loader import DataLoader
+from stat_arb_vol.models.cointegration import CointegrationSelector
+
+
+@dataclass
+class Task:
+    task_id: str
+    kind: str
+    payload: dict[str, Any]
+    attempts: int = 0
+
+
+def make_task_id(kind: str, payload: dict[str, Any]) -> str:
+    """Content hash of ``(kind, payload)``; resubmitting the same work is a no-op."""
+    body = json.dumps({"kind": kind, "payload": payload}, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(body.encode()).hexdigest()[:32]
+
+
+def make_task(kind: str, payload: dict[str, Any]) -> Task:
+    if kind not in TASK_KINDS:
+        raise ValueError(f"unknown task kind {kind!r}; expected one of {sorted(TASK_KINDS)}")
+    return Task(make_task_id(kind, payload), kind, payload)
+
+
+@lru_cache(maxsize=8)
+def load_prices(source: str) -> pd.DataFrame:
+    """Price panel for a task's ``data`` field: ``"mock"`` or a CSV/Parquet path visible to the worker."""
+    if source == "mock":
+        universe = UniverseConfig()
+        loader = DataLoader(universe.symbols, universe.start_date, universe.end_date)
+        return loader.load_panel(use_mock_only=True).frame()
+    if source.endswith(".parquet"):
+        return pd.read_parquet(source)
+    return pd.read_csv(source, index_col=0, parse_dates=True)
+
+
+def _window(prices: pd.DataFrame, window: str, config: BacktestConfig) -> pd.DataFrame:
+    cutoff = prices.index.max() - pd.DateOffset(months=config.out_of_sample_months)
+    if window == "train":
+        return prices.loc[prices.index < cutoff]
+    if window == "test":
+        return prices.loc[prices.index >= cutoff]
+    if window == "all":
+        return prices
+    raise ValueError(f"unknown window {window!r}")
+
+
+def run_backtest_task(payload: dict[str, Any]) -> dict[str, Any]:
+    """``{"data", "pair", "config"?, "window"?, "weights"?, "seed"?}`` -> hedge ratio, metrics, trade count.
+
+    Slippage is drawn from ``RandomState(seed)`` (default 0), so a retried task
+    reproduces the result stored under its content-hashed id.
+    """
+    config = replace(BacktestConfig(), **payload.get("config", {}))
+    pair = tuple(payload["pair"])
+    prices = _window(load_prices(payload.get("data", "mock")), payload.get("window", "test"), config)
+    prices = prices[list(pair)].dropna()
+    weights = payload.get("weights")
+    result = EventDrivenBacktester(
+        prices, pair, config, weights=tuple(weights) if weights else None, seed=int(payload.get("seed", 0))
+    ).run()
+    return {
+        "pair": list(pair),
+        "hedge_ratio": result.hedge_ratio,
+        "trades": len(result.trade_returns),
+        "final_equity": float(result.equity_curve.iloc[-1]),
+        "metrics": compute_metrics(result.equity_curve, result.trade_returns, annualization=config.annualization),
+    }
+
+
+def run_selection_task(payload: dict[str, Any]) -> dict[str, Any]:
+    """``{"data", "significance"?, "window"?, "symbols"?}`` -> Engle-Granger pairs sorted by p-value."""
+    prices = _window(load_prices(payload.get("data", "mock")), payload.get("window", "train"), BacktestConfig())
+    if "symbols" in payload:
+        prices = prices[list(payload["symbols"])]
+    candidates = CointegrationSelector(significance=payload.get("significance", 0.05)).select_pairs(prices)
+    return {"pairs": [{"pair": [c.asset_x, c.asset_y], "pvalue": c.pvalue, "score": c.score} for c in candidates]}
+
+
+TASK_KINDS = {
+    "backtest": run_backtest_task,
+    "select": run_selection_task,
+}
+
+
+def run_task(task: Task) -> dict[str, Any]:
+    return TASK_KINDS[task.kind](task.payload)
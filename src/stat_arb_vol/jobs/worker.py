@@ -0,0 +1,73 @@
+"""Worker loop that claims tasks from a broker and records their results."""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import socket
+import time
+import traceback
+
+from stat_arb_vol.jobs.broker import RemoteBroker, SQLiteBroker, connect
+from stat_arb_vol.jobs.tasks import run_task
+
+LOGGER = logging.getLogger(__name__)
+
+
+class Worker:
+    def __init__(
+        self,
+        broker: SQLiteBroker | RemoteBroker,
+        worker_id: str | None = None,
+        poll_interval: float = 0.5,
+        idle_timeout: float | None = 5.0,
+    ) -> None:
+        self.broker = broker
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.poll_interval = poll_interval
+        self.idle_timeout = idle_timeout
+        self.completed = 0
+        self.failed = 0
+
+    def run(self, max_tasks: int | None = None) -> int:
+        """Process tasks until the queue stays empty for ``idle_timeout`` seconds."""
+        idle_since = time.monotonic()
+        while max_tasks is None or self.completed + self.failed < max_tasks:
+            task = self.broker.claim(self.worker_id)
+            if task is None:
+                if self.idle_timeout is not None and time.monotonic() - idle_since > self.idle_timeout:
+                    break
+                time.sleep(self.poll_interval)
+                continue
+            try:
+                result = run_task(task)
+            except Exception:
+                LOGGER.warning("task %s (attempt %d) failed", task.task_id, task.attempts, exc_info=True)
+                self.broker.fail(task.task_id, self.worker_id, traceback.format_exc(limit=5))
+                self.failed += 1
+            else:
+                self.broker.complete(task.task_id, self.worker_id, result)
+                self.completed += 1
+            idle_since = time.monotonic()
+        return self.completed
+
+
+def main(url: str, idle_timeout: float | None = 5.0, max_tasks: int | None = None) -> None:
+    broker = connect(url)
+    worker = Worker(broker, idle_timeout=idle_timeout)
+    try:
+        worker.run(max_tasks=max_tasks)
+    finally:
+        broker.close()
+    LOGGER.info("worker %s: %d done, %d failed", worker.worker_id, worker.completed, worker.failed)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a sweep worker against a job broker")
+    parser.add_argument("broker", help="sqlite:///path/to/jobs.db or tcp://host:port")
+    parser.add_argument("--idle-timeout", type=float, default=5.0, help="exit after this many idle seconds")
+    parser.add_argument("--max-tasks", type=int, default=None)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    main(args.broker, idle_timeout=args.idle_timeout, max_tasks=args.max_tasks)
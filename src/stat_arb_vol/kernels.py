@@ -0,0 +1,257 @@
+"""Optional Numba-compiled kernels for the sequential parts of the backtest.
+
+When Numba is installed the loops below are JIT-compiled; otherwise the same
+functions run as plain Python over NumPy arrays (and rolling statistics use a
+vectorized sliding-window path), so both paths produce the same state
+machine output. ``NUMBA_AVAILABLE`` reports which path is active.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on environment
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+def python_impl(fn):
+    """Return the uncompiled implementation of a kernel (for benchmarks)."""
+    return getattr(fn, "py_func", fn)
+
+
+@njit(cache=True)
+def _rolling_mean_std_jit(values: np.ndarray, lookback: int) -> tuple[np.ndarray, np.ndarray]:
+    n = values.shape[0]
+    mean = np.full(n, np.nan)
+    std = np.full(n, np.nan)
+    for i in range(lookback - 1, n):
+        total = 0.0
+        for j in range(i - lookback + 1, i + 1):
+            total += values[j]
+        m = total / lookback
+        sq = 0.0
+        for j in range(i - lookback + 1, i + 1):
+            d = values[j] - m
+            sq += d * d
+        mean[i] = m
+        std[i] = np.sqrt(sq / lookback)
+    return mean, std
+
+
+def _rolling_mean_std_numpy(values: np.ndarray, lookback: int, block: int = 65_536) -> tuple[np.ndarray, np.ndarray]:
+    n = values.shape[0]
+    mean = np.full(n, np.nan)
+    std = np.full(n, np.nan)
+    if n < lookback:
+        return mean, std
+    windows = sliding_window_view(values, lookback)
+    for start in range(0, len(windows), block):
+        chunk = windows[start : start + block]
+        m = chunk.mean(axis=1)
+        mean[lookback - 1 + start : lookback - 1 + start + len(chunk)] = m
+        std[lookback - 1 + start : lookback - 1 + start + len(chunk)] = np.sqrt(
+            ((chunk - m[:, None]) ** 2).mean(axis=1)
+        )
+    return mean, std
+
+
+def rolling_mean_std(values: np.ndarray, lookback: int, use_jit: bool | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """Rolling mean and population std (``ddof=0``); NaN until the window fills."""
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    if use_jit is None:
+        use_jit = NUMBA_AVAILABLE
+    if use_jit:
+        return _rolling_mean_std_jit(values, lookback)
+    return _rolling_mean_std_numpy(values, lookback)
+
+
+def rolling_zscore(values: np.ndarray, lookback: int, use_jit: bool | None = None) -> np.ndarray:
+    """Array counterpart of ``OUModel.rolling_zscore`` (zero where undefined)."""
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    mean, std = rolling_mean_std(values, lookback, use_jit=use_jit)
+    std[std == 0] = np.nan
+    z = (values - mean) / std
+    z[np.isnan(z)] = 0.0
+    return z
+
+
+@njit(cache=True)
+def _next_position(position: int, z: float, entry_z: float, exit_z: float, stop_z: float) -> int:
+    if position == 0:
+        if z > entry_z:
+            return -1
+        if z < -entry_z:
+            return 1
+    elif position == 1:
+        if z >= -exit_z or z < -stop_z:
+            return 0
+    elif position == -1:
+        if z <= exit_z or z > stop_z:
+            return 0
+    return position
+
+
+@njit(cache=True)
+def hysteresis_path(z: np.ndarray, entry_z: float, exit_z: float, stop_z: float) -> tuple[np.ndarray, np.ndarray]:
+    """Sequential ``PairsOUStrategy.on_bar`` over a z-array.
+
+    Returns the strategy position after each bar and a mask of bars that
+    emitted a signal.
+    """
+    n = z.shape[0]
+    positions = np.zeros(n, dtype=np.int8)
+    signals = np.zeros(n, dtype=np.bool_)
+    position = 0
+    for i in range(n):
+        new = _next_position(position, z[i], entry_z, exit_z, stop_z)
+        signals[i] = new != position
+        position = new
+        positions[i] = position
+    return positions, signals
+
+
+@njit(cache=True)
+def simulate_pair(
+    price_x: np.ndarray,
+    price_y: np.ndarray,
+    z: np.ndarray,
+    hedge_ratio: float,
+    entry_z: float,
+    exit_z: float,
+    stop_z: float,
+    latency_bars: int,
+    initial_capital: float,
+    transaction_cost_bps: float,
+    max_drawdown_limit: float,
+    kelly_min: float,
+    kelly_max: float,
+    slippage_draws: np.ndarray,
+):
+    """Latency/order state machine of ``EventDrivenBacktester.run`` on arrays.
+
+    ``slippage_draws[k]`` is the slippage (bps) applied to the k-th fill.
+    Returns equity, positions, fill arrays (bar, side, quantity, price_x,
+    price_y, fee, slippage), the fill count, trade returns and trade count.
+    """
+    n = price_x.shape[0]
+    equity = np.empty(n)
+    positions = np.empty(n)
+    fill_bar = np.empty(n, dtype=np.int64)
+    fill_side = np.empty(n, dtype=np.int8)
+    fill_qty = np.empty(n)
+    fill_px = np.empty(n)
+    fill_py = np.empty(n)
+    fill_fee = np.empty(n)
+    fill_slip = np.empty(n)
+    trade_returns = np.empty(n)
+    n_fills = 0
+    n_trades = 0
+    n_wins = 0
+    sum_wins = 0.0
+    sum_losses = 0.0
+
+    cash = initial_capital
+    equity[0] = cash
+    positions[0] = 0.0
+    peak = cash
+    max_dd = 0.0
+
+    side = 0
+    qty = 0.0
+    entry_equity = -1.0
+    strategy_position = 0
+    pending = False
+    pending_side = 0
+    pending_qty = 0.0
+    pending_bar = 0
+
+    for i in range(1, n):
+        ret_x = price_x[i] / price_x[i - 1] - 1
+        ret_y = price_y[i] / price_y[i - 1] - 1
+        pair_ret = ret_x - hedge_ratio * ret_y
+        cash *= 1 + side * qty * pair_ret
+
+        if pending and (i - pending_bar) >= latency_bars:
+            slip = slippage_draws[n_fills]
+            slip_mult = 1 + (slip / 10_000) * np.sign(pending_side)
+            px = price_x[i] * slip_mult
+            py = price_y[i] * slip_mult
+            fee = abs(pending_qty * px) * (transaction_cost_bps / 10_000)
+            fill_bar[n_fills] = i
+            fill_side[n_fills] = pending_side
+            fill_qty[n_fills] = pending_qty
+            fill_px[n_fills] = px
+            fill_py[n_fills] = py
+            fill_fee[n_fills] = fee
+            fill_slip[n_fills] = slip
+            n_fills += 1
+
+            side = pending_side
+            qty = pending_qty
+            cash -= fee
+            pending = False
+            if side != 0:
+                entry_equity = cash
+            elif entry_equity > 0:
+                r = cash / entry_equity - 1
+                trade_returns[n_trades] = r
+                n_trades += 1
+                if r > 0:
+                    n_wins += 1
+                    sum_wins += r
+                else:
+                    sum_losses += abs(r)
+                entry_equity = -1.0
+
+        new_position = _next_position(strategy_position, z[i], entry_z, exit_z, stop_z)
+        if new_position != strategy_position and not pending:
+            fraction = kelly_min
+            n_losses = n_trades - n_wins
+            if n_trades >= 10 and n_wins > 0 and n_losses > 0:
+                p = n_wins / n_trades
+                b = (sum_wins / n_wins) / max(sum_losses / n_losses, 1e-8)
+                fraction = min(max(p - (1 - p) / b, kelly_min), kelly_max)
+            if max_dd >= max_drawdown_limit:
+                fraction = 0.0
+            elif max_dd > 0:
+                fraction = fraction * max(1 - max_dd / max_drawdown_limit, 0.1)
+            exposure = max(fraction * cash, 0.0)
+            pending = True
+            pending_side = new_position
+            pending_qty = exposure / max(price_x[i], 1e-8)
+            pending_bar = i
+        strategy_position = new_position
+
+        equity[i] = cash
+        positions[i] = side
+        if cash > peak:
+            peak = cash
+        if peak > 0:
+            dd = (peak - cash) / peak
+            if dd > max_dd:
+                max_dd = dd
+
+    return (
+        equity,
+        positions,
+        fill_bar,
+        fill_side,
+        fill_qty,
+        fill_px,
+        fill_py,
+        fill_fee,
+        fill_slip,
+        n_fills,
+        trade_returns,
+        n_trades,
+    )
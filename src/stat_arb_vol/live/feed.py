@@ -0,0 +1,72 @@
+"""Bar feeds for the live paper-trading runtime."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from pathlib import Path
+
+import pandas as pd
+
+
+@dataclass(frozen=True, slots=True)
+class Bar:
+    timestamp: pd.Timestamp
+    symbol: str
+    close: float
+
+
+class ReplayFeed:
+    """Replay a close-price frame bar by bar, standing in for an exchange stream."""
+
+    def __init__(self, prices: pd.DataFrame, interval: float = 0.0) -> None:
+        self.prices = prices
+        self.interval = interval
+
+    async def __aiter__(self) -> AsyncIterator[Bar]:
+        symbols = self.prices.columns.tolist()
+        values = self.prices.to_numpy(dtype=float)
+        for ts, row in zip(self.prices.index, values):
+            for symbol, close in zip(symbols, row):
+                if close == close:
+                    yield Bar(ts, symbol, float(close))
+            await asyncio.sleep(self.interval)
+
+
+class FileTailFeed:
+    """Tail a ``timestamp,symbol,close`` CSV file as it is appended to.
+
+    Reads run in a worker thread so the event loop never blocks on disk I/O.
+    The feed stops after ``idle_timeout`` seconds without new lines (``None``
+    tails forever).
+    """
+
+    def __init__(self, path: str | Path, poll_interval: float = 0.05, idle_timeout: float | None = 1.0) -> None:
+        self.path = Path(path)
+        self.poll_interval = poll_interval
+        self.idle_timeout = idle_timeout
+
+    async def __aiter__(self) -> AsyncIterator[Bar]:
+        handle = await asyncio.to_thread(open, self.path, "r", encoding="utf-8")
+        idle = 0.0
+        buffer = ""
+        try:
+            while True:
+                chunk = await asyncio.to_thread(handle.read, 1 << 16)
+                if not chunk:
+                    if self.idle_timeout is not None and idle >= self.idle_timeout:
+                        return
+                    await asyncio.sleep(self.poll_interval)
+                    idle += self.poll_interval
+                    continue
+                idle = 0.0
+                buffer += chunk
+                *lines, buffer = buffer.split("\n")
+                for line in lines:
+                    parts = line.strip().split(",")
+                    if len(parts) != 3 or parts[0] == "timestamp":
+                        continue
+                    yield Bar(pd.Timestamp(parts[0]), parts[1], float(parts[2]))
+        finally:
+            handle.close()
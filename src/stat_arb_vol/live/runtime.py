@@ -0,0 +1,258 @@
+"""Asyncio paper-trading runtime driving ``PairsOUStrategy`` from a live bar feed."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterable
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from stat_arb_vol.backtest.events import FillEvent, OrderEvent, SignalEvent
+from stat_arb_vol.backtest.ledger import FillLedger
+from stat_arb_vol.config import BacktestConfig
+from stat_arb_vol.live.feed import Bar
+from stat_arb_vol.models.ou import RollingZScore
+from stat_arb_vol.risk.kelly import KellySizer, KellyStatistics
+from stat_arb_vol.strategy.pairs_ou_strategy import PairsOUStrategy
+
+
+def latency_percentiles(samples_ns: list[int], quantiles: tuple[float, ...] = (50, 90, 99)) -> dict[str, float]:
+    """Percentiles of nanosecond samples, reported in microseconds."""
+    if not samples_ns:
+        return {}
+    values = np.asarray(samples_ns, dtype=np.float64) / 1_000
+    out = {f"p{q:g}": float(v) for q, v in zip(quantiles, np.percentile(values, quantiles))}
+    out["max"] = float(values.max())
+    return out
+
+
+class LivePair:
+    """Incremental spread/z state and paper book for one strategy.
+
+    ``steps`` counts completed bars (both legs stamped); a submitted order is
+    parked in ``pending`` until it is ``latency_bars`` steps old, as in
+    ``EventDrivenBacktester.run``.
+    """
+
+    __slots__ = (
+        "strategy",
+        "zscore",
+        "book",
+        "prices",
+        "stamps",
+        "last_step",
+        "side",
+        "quantity",
+        "cash",
+        "entry_equity",
+        "steps",
+        "pending",
+        "peak_equity",
+        "max_drawdown",
+    )
+
+    def __init__(self, strategy: PairsOUStrategy, book: int, capital: float) -> None:
+        self.strategy = strategy
+        self.zscore = RollingZScore.from_history(strategy.spread.to_numpy(dtype=float), strategy.config.lookback)
+        self.book = book
+        x, y = strategy.pair
+        last = strategy.prices.iloc[-1] if len(strategy.prices) else None
+        self.prices = {x: float(last[x]), y: float(last[y])} if last is not None else {x: np.nan, y: np.nan}
+        self.stamps: dict[str, pd.Timestamp | None] = {x: None, y: None}
+        self.last_step: pd.Timestamp | None = None
+        self.side = 0
+        self.quantity = 0.0
+        self.cash = capital
+        self.entry_equity: float | None = None
+        self.steps = 0
+        self.pending: tuple[OrderEvent, int, int] | None = None
+        self.peak_equity = capital
+        self.max_drawdown = 0.0
+
+    def step(self, bar: Bar) -> bool:
+        """Apply ``bar``; True once both legs share its timestamp and the book was marked."""
+        x, y = self.strategy.pair
+        previous = (self.prices[x], self.prices[y])
+        self.prices[bar.symbol] = bar.close
+        self.stamps[bar.symbol] = bar.timestamp
+        if self.stamps[x] != self.stamps[y] or bar.timestamp == self.last_step:
+            return False
+
+        self.last_step = bar.timestamp
+        self.steps += 1
+        hedge = self.strategy.hedge_ratio
+        if self.side and previous[0] == previous[0]:
+            move = (self.prices[x] - previous[0]) - hedge * (self.prices[y] - previous[1])
+            self.cash += self.side * self.quantity * move
+        return True
+
+    def due(self, latency_bars: int) -> tuple[OrderEvent, int] | None:
+        """Release the parked order once it is ``latency_bars`` steps old."""
+        if self.pending is None or self.steps - self.pending[2] < latency_bars:
+            return None
+        order, stamp, _ = self.pending
+        self.pending = None
+        return order, stamp
+
+    def evaluate(self, timestamp: pd.Timestamp) -> SignalEvent | None:
+        x, y = self.strategy.pair
+        z = self.zscore.update(self.prices[x] - self.strategy.hedge_ratio * self.prices[y])
+        return self.strategy.on_z(timestamp, z)
+
+    def mark(self) -> None:
+        if self.cash > self.peak_equity:
+            self.peak_equity = self.cash
+        if self.peak_equity != 0:
+            self.max_drawdown = max(self.max_drawdown, (self.peak_equity - self.cash) / self.peak_equity)
+
+    def on_bar(self, bar: Bar) -> SignalEvent | None:
+        return self.evaluate(bar.timestamp) if self.step(bar) else None
+
+
+@dataclass
+class RuntimeReport:
+    bars: int
+    signals: int
+    fills: int
+    elapsed_seconds: float
+    signal_to_order_us: dict[str, float]
+    signal_to_fill_us: dict[str, float]
+    equity: dict[tuple[str, str], float]
+    ledger: FillLedger = field(repr=False)
+
+
+class PaperTradingRuntime:
+    """Route bars -> ``SignalEvent`` -> ``OrderEvent`` -> simulated ``FillEvent``.
+
+    Ingestion, sizing and execution are separate coroutines joined by bounded
+    asyncio queues, so hundreds of pairs share one event loop and slow feeds
+    never block order handling. Orders follow the backtest engine: sized with
+    the drawdown-throttled Kelly fraction, filled at the first bar at least
+    ``config.latency_bars`` after submission, and signals arriving while an
+    order is pending are dropped.
+    """
+
+    def __init__(
+        self,
+        strategies: list[PairsOUStrategy],
+        config: BacktestConfig,
+        seed: int | None = None,
+        queue_size: int = 10_000,
+    ) -> None:
+        self.config = config
+        capital = config.initial_capital / max(len(strategies), 1)
+        self.pairs = [LivePair(strategy, book, capital) for book, strategy in enumerate(strategies)]
+        self.routes: dict[str, list[LivePair]] = {}
+        for pair in self.pairs:
+            for symbol in pair.strategy.pair:
+                self.routes.setdefault(symbol, []).append(pair)
+        self.kelly = KellySizer()
+        self.kelly_stats = KellyStatistics(
+            n_books=len(self.pairs), max_fraction=self.kelly.max_fraction, min_fraction=self.kelly.min_fraction
+        )
+        self.rng = np.random.default_rng(seed)
+        self.queue_size = queue_size
+        self.ledger = FillLedger()
+        self.signal_to_order_ns: list[int] = []
+        self.signal_to_fill_ns: list[int] = []
+        self.bars = 0
+        self.signals = 0
+
+    async def run(self, feed: AsyncIterable[Bar]) -> RuntimeReport:
+        signals: asyncio.Queue = asyncio.Queue(self.queue_size)
+        orders: asyncio.Queue = asyncio.Queue(self.queue_size)
+        start = time.perf_counter()
+        sizer = asyncio.create_task(self._size(signals))
+        executor = asyncio.create_task(self._execute(orders))
+
+        await self._ingest(feed, signals, orders)
+        await signals.put(None)
+        await sizer
+        await orders.put(None)
+        await executor
+
+        return RuntimeReport(
+            bars=self.bars,
+            signals=self.signals,
+            fills=len(self.ledger),
+            elapsed_seconds=time.perf_counter() - start,
+            signal_to_order_us=latency_percentiles(self.signal_to_order_ns),
+            signal_to_fill_us=latency_percentiles(self.signal_to_fill_ns),
+            equity={pair.strategy.pair: pair.cash for pair in self.pairs},
+            ledger=self.ledger,
+        )
+
+    def run_sync(self, feed: AsyncIterable[Bar]) -> RuntimeReport:
+        return asyncio.run(self.run(feed))
+
+    async def _ingest(self, feed: AsyncIterable[Bar], signals: asyncio.Queue, orders: asyncio.Queue) -> None:
+        latency_bars = self.config.latency_bars
+        async for bar in feed:
+            self.bars += 1
+            emitted = False
+            for pair in self.routes.get(bar.symbol, ()):
+                if not pair.step(bar):
+                    continue
+                released = pair.due(latency_bars)
+                if released is not None:
+                    order, stamp = released
+                    x, y = order.pair
+                    emitted = True
+                    await orders.put((order, stamp, pair, bar.timestamp, (pair.prices[x], pair.prices[y])))
+                signal = pair.evaluate(bar.timestamp)
+                pair.mark()
+                if signal is not None:
+                    self.signals += 1
+                    emitted = True
+                    await signals.put((signal, time.perf_counter_ns(), pair, pair.steps))
+            if emitted:
+                # Let the sizer/executor drain before routing the next bar.
+                await asyncio.sleep(0)
+
+    async def _size(self, signals: asyncio.Queue) -> None:
+        config = self.config
+        while True:
+            item = await signals.get()
+            if item is None:
+                return
+            signal, stamp, pair, step = item
+            if pair.pending is not None:
+                continue
+            x = signal.pair[0]
+            fraction = self.kelly.apply_drawdown_limit(
+                pair.max_drawdown, self.kelly_stats.fraction(pair.book), config.max_drawdown_limit
+            )
+            exposure = max(fraction * pair.cash, 0.0)
+            quantity = exposure / max(pair.prices[x], 1e-8)
+            pair.pending = (OrderEvent(signal.timestamp, signal.pair, signal.side, quantity), stamp, step)
+            self.signal_to_order_ns.append(time.perf_counter_ns() - stamp)
+
+    async def _execute(self, orders: asyncio.Queue) -> None:
+        config = self.config
+        while True:
+            item = await orders.get()
+            if item is None:
+                return
+            order, stamp, pair, timestamp, prices = item
+            slip_bps = float(self.rng.uniform(config.slippage_bps_min, config.slippage_bps_max))
+            slip_mult = 1 + (slip_bps / 10_000) * np.sign(order.side)
+            fill_prices = (prices[0] * slip_mult, prices[1] * slip_mult)
+            fee = abs(order.quantity * fill_prices[0]) * (config.transaction_cost_bps / 10_000)
+            fill = FillEvent(timestamp, order.pair, order.side, order.quantity, fill_prices, fee, slip_bps)
+            self._apply_fill(pair, fill)
+            self.signal_to_fill_ns.append(time.perf_counter_ns() - stamp)
+
+    def _apply_fill(self, pair: LivePair, fill: FillEvent) -> None:
+        self.ledger.record(fill)
+        pair.side = fill.side
+        pair.quantity = fill.quantity
+        pair.cash -= fill.fee
+        pair.mark()
+        if pair.side != 0:
+            pair.entry_equity = pair.cash
+        elif pair.entry_equity is not None and pair.entry_equity > 0:
+            self.kelly_stats.update(pair.cash / pair.entry_equity - 1, book=pair.book)
+            pair.entry_equity = None
@@ -0,0 +1,223 @@
+"""Johansen cointegration screening for multi-asset baskets."""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+from scipy.cluster.hierarchy import fcluster, linkage
+from scipy.spatial.distance import squareform
+from statsmodels.tsa.coint_tables import c_sjt
+
+_CRIT_COLUMN = {0.10: 0, 0.05: 1, 0.01: 2}
+
+
+@dataclass
+class BasketCandidate:
+    assets: tuple[str, ...]
+    weights: tuple[float, ...]  # first weight normalized to 1
+    trace_stat: float
+    critical_value: float
+    eigenvalue: float
+
+    @property
+    def score(self) -> float:
+        return self.trace_stat / self.critical_value
+
+
+class JohansenBasketSelector:
+    """Screen 3-5 asset baskets with batched Johansen trace tests.
+
+    Candidate groups are drawn from correlation clusters rather than all
+    combinations. Every Johansen moment matrix (``S00``, ``S0k``, ``Skk``) is
+    a Schur complement of sub-blocks of one universe-wide moment matrix of
+    ``[dX_t, X_{t-k}, dX_{t-1..t-k}, 1]``, so overlapping baskets share that
+    single pass over the data; per-subset results are also kept in an LRU.
+    Baskets of equal size are stacked and solved with batched Cholesky /
+    ``eigh`` calls, and chunks run in a thread pool (LAPACK releases the GIL).
+    Results match ``statsmodels`` ``coint_johansen(det_order=0)``.
+
+    Prices may be NaN before a symbol lists (e.g. ``AlignedPanel.frame()``).
+    Each basket is tested on the bars where all of its own legs are valid;
+    baskets sharing those bars share one moment matrix over every symbol
+    valid there.
+    """
+
+    def __init__(
+        self,
+        min_size: int = 3,
+        max_size: int = 5,
+        k_ar_diff: int = 1,
+        significance: float = 0.05,
+        cluster_threshold: float = 0.5,
+        max_cluster_size: int = 10,
+        n_jobs: int | None = None,
+        chunk_size: int = 256,
+        cache_size: int = 4096,
+    ) -> None:
+        if significance not in _CRIT_COLUMN:
+            raise ValueError(f"significance must be one of {sorted(_CRIT_COLUMN)}")
+        if not 2 <= min_size <= max_size <= 12:
+            raise ValueError("basket sizes must satisfy 2 <= min_size <= max_size <= 12")
+        self.min_size = min_size
+        self.max_size = max_size
+        self.k_ar_diff = k_ar_diff
+        self.significance = significance
+        self.cluster_threshold = cluster_threshold
+        self.max_cluster_size = max_cluster_size
+        self.n_jobs = n_jobs
+        self.chunk_size = chunk_size
+        self.cache_size = cache_size
+        self._cache: OrderedDict[tuple[str, ...], BasketCandidate] = OrderedDict()
+        self._moments: dict[bytes, tuple[np.ndarray, dict[str, int], int]] = {}
+        self._fingerprint: tuple | None = None
+
+    def candidate_groups(self, prices: pd.DataFrame) -> list[tuple[str, ...]]:
+        """Asset groups seeded from hierarchical clusters of return correlation."""
+        # Pairwise-complete correlations, so a late listing does not shorten every pair.
+        corr = np.nan_to_num(np.log(prices).diff().corr().to_numpy())
+        symbols = prices.columns.tolist()
+        dist = np.clip(1 - corr, 0.0, None)
+        np.fill_diagonal(dist, 0.0)
+        labels = fcluster(linkage(squareform(dist, checks=False), "average"), self.cluster_threshold, "distance")
+
+        groups: set[tuple[str, ...]] = set()
+        for label in np.unique(labels):
+            members = np.flatnonzero(labels == label)
+            if len(members) < self.min_size:
+                continue
+            if len(members) > self.max_cluster_size:
+                cohesion = corr[np.ix_(members, members)].mean(axis=1)
+                members = members[np.argsort(-cohesion)[: self.max_cluster_size]]
+            names = sorted(symbols[i] for i in members)
+            for size in range(self.min_size, min(self.max_size, len(names)) + 1):
+                groups.update(combinations(names, size))
+        return sorted(groups)
+
+    def select_baskets(
+        self,
+        prices: pd.DataFrame,
+        groups: list[tuple[str, ...]] | None = None,
+    ) -> list[BasketCandidate]:
+        prices = prices.dropna(how="all")
+        if groups is None:
+            groups = self.candidate_groups(prices)
+        self._reset(prices)
+
+        found = {}
+        for group in groups:
+            if group in self._cache:
+                self._cache.move_to_end(group)
+                found[group] = self._cache[group]
+
+        valid = prices.notna().to_numpy()
+        column = {s: i for i, s in enumerate(prices.columns)}
+        windows: dict[bytes, tuple[np.ndarray, dict[int, list[tuple[str, ...]]]]] = {}
+        for group in groups:
+            if group in found:
+                continue
+            mask = valid[:, [column[s] for s in group]].all(axis=1)
+            # Too few rows for the VECM regressors: the basket cannot be tested.
+            if mask.sum() - 1 - self.k_ar_diff <= (self.k_ar_diff + 1) * len(group) + 1:
+                continue
+            entry = windows.setdefault(np.packbits(mask).tobytes(), (mask, {}))
+            entry[1].setdefault(len(group), []).append(group)
+
+        chunks = []
+        for key, (mask, by_size) in windows.items():
+            moments, position, rows = self._window_moments(key, prices, valid, mask)
+            chunks += [
+                (members[i : i + self.chunk_size], moments, position, rows)
+                for members in by_size.values()
+                for i in range(0, len(members), self.chunk_size)
+            ]
+
+        def solve(chunk: tuple) -> list[BasketCandidate]:
+            members, moments, position, rows = chunk
+            idx = np.array([[position[s] for s in g] for g in members])
+            return self._test_batch(members, idx, len(position), moments, rows)
+
+        with ThreadPoolExecutor(max_workers=self.n_jobs) as pool:
+            for results in pool.map(solve, chunks):
+                for candidate in results:
+                    found[candidate.assets] = candidate
+                    self._cache[candidate.assets] = candidate
+                    if len(self._cache) > self.cache_size:
+                        self._cache.popitem(last=False)
+
+        selected = [found[g] for g in groups if g in found and found[g].trace_stat > found[g].critical_value]
+        selected.sort(key=lambda c: c.score, reverse=True)
+        return selected
+
+    def _reset(self, prices: pd.DataFrame) -> None:
+        """Drop cached moments and results when the price panel changes."""
+        fingerprint = (
+            tuple(prices.columns),
+            hashlib.blake2b(np.ascontiguousarray(prices.to_numpy(dtype=np.float64)).tobytes()).hexdigest(),
+        )
+        if fingerprint != self._fingerprint:
+            self._moments.clear()
+            self._cache.clear()
+            self._fingerprint = fingerprint
+
+    def _window_moments(
+        self, key: bytes, prices: pd.DataFrame, valid: np.ndarray, mask: np.ndarray
+    ) -> tuple[np.ndarray, dict[str, int], int]:
+        """Moment matrix over the bars in ``mask`` for every symbol valid on all of them."""
+        if key in self._moments:
+            return self._moments[key]
+        columns = np.flatnonzero(valid[mask].all(axis=0))
+        levels = prices.to_numpy(dtype=np.float64)[np.ix_(mask, columns)]
+        k = self.k_ar_diff
+        dx = np.diff(levels, axis=0)
+        rows = dx.shape[0] - k
+        blocks = [dx[k:], levels[1 : levels.shape[0] - k]]
+        blocks += [dx[k - j : dx.shape[0] - j] for j in range(1, k + 1)]
+        blocks.append(np.ones((rows, 1)))
+        design = np.hstack(blocks)
+        position = {prices.columns[c]: i for i, c in enumerate(columns)}
+        self._moments[key] = (design.T @ design / rows, position, rows)
+        return self._moments[key]
+
+    def _test_batch(
+        self, groups: list[tuple[str, ...]], idx: np.ndarray, n_symbols: int, m: np.ndarray, n_rows: int
+    ) -> list[BasketCandidate]:
+        size = idx.shape[1]
+        diff_idx = idx
+        level_idx = idx + n_symbols
+        const = np.full((len(groups), 1), m.shape[0] - 1)
+        lag_idx = np.hstack([idx + n_symbols * (2 + j) for j in range(self.k_ar_diff)] + [const])
+
+        def block(rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+            return m[rows[:, :, None], cols[:, None, :]]
+
+        m_kk = block(lag_idx, lag_idx)
+
+        def partial(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+            return block(a, b) - block(a, lag_idx) @ np.linalg.solve(m_kk, block(lag_idx, b))
+
+        s00 = partial(diff_idx, diff_idx)
+        s0k = partial(diff_idx, level_idx)
+        skk = partial(level_idx, level_idx)
+
+        chol = np.linalg.cholesky(skk)
+        inner = np.swapaxes(s0k, 1, 2) @ np.linalg.solve(s00, s0k)
+        left = np.linalg.solve(chol, inner)
+        sym = np.linalg.solve(chol, np.swapaxes(left, 1, 2))
+        eigvals, eigvecs = np.linalg.eigh((sym + np.swapaxes(sym, 1, 2)) / 2)
+        eigvals = np.clip(eigvals[:, ::-1], 0.0, 1 - 1e-12)
+        vectors = np.linalg.solve(np.swapaxes(chol, 1, 2), eigvecs[:, :, ::-1])
+
+        trace = -n_rows * np.log(1 - eigvals).sum(axis=1)
+        critical = float(c_sjt(size, 0)[_CRIT_COLUMN[self.significance]])
+        lead = vectors[:, :, 0]
+        weights = lead / lead[:, :1]
+        return [
+            BasketCandidate(group, tuple(float(w) for w in weights[i]), float(trace[i]), critical, float(eigvals[i, 0]))
+            for i, group in enumerate(groups)
+        ]
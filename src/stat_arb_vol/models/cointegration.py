@@ -3,10 +3,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 from statsmodels.tsa.stattools import coint
 
+if TYPE_CHECKING:
+    from stat_arb_vol.models.screening_cache import ScreeningCache
+
+MIN_OBSERVATIONS = 120
+
 
 @dataclass
 class PairCandidate:
@@ -16,23 +23,36 @@ class PairCandidate:
     score: float
 
 
+def engle_granger(x: np.ndarray, y: np.ndarray, min_obs: int = MIN_OBSERVATIONS) -> tuple[float, float] | None:
+    """Engle-Granger ``(statistic, pvalue)`` on bars where both legs are valid, or None if too short."""
+    valid = ~(np.isnan(x) | np.isnan(y))
+    if valid.sum() < min_obs:
+        return None
+    score, pvalue, _ = coint(x[valid], y[valid])
+    return float(score), float(pvalue)
+
+
 class CointegrationSelector:
-    def __init__(self, significance: float = 0.05) -> None:
+    def __init__(self, significance: float = 0.05, cache: ScreeningCache | None = None) -> None:
         self.significance = significance
+        self.cache = cache
 
     def select_pairs(self, prices: pd.DataFrame) -> list[PairCandidate]:
         symbols = prices.columns.tolist()
-        selected: list[PairCandidate] = []
+        pairs = [(i, j) for i in range(len(symbols)) for j in range(i + 1, len(symbols))]
+        if self.cache is not None:
+            results = self.cache.test_pairs(prices, pairs)
+        else:
+            columns = prices.to_numpy(dtype=np.float64).T
+            results = [engle_granger(columns[i], columns[j]) for i, j in pairs]
 
-        for i in range(len(symbols)):
-            for j in range(i + 1, len(symbols)):
-                x, y = symbols[i], symbols[j]
-                pair = prices[[x, y]].dropna()
-                if len(pair) < 120:
-                    continue
-                score, pvalue, _ = coint(pair[x], pair[y])
-                if pvalue <= self.significance:
-                    selected.append(PairCandidate(x, y, pvalue, score))
+        selected: list[PairCandidate] = []
+        for (i, j), result in zip(pairs, results):
+            if result is None:
+                continue
+            score, pvalue = result
+            if pvalue <= self.significance:
+                selected.append(PairCandidate(symbols[i], symbols[j], pvalue, score))
 
         selected.sort(key=lambda p: p.pvalue)
         return selected
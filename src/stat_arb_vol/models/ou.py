@@ -8,6 +8,8 @@ import numpy as np
 import pandas as pd
 from scipy.stats import zscore
 
+from stat_arb_vol.precision import to_storage
+
 
 @dataclass
 class OUParams:
@@ -38,10 +40,77 @@ class OUModel:
     def rolling_zscore(spread: pd.Series, lookback: int) -> pd.Series:
         mean = spread.rolling(lookback).mean()
         std = spread.rolling(lookback).std(ddof=0).replace(0, np.nan)
-        return ((spread - mean) / std).fillna(0.0)
+        return to_storage(((spread - mean) / std).fillna(0.0))
 
     @staticmethod
     def static_zscore(spread: pd.Series) -> pd.Series:
         values = zscore(spread.dropna())
         out = pd.Series(index=spread.dropna().index, data=values)
         return out.reindex(spread.index).fillna(0.0)
+
+
+class RollingZScore:
+    """O(1)-per-update counterpart of ``OUModel.rolling_zscore`` for streaming spreads.
+
+    Keeps the last ``lookback`` values in a ring buffer with running sums taken
+    around an anchor value (refreshed once per window) to limit cancellation,
+    so updates are amortized O(1). Returns 0.0 until the window
+    is full, when it contains NaN, or when its std is zero.
+    """
+
+    def __init__(self, lookback: int) -> None:
+        self.lookback = lookback
+        self.window = np.zeros(lookback)
+        self.count = 0
+        self.cursor = 0
+        self.anchor: float | None = None
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.nans = 0
+
+    @classmethod
+    def from_history(cls, spread: pd.Series | np.ndarray, lookback: int) -> RollingZScore:
+        state = cls(lookback)
+        for value in np.asarray(spread, dtype=float)[-lookback:]:
+            state.update(value)
+        return state
+
+    def update(self, value: float) -> float:
+        if self.anchor is None and not np.isnan(value):
+            self.anchor = float(value)
+        anchor = self.anchor or 0.0
+
+        if self.count == self.lookback:
+            old = self.window[self.cursor]
+            if np.isnan(old):
+                self.nans -= 1
+            else:
+                self.total -= old - anchor
+                self.total_sq -= (old - anchor) ** 2
+        else:
+            self.count += 1
+
+        self.window[self.cursor] = value
+        self.cursor = (self.cursor + 1) % self.lookback
+        if np.isnan(value):
+            self.nans += 1
+            return 0.0
+        shifted = value - anchor
+        self.total += shifted
+        self.total_sq += shifted**2
+
+        if self.cursor == 0 and not self.nans:
+            # Re-anchor once per window so drift in the running sums stays bounded.
+            valid = self.window[: self.count]
+            self.anchor = anchor = float(valid.mean())
+            self.total = float((valid - anchor).sum())
+            self.total_sq = float(((valid - anchor) ** 2).sum())
+            shifted = value - anchor
+
+        if self.count < self.lookback or self.nans:
+            return 0.0
+        mean = self.total / self.lookback
+        var = self.total_sq / self.lookback - mean**2
+        if var <= 0:
+            return 0.0
+        return float((shifted - mean) / np.sqrt(var))
@@ -0,0 +1,164 @@
+"""Memory-bounded, resumable Engle-Granger screening for large universes."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from stat_arb_vol.models.cointegration import CointegrationSelector, PairCandidate, engle_granger
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows has no resource module
+    resource = None
+
+CANDIDATE_COLUMNS = ["asset_x", "asset_y", "pvalue", "score"]
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process so far (NaN where ``resource`` is unavailable)."""
+    if resource is None:
+        return float("nan")
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def save_columnar_panel(prices: pd.DataFrame, path: str | Path) -> Path:
+    """Write prices symbol-major (``(symbols, bars)``) so column blocks can be memory-mapped."""
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    np.save(path / "values.npy", np.ascontiguousarray(prices.to_numpy().T))
+    np.save(path / "index.npy", pd.DatetimeIndex(prices.index).as_unit("ns").asi8)
+    (path / "symbols.json").write_text(json.dumps(list(map(str, prices.columns))), encoding="utf-8")
+    return path
+
+
+def load_columnar_panel(path: str | Path) -> tuple[np.ndarray, list[str]]:
+    """Memory-mapped ``(symbols, bars)`` values plus symbol names from ``save_columnar_panel``."""
+    path = Path(path)
+    values = np.load(path / "values.npy", mmap_mode="r")
+    symbols = json.loads((path / "symbols.json").read_text(encoding="utf-8"))
+    return values, symbols
+
+
+@dataclass
+class ScreeningReport:
+    symbols: int
+    block_size: int
+    blocks: int
+    blocks_skipped: int
+    pairs_tested: int
+    candidates: int
+    elapsed_seconds: float
+    peak_rss_mb: float
+
+
+class ChunkedPairScreener:
+    """Walk the upper-triangular pair matrix in symbol blocks sized to a memory budget.
+
+    Only two blocks of price columns are resident at a time (``values`` may be
+    a memory-mapped ``(symbols, bars)`` array from ``save_columnar_panel``).
+    Each block pair's significant candidates are written atomically to
+    ``output_dir``, so an interrupted screen resumes by skipping finished
+    blocks; ``candidates(output_dir)`` merges them like ``select_pairs``.
+    """
+
+    def __init__(self, selector: CointegrationSelector | None = None, memory_budget_mb: float = 256.0) -> None:
+        self.selector = selector or CointegrationSelector()
+        self.memory_budget_mb = memory_budget_mb
+
+    def block_size(self, n_bars: int, itemsize: int = 8) -> int:
+        budget = self.memory_budget_mb * 2**20
+        return max(2, int(budget // (2 * n_bars * itemsize)))
+
+    def screen(
+        self,
+        prices: pd.DataFrame | np.ndarray,
+        output_dir: str | Path,
+        symbols: list[str] | None = None,
+        resume: bool = True,
+    ) -> ScreeningReport:
+        start = time.perf_counter()
+        if isinstance(prices, pd.DataFrame):
+            symbols = list(map(str, prices.columns))
+            values = prices.to_numpy().T
+        else:
+            if symbols is None:
+                raise ValueError("symbols are required when prices is an array")
+            values = prices
+        n_symbols, n_bars = values.shape
+        # Blocks are materialized as float64 whatever the source dtype.
+        size = self.block_size(n_bars, np.dtype(np.float64).itemsize)
+        starts = list(range(0, n_symbols, size))
+
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        manifest = {
+            "symbols": symbols,
+            "bars": n_bars,
+            "block_size": size,
+            "significance": self.selector.significance,
+        }
+        manifest_path = output_dir / "manifest.json"
+        if resume and manifest_path.exists():
+            if json.loads(manifest_path.read_text(encoding="utf-8")) != manifest:
+                raise ValueError(f"{output_dir} holds a screen with different settings; use resume=False")
+        else:
+            for stale in output_dir.glob("block_*.csv"):
+                stale.unlink()
+            manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+
+        blocks = skipped = tested = found = 0
+        for bi, lo_i in enumerate(starts):
+            left = None
+            for bj in range(bi, len(starts)):
+                blocks += 1
+                target = output_dir / f"block_{bi:05d}_{bj:05d}.csv"
+                if target.exists():
+                    skipped += 1
+                    continue
+                if left is None:
+                    left = np.asarray(values[lo_i : lo_i + size], dtype=np.float64)
+                lo_j = starts[bj]
+                right = left if bj == bi else np.asarray(values[lo_j : lo_j + size], dtype=np.float64)
+                rows = []
+                for a in range(len(left)):
+                    for b in range(a + 1 if bj == bi else 0, len(right)):
+                        result = engle_granger(left[a], right[b])
+                        if result is None:
+                            continue
+                        tested += 1
+                        score, pvalue = result
+                        if pvalue <= self.selector.significance:
+                            rows.append((symbols[lo_i + a], symbols[lo_j + b], pvalue, score))
+                found += len(rows)
+                tmp = target.with_suffix(".tmp")
+                pd.DataFrame(rows, columns=CANDIDATE_COLUMNS).to_csv(tmp, index=False)
+                os.replace(tmp, target)
+
+        return ScreeningReport(
+            symbols=n_symbols,
+            block_size=size,
+            blocks=blocks,
+            blocks_skipped=skipped,
+            pairs_tested=tested,
+            candidates=found,
+            elapsed_seconds=time.perf_counter() - start,
+            peak_rss_mb=peak_rss_mb(),
+        )
+
+    @staticmethod
+    def candidates(output_dir: str | Path) -> list[PairCandidate]:
+        frames = [pd.read_csv(path, float_precision="round_trip") for path in sorted(Path(output_dir).glob("block_*.csv"))]
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return []
+        merged = pd.concat(frames, ignore_index=True).sort_values("pvalue", kind="stable")
+        return [PairCandidate(row.asset_x, row.asset_y, row.pvalue, row.score) for row in merged.itertuples()]
@@ -0,0 +1,126 @@
+"""Persistent Engle-Granger results keyed by pair, data window and test settings."""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from stat_arb_vol.models.cointegration import MIN_OBSERVATIONS, engle_granger
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pair_tests (
+    asset_x TEXT NOT NULL,
+    asset_y TEXT NOT NULL,
+    settings TEXT NOT NULL,
+    end_ns INTEGER NOT NULL,
+    data_hash TEXT NOT NULL,
+    score REAL,
+    pvalue REAL,
+    tested_at REAL NOT NULL,
+    PRIMARY KEY (asset_x, asset_y, settings)
+);
+"""
+
+
+class _PanelHashes:
+    """Memoized hashes of column prefixes ``[:bars]`` for one price panel."""
+
+    def __init__(self, prices: pd.DataFrame) -> None:
+        self.index = pd.DatetimeIndex(prices.index).as_unit("ns").asi8
+        self.columns = prices.to_numpy(dtype=np.float64).T
+        self._memo: dict[tuple[int, int], bytes] = {}
+
+    def column(self, j: int, bars: int) -> bytes:
+        key = (j, bars)
+        digest = self._memo.get(key)
+        if digest is None:
+            h = hashlib.blake2b(digest_size=16)
+            h.update(np.ascontiguousarray(self.index[:bars]).tobytes())
+            h.update(np.ascontiguousarray(self.columns[j, :bars]).tobytes())
+            digest = self._memo[key] = h.digest()
+        return digest
+
+    def pair(self, i: int, j: int, bars: int) -> str:
+        return hashlib.blake2b(self.column(i, bars) + self.column(j, bars), digest_size=16).hexdigest()
+
+
+class ScreeningCache:
+    """SQLite store of pair test results so re-screening only tests what changed.
+
+    Each pair keeps its latest ``(statistic, pvalue)`` (also for insignificant
+    or too-short pairs, so changing ``significance`` reuses them) with the
+    hash of both legs' prices up to the window end. A cached result is reused
+    when the panel's data up to that end is unchanged and at most
+    ``max_stale_bars`` bars were appended since; new symbols, revised
+    history and windows extended further than that are re-tested.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = ".cache/screening.db",
+        max_stale_bars: int = 5,
+        min_obs: int = MIN_OBSERVATIONS,
+    ) -> None:
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self.max_stale_bars = max_stale_bars
+        self.min_obs = min_obs
+        self.settings = f"engle-granger:trend=c:autolag=aic:min_obs={min_obs}"
+        self._conn = sqlite3.connect(self.path, timeout=30.0)
+        self._conn.executescript(_SCHEMA)
+        self.hits = 0
+        self.misses = 0
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def test_pairs(
+        self, prices: pd.DataFrame, pairs: list[tuple[int, int]]
+    ) -> list[tuple[float, float] | None]:
+        """Results for column-index ``pairs`` of ``prices``, testing only stale or unseen pairs."""
+        symbols = list(map(str, prices.columns))
+        hashes = _PanelHashes(prices)
+        bars = len(hashes.index)
+        cached = {
+            (x, y): (end_ns, data_hash, score, pvalue)
+            for x, y, end_ns, data_hash, score, pvalue in self._conn.execute(
+                "SELECT asset_x, asset_y, end_ns, data_hash, score, pvalue FROM pair_tests WHERE settings = ?",
+                (self.settings,),
+            )
+        }
+
+        results: list[tuple[float, float] | None] = []
+        updates = []
+        now = time.time()
+        for i, j in pairs:
+            entry = cached.get((symbols[i], symbols[j]))
+            if entry is not None and self._fresh(entry, hashes, i, j, bars):
+                self.hits += 1
+                results.append(None if entry[3] is None else (entry[2], entry[3]))
+                continue
+            self.misses += 1
+            result = engle_granger(hashes.columns[i], hashes.columns[j], self.min_obs)
+            results.append(result)
+            score, pvalue = result if result is not None else (None, None)
+            end_ns = int(hashes.index[-1]) if bars else 0
+            updates.append((symbols[i], symbols[j], self.settings, end_ns, hashes.pair(i, j, bars), score, pvalue, now))
+
+        if updates:
+            with self._conn:
+                self._conn.executemany("INSERT OR REPLACE INTO pair_tests VALUES (?, ?, ?, ?, ?, ?, ?, ?)", updates)
+        return results
+
+    def _fresh(self, entry: tuple, hashes: _PanelHashes, i: int, j: int, bars: int) -> bool:
+        end_ns, data_hash = entry[0], entry[1]
+        position = int(np.searchsorted(hashes.index, end_ns))
+        if position >= bars or hashes.index[position] != end_ns:
+            return False
+        if bars - (position + 1) > self.max_stale_bars:
+            return False
+        return hashes.pair(i, j, position + 1) == data_hash
@@ -0,0 +1,137 @@
+"""Memoized spreads and rolling z-scores shared across strategy instances."""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from stat_arb_vol.models.ou import OUModel
+from stat_arb_vol.precision import to_storage
+
+SpreadKey = tuple[tuple[str, ...], str, int, str]
+
+
+class SpreadCache:
+    """In-process LRU of ``(spread, z)`` series with optional memory-mapped spill.
+
+    Entries are keyed by ``(pair, hedge ratio or basket weights, lookback,
+    data version)``, so a threshold sweep over one pair computes each z-series
+    once. When
+    ``directory`` is given, computed arrays are also written as ``.npy`` files
+    and later reopened with ``mmap_mode="r"`` instead of being recomputed.
+    """
+
+    def __init__(self, max_entries: int = 128, directory: str | Path | None = None) -> None:
+        self.max_entries = max_entries
+        self.directory = Path(directory) if directory is not None else None
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self._entries: OrderedDict[SpreadKey, tuple[pd.Series, pd.Series]] = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def data_version(prices: pd.DataFrame, pair: tuple[str, ...]) -> str:
+        panel = prices[list(pair)]
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(np.ascontiguousarray(pd.DatetimeIndex(panel.index).as_unit("ns").asi8).tobytes())
+        digest.update(np.ascontiguousarray(panel.to_numpy(dtype=np.float64)).tobytes())
+        return digest.hexdigest()
+
+    def get(
+        self,
+        prices: pd.DataFrame,
+        pair: tuple[str, ...],
+        hedge_ratio: float,
+        lookback: int,
+        data_version: str | None = None,
+        weights: tuple[float, ...] | None = None,
+    ) -> tuple[pd.Series, pd.Series]:
+        key = self._key(prices, pair, hedge_ratio, lookback, data_version, weights)
+        cached = self._entries.get(key)
+        if cached is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return cached
+
+        entry = self._load(key, prices.index)
+        if entry is not None:
+            self.disk_hits += 1
+        else:
+            self.misses += 1
+            if weights is None:
+                x, y = pair
+                spread = prices[x] - hedge_ratio * prices[y]
+            else:
+                spread = to_storage(prices[list(pair)] @ np.asarray(weights, dtype=float))
+            entry = (spread, OUModel.rolling_zscore(spread, lookback=lookback))
+            self._store(key, entry)
+
+        self._entries[key] = entry
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def put(
+        self,
+        prices: pd.DataFrame,
+        pair: tuple[str, ...],
+        hedge_ratio: float,
+        lookback: int,
+        spread: pd.Series,
+        z: pd.Series,
+        data_version: str | None = None,
+        weights: tuple[float, ...] | None = None,
+    ) -> None:
+        """Seed the cache with a precomputed ``(spread, z)`` (e.g. from a pipeline stage)."""
+        key = self._key(prices, pair, hedge_ratio, lookback, data_version, weights)
+        self._entries[key] = (spread, z)
+        self._store(key, (spread, z))
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _key(
+        self,
+        prices: pd.DataFrame,
+        pair: tuple[str, ...],
+        hedge_ratio: float,
+        lookback: int,
+        data_version: str | None,
+        weights: tuple[float, ...] | None,
+    ) -> SpreadKey:
+        version = data_version or self.data_version(prices, pair)
+        hedge = float(hedge_ratio).hex() if weights is None else ",".join(float(w).hex() for w in weights)
+        return (tuple(pair), hedge, int(lookback), version)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _file_stem(self, key: SpreadKey) -> Path:
+        assert self.directory is not None
+        name = hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+        return self.directory / name
+
+    def _load(self, key: SpreadKey, index: pd.Index) -> tuple[pd.Series, pd.Series] | None:
+        if self.directory is None:
+            return None
+        stem = self._file_stem(key)
+        try:
+            spread = np.load(f"{stem}.spread.npy", mmap_mode="r")
+            z = np.load(f"{stem}.z.npy", mmap_mode="r")
+        except (FileNotFoundError, ValueError):
+            return None
+        if len(spread) != len(index) or len(z) != len(index):
+            return None
+        return pd.Series(spread, index=index, copy=False), pd.Series(z, index=index, copy=False)
+
+    def _store(self, key: SpreadKey, entry: tuple[pd.Series, pd.Series]) -> None:
+        if self.directory is None:
+            return
+        stem = self._file_stem(key)
+        np.save(f"{stem}.spread.npy", entry[0].to_numpy())
+        np.save(f"{stem}.z.npy", entry[1].to_numpy())
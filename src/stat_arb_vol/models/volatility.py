@@ -0,0 +1,179 @@
+"""Batched EWMA, realized and GARCH(1,1) volatility across many series."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from scipy.signal import lfilter
+
+MAX_PERSISTENCE = 0.999
+
+
+def _as_2d(returns: pd.DataFrame | np.ndarray) -> np.ndarray:
+    values = np.asarray(returns, dtype=np.float64)
+    return values[:, None] if values.ndim == 1 else values
+
+
+def ewma_volatility(returns: pd.DataFrame | np.ndarray, lam: float = 0.94) -> np.ndarray:
+    """RiskMetrics EWMA one-step-ahead volatility for every column at once.
+
+    Row ``t`` is the forecast made with returns up to ``t - 1``; the first row
+    is seeded with each column's sample variance.
+    """
+    r = np.nan_to_num(_as_2d(returns))
+    seed = r.var(axis=0)
+    shocks = np.vstack([seed, r[:-1] ** 2])
+    var, _ = lfilter([1 - lam], [1, -lam], shocks, axis=0, zi=np.full((1, r.shape[1]), lam * seed))
+    return np.sqrt(var)
+
+
+def realized_volatility(returns: pd.DataFrame | np.ndarray, window: int = 20) -> np.ndarray:
+    """Rolling root-mean-square return over ``window`` bars (NaN until full)."""
+    r2 = np.nan_to_num(_as_2d(returns)) ** 2
+    csum = np.vstack([np.zeros((1, r2.shape[1])), np.cumsum(r2, axis=0)])
+    out = np.full(r2.shape, np.nan)
+    out[window - 1 :] = np.sqrt((csum[window:] - csum[:-window]) / window)
+    return out
+
+
+def garch_variance(returns: np.ndarray, omega: np.ndarray, alpha: np.ndarray, beta: np.ndarray) -> np.ndarray:
+    """Conditional variance path for ``(T, ...)`` returns and broadcastable params."""
+    r2 = returns**2
+    shape = np.broadcast_shapes(r2.shape[1:], np.shape(omega), np.shape(alpha), np.shape(beta))
+    h = np.empty((r2.shape[0],) + shape)
+    h[0] = np.broadcast_to(r2.mean(axis=0), shape)
+    for t in range(1, r2.shape[0]):
+        h[t] = omega + alpha * r2[t - 1] + beta * h[t - 1]
+    return h
+
+
+def garch_nll(returns: np.ndarray, omega: np.ndarray, alpha: np.ndarray, beta: np.ndarray) -> np.ndarray:
+    """Gaussian negative log-likelihood (constants dropped), one value per series."""
+    h = np.maximum(garch_variance(returns, omega, alpha, beta), 1e-300)
+    r2 = returns**2
+    r2 = r2.reshape(r2.shape[:1] + (1,) * (h.ndim - r2.ndim) + r2.shape[1:])
+    return 0.5 * (np.log(h) + r2 / h).sum(axis=0)
+
+
+@dataclass
+class GARCHFit:
+    omega: np.ndarray
+    alpha: np.ndarray
+    beta: np.ndarray
+    nll: np.ndarray
+    last_variance: np.ndarray
+    last_return: np.ndarray
+
+    @property
+    def persistence(self) -> np.ndarray:
+        return self.alpha + self.beta
+
+    def forecast(self, horizon: int = 1) -> np.ndarray:
+        """Volatility forecast ``horizon`` steps ahead for every series."""
+        h = self.omega + self.alpha * self.last_return**2 + self.beta * self.last_variance
+        long_run = self.omega / np.maximum(1 - self.persistence, 1e-12)
+        h = long_run + self.persistence ** (horizon - 1) * (h - long_run)
+        return np.sqrt(h)
+
+
+class BatchGARCH:
+    """Fit variance-targeted GARCH(1,1) to many series with shared likelihood sweeps.
+
+    ``omega`` is pinned to ``var * (1 - alpha - beta)``, leaving ``(alpha,
+    persistence)`` per series. A coarse grid is scored for every series in one
+    ``(T, grid, N)`` likelihood pass, then a shrinking 3x3 pattern search
+    refines all series together. Passing ``init`` (a previous ``GARCHFit``)
+    skips the grid and starts the search from those parameters.
+    """
+
+    def __init__(self, grid: int = 8, refine_steps: int = 6, warm_steps: int = 3, initial_step: float = 0.05) -> None:
+        self.grid = grid
+        self.refine_steps = refine_steps
+        self.warm_steps = warm_steps
+        self.initial_step = initial_step
+
+    def fit(self, returns: pd.DataFrame | np.ndarray, init: GARCHFit | None = None) -> GARCHFit:
+        r = np.nan_to_num(_as_2d(returns))
+        r = r - r.mean(axis=0)
+        var = np.maximum(r.var(axis=0), 1e-18)
+
+        if init is None:
+            alphas = np.linspace(0.02, 0.25, self.grid)
+            persist = np.linspace(0.80, 0.995, self.grid)
+            a_grid, p_grid = (g.ravel() for g in np.meshgrid(alphas, persist))
+            a_grid, p_grid = a_grid[a_grid < p_grid], p_grid[a_grid < p_grid]
+            nll = self._score(r, var, a_grid[:, None], p_grid[:, None])
+            best = nll.argmin(axis=0)
+            alpha, persistence = a_grid[best], p_grid[best]
+            step, steps = self.initial_step, self.refine_steps
+        else:
+            alpha = np.array(init.alpha, dtype=float)
+            persistence = np.array(init.persistence, dtype=float)
+            step, steps = self.initial_step / 4, self.warm_steps
+
+        offsets = np.array([(da, dp) for da in (-1, 0, 1) for dp in (-1, 0, 1)], dtype=float)
+        columns = np.arange(r.shape[1])
+        for _ in range(steps):
+            cand_a = alpha[None, :] + step * offsets[:, :1]
+            cand_p = persistence[None, :] + step * offsets[:, 1:]
+            cand_p = np.clip(cand_p, 1e-4, MAX_PERSISTENCE)
+            cand_a = np.clip(cand_a, 1e-4, cand_p - 1e-4)
+            nll = self._score(r, var, cand_a, cand_p)
+            best = nll.argmin(axis=0)
+            alpha, persistence = cand_a[best, columns], cand_p[best, columns]
+            step /= 2
+
+        beta = persistence - alpha
+        omega = var * (1 - persistence)
+        h = garch_variance(r, omega, alpha, beta)
+        return GARCHFit(
+            omega=omega,
+            alpha=alpha,
+            beta=beta,
+            nll=garch_nll(r, omega, alpha, beta),
+            last_variance=h[-1],
+            last_return=r[-1],
+        )
+
+    @staticmethod
+    def _score(r: np.ndarray, var: np.ndarray, alpha: np.ndarray, persistence: np.ndarray) -> np.ndarray:
+        return garch_nll(r, var * (1 - persistence), alpha, persistence - alpha)
+
+
+def rolling_garch(
+    returns: pd.DataFrame | np.ndarray,
+    window: int = 250,
+    refit_every: int = 20,
+    model: BatchGARCH | None = None,
+) -> np.ndarray:
+    """One-step GARCH volatility forecasts with warm-started rolling refits.
+
+    Row ``t`` uses parameters fitted on the ``window`` bars before the latest
+    refit; between refits the variance recursion is rolled forward bar by bar.
+    Rows before the first full window are NaN.
+    """
+    r = np.nan_to_num(_as_2d(returns))
+    model = model or BatchGARCH()
+    out = np.full(r.shape, np.nan)
+    fit: GARCHFit | None = None
+    for t in range(window, r.shape[0]):
+        if fit is None or (t - window) % refit_every == 0:
+            fit = model.fit(r[t - window : t], init=fit)
+            mean = r[t - window : t].mean(axis=0)
+            h = fit.last_variance
+        h = fit.omega + fit.alpha * (r[t - 1] - mean) ** 2 + fit.beta * h
+        out[t] = np.sqrt(h)
+    return out
+
+
+def universe_returns(
+    prices: pd.DataFrame,
+    pairs: list[tuple[str, str]],
+    hedge_ratios: list[float],
+) -> pd.DataFrame:
+    """Symbol returns plus pair-spread returns (``ret_x - h * ret_y``) as one panel."""
+    rets = prices.pct_change().iloc[1:]
+    spreads = {f"{x}/{y}": rets[x] - h * rets[y] for (x, y), h in zip(pairs, hedge_ratios)}
+    return pd.concat([rets, pd.DataFrame(spreads, index=rets.index)], axis=1)
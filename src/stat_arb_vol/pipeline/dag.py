@@ -0,0 +1,174 @@
+"""Compile experiments into a deduplicated stage DAG and run it with hashed, cached stages."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from stat_arb_vol.pipeline.manifest import Experiment
+from stat_arb_vol.pipeline.stages import STAGES
+
+PIPELINE_VERSION = 1
+ALWAYS_RUN = frozenset({"report"})
+
+
+def _hash(*parts: Any) -> str:
+    body = json.dumps([PIPELINE_VERSION, *parts], sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(body.encode()).hexdigest()[:32]
+
+
+@dataclass
+class Stage:
+    node_id: str
+    kind: str
+    params: dict[str, Any]
+    deps: tuple[str, ...]
+    experiments: list[str] = field(default_factory=list)
+
+
+@dataclass
+class StageOutcome:
+    node_id: str
+    kind: str
+    key: str
+    digest: str
+    path: str
+    cached: bool
+    seconds: float
+
+
+def execute_stage(
+    kind: str,
+    params: dict[str, Any],
+    inputs: list[tuple[str, str]],
+    cache_dir: str,
+    force: bool = False,
+) -> tuple[str, str, str, bool, float]:
+    """Run (or reuse) one stage; ``inputs`` are upstream ``(content digest, path)`` pairs.
+
+    The cache key hashes the stage kind, its parameters and the *content*
+    digests of its inputs, so a stage reruns only when something it reads
+    changed. Outputs are pickled atomically next to a ``.sha256`` sidecar.
+    """
+    start = time.perf_counter()
+    key = _hash(kind, params, [digest for digest, _ in inputs])
+    path = Path(cache_dir) / f"{kind}-{key}.pkl"
+    sidecar = path.with_suffix(".sha256")
+    if not force and kind not in ALWAYS_RUN and path.exists() and sidecar.exists():
+        return key, sidecar.read_text(encoding="utf-8"), str(path), True, time.perf_counter() - start
+
+    upstream = []
+    for _, input_path in inputs:
+        with open(input_path, "rb") as handle:
+            upstream.append(pickle.load(handle))
+    payload = pickle.dumps(STAGES[kind](params, *upstream), protocol=pickle.HIGHEST_PROTOCOL)
+    digest = hashlib.sha256(payload).hexdigest()
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(payload)
+    os.replace(tmp, path)
+    sidecar.write_text(digest, encoding="utf-8")
+    return key, digest, str(path), False, time.perf_counter() - start
+
+
+class _InlineExecutor(Executor):
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as exc:
+            future.set_exception(exc)
+        return future
+
+
+class Pipeline:
+    """Experiment DAG: load -> align -> select -> spread -> backtest -> report.
+
+    Stages with identical recipes (kind, parameters, upstream recipe) are
+    merged across experiments, so e.g. a threshold sweep shares one data
+    load, alignment, pair selection and spread precompute. ``run`` schedules
+    every stage whose inputs are ready on a process pool (``workers > 1``),
+    so independent branches run in parallel, and reuses cached outputs under
+    ``cache_dir``. Report stages always rerun to rewrite their files.
+    """
+
+    def __init__(self, experiments: list[Experiment], cache_dir: str | Path = ".cache/pipeline", workers: int = 1):
+        self.cache_dir = Path(cache_dir)
+        self.workers = workers
+        self.stages: dict[str, Stage] = {}
+        self.terminals: dict[str, str] = {}
+        for experiment in experiments:
+            self.terminals[experiment.name] = self._compile(experiment)
+
+    def _add(self, kind: str, params: dict[str, Any], deps: tuple[str, ...], experiment: str) -> str:
+        node_id = _hash(kind, params, deps)
+        stage = self.stages.setdefault(node_id, Stage(node_id, kind, params, deps))
+        stage.experiments.append(experiment)
+        return node_id
+
+    def _compile(self, exp: Experiment) -> str:
+        config = asdict(exp.config)
+        data = {
+            "symbols": list(exp.symbols),
+            "start_date": exp.start_date,
+            "end_date": exp.end_date,
+            "mock_only": exp.mock_only,
+        }
+        load = self._add("load", data, (), exp.name)
+        align = self._add("align", {"max_gap": exp.max_gap}, (load,), exp.name)
+        select = self._add(
+            "select",
+            {
+                "significance": exp.significance,
+                "out_of_sample_months": exp.config.out_of_sample_months,
+                "pair": list(exp.pair) if exp.pair else None,
+            },
+            (align,),
+            exp.name,
+        )
+        spread = self._add(
+            "spread", {"lookback": exp.config.lookback, "candidate": exp.candidate}, (align, select), exp.name
+        )
+        backtest = self._add("backtest", {"config": config, "seed": exp.seed}, (spread,), exp.name)
+        return self._add("report", {"name": exp.name, "report_dir": exp.reports}, (backtest,), exp.name)
+
+    def run(self, refresh_data: bool = False) -> dict[str, StageOutcome]:
+        """Execute the DAG; ``refresh_data`` re-runs load stages (downstream reruns only if data changed)."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        done: dict[str, StageOutcome] = {}
+        waiting = dict(self.stages)
+        running: dict[Future, Stage] = {}
+        executor: Executor = ProcessPoolExecutor(self.workers) if self.workers > 1 else _InlineExecutor()
+        try:
+            while waiting or running:
+                for node_id, stage in list(waiting.items()):
+                    if all(dep in done for dep in stage.deps):
+                        inputs = [(done[dep].digest, done[dep].path) for dep in stage.deps]
+                        force = refresh_data and stage.kind == "load"
+                        future = executor.submit(
+                            execute_stage, stage.kind, stage.params, inputs, str(self.cache_dir), force
+                        )
+                        running[future] = stage
+                        del waiting[node_id]
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    stage = running.pop(future)
+                    key, digest, path, cached, seconds = future.result()
+                    done[stage.node_id] = StageOutcome(stage.node_id, stage.kind, key, digest, path, cached, seconds)
+        finally:
+            executor.shutdown(cancel_futures=True)
+        return done
+
+    def results(self, outcomes: dict[str, StageOutcome]) -> dict[str, Any]:
+        """Per-experiment output of the terminal (report) stage."""
+        out = {}
+        for name, node_id in self.terminals.items():
+            with open(outcomes[node_id].path, "rb") as handle:
+                out[name] = pickle.load(handle)
+        return out
@@ -0,0 +1,87 @@
+"""Declarative experiment manifests (TOML or YAML)."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field, fields, replace
+from pathlib import Path
+from typing import Any
+
+from stat_arb_vol.config import BacktestConfig, UniverseConfig
+
+try:
+    import tomllib
+except ImportError:  # pragma: no cover - Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover - optional dependency
+    yaml = None
+
+_UNIVERSE = UniverseConfig()
+
+
+@dataclass(frozen=True)
+class Experiment:
+    """One backtest recipe: data, alignment, pair selection, backtest config and report."""
+
+    name: str
+    symbols: tuple[str, ...] = _UNIVERSE.symbols
+    start_date: str = _UNIVERSE.start_date
+    end_date: str = _UNIVERSE.end_date
+    mock_only: bool = False
+    max_gap: int | None = 3
+    significance: float = 0.20
+    candidate: int = 0
+    pair: tuple[str, str] | None = None
+    config: BacktestConfig = field(default_factory=BacktestConfig)
+    seed: int = 0
+    report_dir: str | None = None
+
+    @property
+    def reports(self) -> str:
+        return self.report_dir or f"reports/{self.name}"
+
+
+def _experiment(entry: dict[str, Any], defaults: dict[str, Any]) -> Experiment:
+    merged = {**defaults, **entry}
+    merged["config"] = {**defaults.get("config", {}), **entry.get("config", {})}
+    unknown = set(merged) - {f.name for f in fields(Experiment)}
+    if unknown:
+        raise ValueError(f"unknown experiment fields {sorted(unknown)} in {merged.get('name')!r}")
+    if "name" not in merged:
+        raise ValueError("every experiment needs a name")
+    if "symbols" in merged:
+        merged["symbols"] = tuple(merged["symbols"])
+    if merged.get("pair") is not None:
+        merged["pair"] = tuple(merged["pair"])
+    if merged.get("max_gap") is False or (merged.get("max_gap") or 0) < 0:
+        merged["max_gap"] = None  # TOML has no null: ``max_gap = false`` (or -1) fills without limit
+    merged["config"] = replace(BacktestConfig(), **merged["config"])
+    return Experiment(**merged)
+
+
+def parse_manifest(data: dict[str, Any]) -> list[Experiment]:
+    """``{"defaults": {...}, "experiments": [{...}, ...]}`` -> experiments (defaults merged in)."""
+    defaults = data.get("defaults", {})
+    experiments = [_experiment(entry, defaults) for entry in data.get("experiments", [])]
+    names = [experiment.name for experiment in experiments]
+    if len(set(names)) != len(names):
+        raise ValueError("experiment names must be unique")
+    return experiments
+
+
+def load_manifest(path: str | Path) -> list[Experiment]:
+    path = Path(path)
+    if path.suffix in (".yaml", ".yml"):
+        if yaml is None:
+            raise ImportError("YAML manifests require PyYAML (pip install pyyaml)")
+        data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    else:
+        if tomllib is None:
+            raise ImportError("TOML manifests require Python 3.11+ or tomli (pip install tomli)")
+        data = tomllib.loads(path.read_text(encoding="utf-8"))
+    return parse_manifest(data or {})
@@ -0,0 +1,99 @@
+"""Stage functions of the experiment DAG: ``fn(params, *inputs) -> output``."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import statsmodels.api as sm
+
+from stat_arb_vol.analytics.metrics import compute_metrics
+from stat_arb_vol.analytics.report import create_performance_plot, write_markdown_report
+from stat_arb_vol.backtest.engine import EventDrivenBacktester
+from stat_arb_vol.config import BacktestConfig
+from stat_arb_vol.data.align import AlignedPanel, align_prices
+from stat_arb_vol.data.loader import DataLoader
+from stat_arb_vol.models.cointegration import CointegrationSelector
+from stat_arb_vol.models.spread_cache import SpreadCache
+
+
+def load_stage(params: dict[str, Any]) -> dict[str, pd.Series]:
+    loader = DataLoader(tuple(params["symbols"]), params["start_date"], params["end_date"])
+    series = {} if params["mock_only"] else loader._download_series()
+    if not series:
+        frame = loader._simulate_prices()
+        series = {symbol: frame[symbol] for symbol in frame.columns}
+    return series
+
+
+def align_stage(params: dict[str, Any], series: dict[str, pd.Series]) -> AlignedPanel:
+    return align_prices(series, freq="D", max_gap=params["max_gap"])
+
+
+def select_stage(params: dict[str, Any], panel: AlignedPanel) -> dict[str, Any]:
+    prices = panel.frame()
+    cutoff = prices.index.max() - pd.DateOffset(months=params["out_of_sample_months"])
+    if params["pair"] is not None:
+        pairs, candidates = [tuple(params["pair"])], []
+    else:
+        train = prices.loc[prices.index < cutoff]
+        candidates = CointegrationSelector(significance=params["significance"]).select_pairs(train)
+        pairs = [(candidate.asset_x, candidate.asset_y) for candidate in candidates]
+    return {
+        "pairs": pairs,
+        "test_start": prices.index[prices.index >= cutoff].min(),
+        "candidates": [asdict(candidate) for candidate in candidates],
+    }
+
+
+def spread_stage(params: dict[str, Any], panel: AlignedPanel, selection: dict[str, Any]) -> dict[str, Any]:
+    """Test-window prices, OLS hedge ratio (as ``EventDrivenBacktester`` estimates it), spread and z-score."""
+    pairs = selection["pairs"]
+    if len(pairs) <= params["candidate"]:
+        raise RuntimeError(f"only {len(pairs)} cointegrated pairs; cannot pick #{params['candidate']}")
+    pair = pairs[params["candidate"]]
+    prices = panel.window(pair, start=selection["test_start"])
+    x, y = pair
+    aligned = prices[[x, y]].dropna()
+    hedge_ratio = float(sm.OLS(aligned[x], sm.add_constant(aligned[y])).fit().params.iloc[1])
+    spread, z = SpreadCache(max_entries=1).get(prices, pair, hedge_ratio, params["lookback"])
+    return {"pair": pair, "prices": prices, "hedge_ratio": hedge_ratio, "spread": spread, "z": z}
+
+
+def backtest_stage(params: dict[str, Any], spread: dict[str, Any]) -> dict[str, Any]:
+    config = BacktestConfig(**params["config"])
+    prices, pair, hedge_ratio = spread["prices"], spread["pair"], spread["hedge_ratio"]
+    cache = SpreadCache(max_entries=1)
+    cache.put(prices, pair, hedge_ratio, config.lookback, spread["spread"], spread["z"])
+    engine = EventDrivenBacktester(prices, pair, config, spread_cache=cache, hedge_ratio=hedge_ratio, seed=params["seed"])
+    result = engine.run()
+    metrics = compute_metrics(result.equity_curve, result.trade_returns, annualization=config.annualization)
+    return {"result": result, "metrics": metrics}
+
+
+def report_stage(params: dict[str, Any], backtest: dict[str, Any]) -> dict[str, Any]:
+    result, metrics = backtest["result"], backtest["metrics"]
+    out = Path(params["report_dir"])
+    create_performance_plot(result.equity_curve, str(out / "equity_curve.png"))
+    write_markdown_report(metrics, result.pair, str(out / "performance_report.md"))
+    summary = {
+        "experiment": params["name"],
+        "selected_pair": list(result.pair),
+        "hedge_ratio": result.hedge_ratio,
+        "metrics": metrics,
+    }
+    (out / "summary.json").write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    return summary
+
+
+STAGES = {
+    "load": load_stage,
+    "align": align_stage,
+    "select": select_stage,
+    "spread": spread_stage,
+    "backtest": backtest_stage,
+    "report": report_stage,
+}
@@ -34,3 +34,148 @@ class KellySizer:
             return 0.0
         scale = 1 - (current_drawdown / max_drawdown)
         return raw_fraction * max(scale, 0.1)
+
+    @staticmethod
+    def apply_vol_target(raw_fraction, forecast_vol, target_vol: float, max_scale: float = 2.0):
+        """Scale fractions by ``target_vol / forecast_vol`` (capped); works on arrays of pairs."""
+        scale = np.clip(target_vol / np.maximum(forecast_vol, 1e-12), 0.0, max_scale)
+        return raw_fraction * scale
+
+
+class KellyStatistics:
+    """Running Kelly inputs for one or many sizers, updated in O(1) per trade.
+
+    Keeps win/loss counts and return sums per book. ``decay`` applies an
+    exponential weight per closed trade; ``window`` keeps only the last N
+    trades in a ring buffer, and ``min_trades`` then counts trades in the
+    window. ``update`` touches only its own book; ``update_many`` and
+    ``fractions`` operate on all books at once.
+    """
+
+    def __init__(
+        self,
+        n_books: int = 1,
+        max_fraction: float = 0.25,
+        min_fraction: float = 0.01,
+        min_trades: int = 10,
+        decay: float | None = None,
+        window: int | None = None,
+    ) -> None:
+        if decay is not None and window is not None:
+            raise ValueError("decay and window are mutually exclusive")
+        if decay is not None and not 0 < decay <= 1:
+            raise ValueError("decay must be in (0, 1]")
+        if window is not None and window < 1:
+            raise ValueError("window must be positive")
+        self.n_books = n_books
+        self.max_fraction = max_fraction
+        self.min_fraction = min_fraction
+        self.min_trades = min_trades
+        self.decay = decay
+        self.window = window
+
+        self.trades = np.zeros(n_books, dtype=np.int64)
+        self.count = np.zeros(n_books)
+        self.wins = np.zeros(n_books)
+        self.sum_wins = np.zeros(n_books)
+        self.sum_losses = np.zeros(n_books)
+        if window is not None:
+            self._buffer = np.zeros((n_books, window))
+            self._cursor = np.zeros(n_books, dtype=np.int64)
+
+    def update(self, trade_return: float, book: int = 0) -> None:
+        """Add one closed trade to ``book``; scalar updates, O(1) in the number of books."""
+        r = float(trade_return)
+        if self.decay is not None:
+            d = self.decay
+            self.count[book] *= d
+            self.wins[book] *= d
+            self.sum_wins[book] *= d
+            self.sum_losses[book] *= d
+        elif self.window is not None:
+            cursor = self._cursor[book]
+            if self.trades[book] >= self.window:
+                old = self._buffer[book, cursor]
+                self.count[book] -= 1
+                if old > 0:
+                    self.wins[book] -= 1
+                    self.sum_wins[book] -= old
+                else:
+                    self.sum_losses[book] -= abs(old)
+            self._buffer[book, cursor] = r
+            self._cursor[book] = (cursor + 1) % self.window
+
+        self.trades[book] += 1
+        self.count[book] += 1
+        if r > 0:
+            self.wins[book] += 1
+            self.sum_wins[book] += r
+        else:
+            self.sum_losses[book] += abs(r)
+
+    def update_many(self, returns: np.ndarray) -> None:
+        """Add one closed trade per book; NaN entries leave that book unchanged."""
+        returns = np.asarray(returns, dtype=np.float64)
+        books = np.flatnonzero(~np.isnan(returns))
+        if books.size:
+            self._apply(books, returns[books])
+
+    def _apply(self, books: np.ndarray, r: np.ndarray) -> None:
+        win = (r > 0).astype(np.float64)
+        gain = np.where(r > 0, r, 0.0)
+        loss = np.where(r > 0, 0.0, np.abs(r))
+
+        if self.decay is not None:
+            self.count[books] *= self.decay
+            self.wins[books] *= self.decay
+            self.sum_wins[books] *= self.decay
+            self.sum_losses[books] *= self.decay
+        elif self.window is not None:
+            full = self.trades[books] >= self.window
+            cursor = self._cursor[books]
+            old = self._buffer[books, cursor]
+            drop = books[full]
+            old = old[full]
+            self.count[drop] -= 1
+            self.wins[drop] -= old > 0
+            self.sum_wins[drop] -= np.where(old > 0, old, 0.0)
+            self.sum_losses[drop] -= np.where(old > 0, 0.0, np.abs(old))
+            self._buffer[books, cursor] = r
+            self._cursor[books] = (cursor + 1) % self.window
+
+        self.trades[books] += 1
+        self.count[books] += 1
+        self.wins[books] += win
+        self.sum_wins[books] += gain
+        self.sum_losses[books] += loss
+
+    def get_state(self) -> dict[str, np.ndarray]:
+        """Copies of the running sums (and trade ring buffer), e.g. for checkpoints."""
+        names = ("trades", "count", "wins", "sum_wins", "sum_losses")
+        state = {name: getattr(self, name).copy() for name in names}
+        if self.window is not None:
+            state["buffer"] = self._buffer.copy()
+            state["cursor"] = self._cursor.copy()
+        return state
+
+    def set_state(self, state: dict[str, np.ndarray]) -> None:
+        for name in ("trades", "count", "wins", "sum_wins", "sum_losses"):
+            getattr(self, name)[:] = state[name]
+        if self.window is not None:
+            self._buffer[:] = state["buffer"]
+            self._cursor[:] = state["cursor"]
+
+    def fractions(self, books: np.ndarray | slice = slice(None)) -> np.ndarray:
+        trades, count, wins = self.trades[books], self.count[books], self.wins[books]
+        if self.window is not None:
+            trades = np.minimum(trades, self.window)
+        losses = count - wins
+        valid = (trades >= self.min_trades) & (wins > 1e-12) & (losses > 1e-12)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            p = wins / count
+            b = (self.sum_wins[books] / wins) / np.maximum(self.sum_losses[books] / losses, 1e-8)
+            f = p - (1 - p) / b
+        return np.where(valid, np.clip(f, self.min_fraction, self.max_fraction), self.min_fraction)
+
+    def fraction(self, book: int = 0) -> float:
+        return float(self.fractions(slice(book, book + 1))[0])
@@ -2,34 +2,52 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 from stat_arb_vol.backtest.events import SignalEvent
 from stat_arb_vol.config import BacktestConfig
 from stat_arb_vol.models.ou import OUModel
+from stat_arb_vol.models.spread_cache import SpreadCache
+from stat_arb_vol.precision import to_storage
+from stat_arb_vol.strategy.vectorized import hysteresis_positions
 
 
 class PairsOUStrategy:
+    """Z-score hysteresis on ``x - hedge_ratio * y``, or on ``prices[pair] @ weights`` for baskets."""
+
     def __init__(
         self,
         prices: pd.DataFrame,
-        pair: tuple[str, str],
+        pair: tuple[str, ...],
         hedge_ratio: float,
         config: BacktestConfig,
+        spread_cache: SpreadCache | None = None,
+        weights: tuple[float, ...] | None = None,
     ) -> None:
         self.prices = prices
         self.pair = pair
         self.hedge_ratio = hedge_ratio
+        self.weights = weights
         self.config = config
         self.ou = OUModel()
         self.position = 0
 
-        x, y = pair
-        self.spread = self.prices[x] - hedge_ratio * self.prices[y]
-        self.z = self.ou.rolling_zscore(self.spread, lookback=self.config.lookback)
+        if spread_cache is not None:
+            self.spread, self.z = spread_cache.get(prices, pair, hedge_ratio, self.config.lookback, weights=weights)
+        else:
+            if weights is None:
+                x, y = pair
+                self.spread = self.prices[x] - hedge_ratio * self.prices[y]
+            else:
+                self.spread = to_storage(self.prices[list(pair)] @ np.asarray(weights, dtype=float))
+            self.z = self.ou.rolling_zscore(self.spread, lookback=self.config.lookback)
 
     def on_bar(self, timestamp: pd.Timestamp) -> SignalEvent | None:
-        z = float(self.z.loc[timestamp])
+        return self.on_z(timestamp, float(self.z.loc[timestamp]))
+
+    def on_z(self, timestamp: pd.Timestamp, z: float) -> SignalEvent | None:
+        """Advance the state machine with an externally computed z-score."""
         side = None
 
         if self.position == 0:
@@ -51,3 +69,10 @@ class PairsOUStrategy:
         if side is None:
             return None
         return SignalEvent(timestamp=timestamp, pair=self.pair, side=side, strength=abs(z))
+
+    def position_path(self) -> pd.Series:
+        """Positions ``on_bar`` would hold after each bar of ``self.z``, computed in one pass."""
+        path = hysteresis_positions(
+            self.z.to_numpy(dtype=float), self.config.entry_z, self.config.exit_z, self.config.stop_z, self.position
+        )
+        return pd.Series(path, index=self.z.index)
@@ -0,0 +1,54 @@
+"""Whole-array evaluation of the entry/exit/stop hysteresis state machine."""
+
+from __future__ import annotations
+
+import numpy as np
+
+_STATES = np.array([-1, 0, 1], dtype=np.int8)
+
+
+def transition_table(z: np.ndarray, entry_z: float, exit_z: float, stop_z: float) -> np.ndarray:
+    """Next-state index for each bar and each current state.
+
+    Output has shape ``z.shape + (3,)``; the last axis is indexed by the
+    current state (-1, 0, +1 mapped to 0, 1, 2) and holds the next state's
+    index, mirroring ``PairsOUStrategy.on_bar`` exactly (NaN z never trades).
+    """
+    z = np.asarray(z, dtype=np.float64)
+    table = np.empty(z.shape + (3,), dtype=np.int8)
+    table[..., 0] = np.where((z <= exit_z) | (z > stop_z), 1, 0)
+    table[..., 1] = np.where(z > entry_z, 0, np.where(z < -entry_z, 2, 1))
+    table[..., 2] = np.where((z >= -exit_z) | (z < -stop_z), 1, 2)
+    return table
+
+
+def hysteresis_positions(
+    z: np.ndarray,
+    entry_z: float,
+    exit_z: float,
+    stop_z: float,
+    initial: int = 0,
+) -> np.ndarray:
+    """Position path of the hysteresis rule for a 1-D or ``(bars, pairs)`` z array.
+
+    Entry and exit masks overlap (a stop bar is also an entry bar), so a plain
+    forward-fill of masks cannot reproduce the loop. Instead each bar is
+    encoded as a transition map over the three states and the maps are
+    composed with a log-step prefix scan (``ceil(log2(bars))`` vectorized
+    gathers), which is exact for any thresholds.
+    """
+    prefix = transition_table(z, entry_z, exit_z, stop_z)
+    n = prefix.shape[0]
+    step = 1
+    while step < n:
+        prefix[step:] = np.take_along_axis(prefix[step:], prefix[:-step].astype(np.intp), axis=-1)
+        step *= 2
+    return _STATES[prefix[..., int(initial) + 1]]
+
+
+def signal_mask(positions: np.ndarray, initial: int = 0) -> np.ndarray:
+    """Bars on which the state machine emits a ``SignalEvent``."""
+    previous = np.empty_like(positions)
+    previous[0] = initial
+    previous[1:] = positions[:-1]
+    return positions != previous
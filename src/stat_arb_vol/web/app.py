@@ -3,10 +3,16 @@
 from __future__ import annotations
 
 import json
+import re
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+from stat_arb_vol.analytics.runs import RunStore
 
 ROOT = Path("reports").resolve()
+RUNS_DB = Path(".cache/runs.db")
+RUNS_PAGE_LIMIT = 200
 
 
 class DashboardHandler(BaseHTTPRequestHandler):
@@ -19,9 +25,71 @@ class DashboardHandler(BaseHTTPRequestHandler):
             self._serve_binary(ROOT / "performance_report.md", "text/markdown; charset=utf-8")
         elif self.path == "/summary.json":
             self._serve_binary(ROOT / "summary.json", "application/json; charset=utf-8")
+        elif urlsplit(self.path).path == "/runs":
+            self._serve_runs(parse_qs(urlsplit(self.path).query))
+        elif match := re.fullmatch(r"/runs/(\d+)/curve\.json", self.path):
+            self._serve_curve(int(match.group(1)))
         else:
             self.send_error(404, "Not found")
 
+    def _serve_runs(self, params: dict[str, list[str]]) -> None:
+        if not RUNS_DB.exists():
+            self._serve_json({"total": 0, "page": 1, "per_page": 0, "runs": []})
+            return
+        try:
+            page = max(int(params.get("page", ["1"])[0]), 1)
+            per_page = min(max(int(params.get("per_page", ["25"])[0]), 1), RUNS_PAGE_LIMIT)
+            filters = {"pair": params["pair"][0]} if "pair" in params else {}
+            if "min_sharpe" in params:
+                filters["sharpe"] = (">=", float(params["min_sharpe"][0]))
+            order = params.get("order", ["run_id"])[0]
+            descending = params.get("dir", ["desc"])[0] != "asc"
+            store = RunStore(RUNS_DB)
+            try:
+                total = store.count(filters)
+                runs = store.query(filters, order, descending, limit=per_page, offset=(page - 1) * per_page)
+            finally:
+                store.close()
+        except ValueError as exc:
+            self.send_error(400, str(exc))
+            return
+        payload = {
+            "total": total,
+            "page": page,
+            "per_page": per_page,
+            "runs": json.loads(runs.to_json(orient="records", date_format="iso")),
+        }
+        self._serve_json(payload)
+
+    def _serve_curve(self, run_id: int) -> None:
+        if not RUNS_DB.exists():
+            self.send_error(404, "No run store")
+            return
+        store = RunStore(RUNS_DB)
+        try:
+            curve = store.curve(run_id)
+        except KeyError:
+            self.send_error(404, f"Unknown run {run_id}")
+            return
+        finally:
+            store.close()
+        self._serve_json(
+            {
+                "run_id": run_id,
+                "timestamps": [ts.isoformat() for ts in curve.index],
+                "equity": curve["equity"].tolist(),
+                "position": curve["position"].tolist(),
+            }
+        )
+
+    def _serve_json(self, payload: dict) -> None:
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
     def _serve_index(self) -> None:
         html = """
 <!DOCTYPE html>
@@ -585,6 +653,7 @@ class DashboardHandler(BaseHTTPRequestHandler):
       <div class=\"tabs\">
         <button class=\"tab active\" onclick=\"switchTab('artifacts')\">Artifacts</button>
         <button class=\"tab\" onclick=\"switchTab('summary')\">Raw Data</button>
+        <button class=\"tab\" onclick=\"switchTab('runs')\">Run History</button>
       </div>
 
       <div id=\"tab-artifacts\" class=\"tab-content active\">
@@ -605,6 +674,17 @@ class DashboardHandler(BaseHTTPRequestHandler):
           <pre id=\"summary-dump\">Loading data...</pre>
         </div>
       </div>
+
+      <div id=\"tab-runs\" class=\"tab-content\">
+        <div class=\"chart-controls\" style=\"margin-bottom: 1rem;\">
+          <button class=\"control-btn\" onclick=\"loadRuns(runsPage - 1)\">Previous</button>
+          <span id=\"runs-status\" class=\"subtitle\">Loading runs...</span>
+          <button class=\"control-btn\" onclick=\"loadRuns(runsPage + 1)\">Next</button>
+        </div>
+        <div class=\"code-block\">
+          <table id=\"runs-table\" style=\"width: 100%; border-collapse: collapse;\"></table>
+        </div>
+      </div>
     </section>
   </div>
 
@@ -700,6 +780,59 @@ class DashboardHandler(BaseHTTPRequestHandler):
       return insights;
     }
 
+    let runsPage = 1;
+    const RUNS_PER_PAGE = 25;
+
+    function loadRuns(page) {
+      if (page < 1) return;
+      fetch(`/runs?page=${page}&per_page=${RUNS_PER_PAGE}&order=run_id`)
+        .then((r) => r.ok ? r.json() : Promise.reject(new Error('runs not available')))
+        .then((data) => {
+          const pages = Math.max(Math.ceil(data.total / RUNS_PER_PAGE), 1);
+          if (page > pages) return;
+          runsPage = page;
+          document.getElementById('runs-status').textContent = `Page ${page} of ${pages} (${data.total} runs)`;
+          const table = document.getElementById('runs-table');
+          const header = document.createElement('tr');
+          ['Run', 'Pair', 'Entry / Exit z', 'Sharpe', 'Max DD', 'CAGR', 'Trades', 'Curve'].forEach((label) => {
+            const th = document.createElement('th');
+            th.textContent = label;
+            header.appendChild(th);
+          });
+          const rows = data.runs.map((run) => {
+            const tr = document.createElement('tr');
+            [
+              run.run_id,
+              run.pair,
+              `${run.cfg_entry_z} / ${run.cfg_exit_z}`,
+              formatMetric('Sharpe', run.sharpe),
+              formatMetric('drawdown', run.max_drawdown),
+              formatMetric('cagr', run.cagr),
+              run.trades,
+            ].forEach((value) => {
+              const td = document.createElement('td');
+              td.textContent = value;
+              tr.appendChild(td);
+            });
+            const link = document.createElement('a');
+            link.className = 'artifact-link';
+            link.href = `/runs/${encodeURIComponent(run.run_id)}/curve.json`;
+            link.target = '_blank';
+            link.textContent = 'JSON';
+            const td = document.createElement('td');
+            td.appendChild(link);
+            tr.appendChild(td);
+            return tr;
+          });
+          table.replaceChildren(header, ...rows);
+        })
+        .catch((error) => {
+          document.getElementById('runs-status').textContent = `Error loading runs: ${error.message}`;
+        });
+    }
+
+    loadRuns(1);
+
     fetch('/summary.json')
       .then((r) => r.ok ? r.json() : Promise.reject(new Error('summary not found')))
       .then((summary) => {